@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Simulación de Peluquería VIP
+Barrido de parámetros: simula una grilla de configuraciones con números aleatorios comunes
+
+Uso:
+    python barrido.py --param prob_aprendiz=0.1:0.3:0.05 --param tiempo_llegada_max=10,12 \\
+        --dias 500 --semilla 1 --procesos 4 --csv barrido.csv
+    python barrido.py --param tiempo_llegada_max=8:14:2 --tiempo-refrigerio 45 --dias 200 --semilla 1
+"""
+
+import argparse
+import csv
+import itertools
+import math
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from cache_resultados import CacheResultados, clave_simulacion
+from cli_peluqueria import parametros_modelo
+from estadisticas import AcumuladorDias
+from simulacion import NivelTraza, SimulacionPeluqueria, contexto_procesos
+
+# Columnas de resultados de la tabla del barrido (después de los parámetros barridos)
+COLUMNAS_RESULTADO = ('recaudacion_promedio', 'ic_recaudacion_inferior', 'ic_recaudacion_superior',
+                      'ganancia_promedio', 'prob_5_o_mas_refrigerios', 'refrigerios_promedio',
+                      'max_sillas_necesarias', 'sillas_promedio', 'desde_cache')
+
+
+def expandir_grilla(grilla: Dict[str, Sequence]) -> List[Dict]:
+    """Producto cartesiano de la grilla: una configuración (dict) por punto"""
+    nombres = list(grilla)
+    return [dict(zip(nombres, valores)) for valores in itertools.product(*(grilla[n] for n in nombres))]
+
+
+def _simular_bloque(params_modelo: Dict, primer_dia: int, fin_dias: int, semilla: int, tiempo_max,
+                    max_iteraciones) -> List[Dict]:
+    """Simula los días [primer_dia, fin_dias) de un punto (se ejecuta en los procesos del pool)
+
+    Cada día se siembra como en simular_multiples_dias con la misma semilla maestra.
+    """
+    sim = SimulacionPeluqueria(**params_modelo, nivel_traza=NivelTraza.NINGUNO)
+    return [sim.repetir_dia(dia, semilla, tiempo_max, max_iteraciones) for dia in range(primer_dia, fin_dias)]
+
+
+def _resultado_punto(params_modelo: Dict, tiempo_max, dias_por_bloque) -> Dict:
+    """Agrega los días de un punto, en orden, como simular_multiples_dias sin días guardados"""
+    sim = SimulacionPeluqueria(**params_modelo)
+    media_llegadas = None
+    if tiempo_max is None or tiempo_max >= sim.JORNADA_LABORAL:
+        media_llegadas = sim.llegadas_esperadas()
+    acumulador = AcumuladorDias(False, media_llegadas=media_llegadas)
+    for dias in dias_por_bloque:
+        for stats in dias:
+            acumulador.agregar(stats)
+    resultado = acumulador.resultado()
+    del resultado['resultados_diarios']
+    return resultado
+
+
+def barrer(grilla: Dict[str, Sequence], num_dias: int = 100, semilla: Optional[int] = None,
+           tiempo_max=None, max_iteraciones=100000, num_procesos: Optional[int] = 1,
+           cache: Optional[CacheResultados] = None, **params_fijos) -> List[Dict]:
+    """Simula num_dias días en cada punto de la grilla y devuelve una fila por punto
+
+    Todos los puntos usan la misma semilla maestra: el día d de cada configuración
+    usa las mismas uniformes de llegadas, asignación y servicio (números aleatorios
+    comunes), así las diferencias entre puntos reflejan los parámetros y no el azar.
+    Los días de cada punto se dividen en bloques que se reparten entre num_procesos
+    procesos (None = todos los núcleos), así un barrido de pocos puntos también se
+    acelera; el resultado de cada punto es el de simular_multiples_dias con la
+    semilla maestra, con cualquier cantidad de procesos.
+
+    Args:
+        grilla: Valores de cada parámetro de SimulacionPeluqueria a barrer
+        num_dias: Días por punto
+        semilla: Semilla maestra común (None = una al azar para todo el barrido)
+        cache: Si se indica, los puntos ya simulados con los mismos parámetros,
+            días, semilla y versión del motor se toman de ella. Solo se usa con
+            semilla: con una al azar ninguna entrada se volvería a pedir
+        **params_fijos: Parámetros de SimulacionPeluqueria comunes a todos los puntos
+
+    Returns:
+        Lista de filas (dict) con los parámetros barridos, 'semilla' y COLUMNAS_RESULTADO
+    """
+    if semilla is None:
+        semilla = random.getrandbits(64)
+        cache = None
+    puntos = expandir_grilla(grilla)
+
+    resultados = [None] * len(puntos)
+    desde_cache = [False] * len(puntos)
+    pendientes = []
+    for i, punto in enumerate(puntos):
+        # params_modelo completo (con los valores por defecto), así la clave no depende
+        # de si un parámetro se pasó explícitamente con su valor por defecto
+        params_modelo = SimulacionPeluqueria(**params_fijos, **punto).params_modelo
+        clave = clave_simulacion(params_modelo, num_dias, semilla, tiempo_max, max_iteraciones,
+                                 guardar_diarios=False)
+        resultados[i] = cache.obtener(clave) if cache is not None else None
+        if resultados[i] is not None:
+            desde_cache[i] = True
+        else:
+            pendientes.append((i, clave, params_modelo))
+
+    num_procesos = num_procesos or os.cpu_count() or 1
+    # Bloques de días de cada punto pendiente: unos 4 por proceso en total
+    tamano_bloque = max(1, math.ceil(num_dias * len(pendientes) / (num_procesos * 4)))
+    bloques = [(params_modelo, inicio, min(inicio + tamano_bloque, num_dias + 1), semilla, tiempo_max,
+                max_iteraciones)
+               for _, _, params_modelo in pendientes for inicio in range(1, num_dias + 1, tamano_bloque)]
+    if num_procesos == 1 or len(bloques) <= 1:
+        dias_por_bloque = [_simular_bloque(*bloque) for bloque in bloques]
+    else:
+        with ProcessPoolExecutor(max_workers=min(num_procesos, len(bloques)),
+                                 mp_context=contexto_procesos()) as pool:
+            dias_por_bloque = list(pool.map(_simular_bloque, *zip(*bloques)))
+
+    bloques_por_punto = len(range(1, num_dias + 1, tamano_bloque))
+    for j, (i, clave, params_modelo) in enumerate(pendientes):
+        resultados[i] = _resultado_punto(
+            params_modelo, tiempo_max, dias_por_bloque[j * bloques_por_punto:(j + 1) * bloques_por_punto])
+        if cache is not None:
+            cache.guardar(clave, resultados[i])
+
+    filas = []
+    for punto, resultado, cacheado in zip(puntos, resultados, desde_cache):
+        inferior, superior = resultado['ic_recaudacion_promedio']
+        fila = dict(punto)
+        fila['semilla'] = semilla
+        fila.update({
+            'recaudacion_promedio': resultado['recaudacion_promedio'],
+            'ic_recaudacion_inferior': inferior,
+            'ic_recaudacion_superior': superior,
+            'ganancia_promedio': resultado['ganancia_promedio'],
+            'prob_5_o_mas_refrigerios': resultado['prob_5_o_mas_refrigerios'],
+            'refrigerios_promedio': resultado['refrigerios_promedio'],
+            'max_sillas_necesarias': resultado['max_sillas_necesarias'],
+            'sillas_promedio': resultado['sillas_promedio'],
+            'desde_cache': cacheado,
+        })
+        filas.append(fila)
+    return filas
+
+
+def _numero(texto: str):
+    """int si el texto es entero, si no float"""
+    try:
+        return int(texto)
+    except ValueError:
+        return float(texto)
+
+
+def parsear_rango(texto: str) -> List:
+    """Valores de un parámetro: lista 'a,b,c' o rango inclusivo 'inicio:fin:paso'"""
+    if ':' not in texto:
+        return [_numero(valor) for valor in texto.split(',')]
+    inicio, fin, paso = (_numero(valor) for valor in texto.split(':'))
+    if paso <= 0:
+        raise ValueError(f"El paso del rango debe ser positivo: {texto}")
+    valores = []
+    i = 0
+    # Por índice y con tolerancia, para que 0.1:0.3:0.1 incluya 0.3 pese al redondeo
+    while inicio + i * paso <= fin + abs(paso) * 1e-9:
+        valor = inicio + i * paso
+        valores.append(round(valor, 10) if isinstance(valor, float) else valor)
+        i += 1
+    return valores
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Barrido de parámetros de la simulación")
+    parser.add_argument('--param', action='append', default=[], metavar='NOMBRE=VALORES',
+                        help="Parámetro a barrer: 'a,b,c' o 'inicio:fin:paso' (se puede repetir)")
+    parser.add_argument('--dias', type=int, default=100, help="Días por punto (default: 100)")
+    parser.add_argument('--semilla', type=int, default=None, help="Semilla maestra común (default: al azar)")
+    parser.add_argument('--procesos', type=int, default=1, help="Procesos (0 = todos los núcleos, default: 1)")
+    parser.add_argument('--tiempo-max', type=float, default=None,
+                        help="Tiempo máximo de simulación por día en minutos (default: 2 jornadas)")
+    parser.add_argument('--max-iteraciones', type=int, default=100000,
+                        help="Máximo de eventos por día (default: 100000)")
+    parser.add_argument('--cache', default=None, metavar='DIRECTORIO',
+                        help="Directorio de cache de resultados (requiere --semilla; default: sin cache)")
+    parser.add_argument('--csv', default=None, metavar='ARCHIVO', help="Guardar la tabla en un CSV")
+
+    modelo = parser.add_argument_group("parámetros fijos (de SimulacionPeluqueria, comunes a todos los puntos)")
+    nombres_modelo = [nombre for nombre, _ in parametros_modelo()]
+    for nombre, defecto in parametros_modelo():
+        modelo.add_argument('--' + nombre.replace('_', '-'), dest=nombre, type=_numero, default=None,
+                            metavar='VALOR', help=f"(default: {defecto})")
+    args = parser.parse_args(argv)
+
+    grilla = {}
+    for param in args.param:
+        nombre, _, valores = param.partition('=')
+        if not valores:
+            parser.error(f"Formato inválido (se espera NOMBRE=VALORES): {param}")
+        if nombre not in nombres_modelo:
+            parser.error(f"Parámetro desconocido: {nombre} (válidos: {', '.join(nombres_modelo)})")
+        try:
+            grilla[nombre] = parsear_rango(valores)
+        except ValueError as e:
+            parser.error(f"Valores inválidos para {nombre}: {e}")
+    if not grilla:
+        parser.error("Indicar al menos un --param")
+    params_fijos = {nombre: getattr(args, nombre) for nombre in nombres_modelo if getattr(args, nombre) is not None}
+    for nombre in params_fijos.keys() & grilla.keys():
+        parser.error(f"{nombre} se barre con --param y no puede ser también fijo")
+    if args.cache and args.semilla is None:
+        parser.error("--cache requiere --semilla (con una semilla al azar los resultados no se reutilizan)")
+
+    cache = CacheResultados(args.cache) if args.cache else None
+    filas = barrer(grilla, args.dias, args.semilla, args.tiempo_max, args.max_iteraciones,
+                   num_procesos=args.procesos or None, cache=cache, **params_fijos)
+
+    columnas = list(grilla) + ['semilla'] + list(COLUMNAS_RESULTADO)
+    if args.csv:
+        with open(args.csv, 'w', newline='', encoding='utf-8') as archivo:
+            escritor = csv.DictWriter(archivo, fieldnames=columnas)
+            escritor.writeheader()
+            escritor.writerows(filas)
+        print(f"✅ {len(filas)} puntos guardados en {args.csv}")
+    else:
+        escritor = csv.DictWriter(sys.stdout, fieldnames=columnas, delimiter='\t')
+        escritor.writeheader()
+        escritor.writerows(filas)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
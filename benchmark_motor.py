@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+"""
+Benchmark del motor de simulación
+Mide el throughput (eventos/segundo y días/segundo) de simular_dia
+y la memoria por fila del vector de estado
+
+Con --suite mide todas las configuraciones y niveles de traza, agrega el resultado
+a un historial JSON Lines (uno por corrida, con el commit) y lo compara con la
+corrida anterior comparable para detectar regresiones:
+    python benchmark_motor.py --suite
+    python benchmark_motor.py --suite --comparar abc1234
+
+Con --escalabilidad alarga la jornada y sube la tasa de llegadas, ajusta el exponente
+de crecimiento del tiempo y la memoria por día contra los eventos del día y falla si
+crece más rápido que n log n (la traza completa solo se informa, ver NIVELES_SOLO_INFORME):
+    python benchmark_motor.py --escalabilidad
+"""
+
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from simulacion import NivelTraza, SimulacionPeluqueria
+
+# Configuraciones de la suite: carga liviana, la del enunciado y congestionada
+CONFIGURACIONES = {
+    'liviana': {'tiempo_llegada_min': 5, 'tiempo_llegada_max': 25},
+    'default': {},
+    'congestionada': {'tiempo_llegada_max': 4},
+}
+
+ARCHIVO_HISTORIAL = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_historial.jsonl')
+
+# Escalones del modo de estrés: cada uno con más eventos por día que el anterior
+# (jornadas de hasta 4 días continuos; con tiempo_llegada_max=4 llegan más clientes
+# de los que se pueden atender y la cola crece durante toda la jornada)
+ESCALONES_ESTRES = (
+    {'jornada_laboral_horas': 8},
+    {'jornada_laboral_horas': 24},
+    {'jornada_laboral_horas': 24, 'tiempo_llegada_max': 6},
+    {'jornada_laboral_horas': 48, 'tiempo_llegada_max': 4},
+    {'jornada_laboral_horas': 96, 'tiempo_llegada_max': 4},
+)
+
+# Niveles de traza cuyo estudio de escalabilidad se informa pero no se exige: la
+# traza completa registra por diseño un snapshot de la cola en cada evento, cuadrático
+# en días congestionados
+NIVELES_SOLO_INFORME = (NivelTraza.COMPLETO,)
+
+# Métricas de la suite que se comparan entre corridas, y si más es mejor
+METRICAS = {
+    'eventos_por_seg': True,
+    'dias_por_seg': True,
+    'dias_por_seg_multiples': True,
+    'pico_bytes_dia': False,
+    'bytes_por_fila': False,
+}
+
+
+def medir_throughput(num_dias=10000, semilla=42, nivel_traza=NivelTraza.COMPLETO, **params_modelo):
+    """Simula num_dias días y devuelve eventos/seg y días/seg
+
+    Args:
+        num_dias: Cantidad de días a simular
+        semilla: Semilla del generador aleatorio (para que las corridas sean comparables)
+        nivel_traza: Nivel de traza con el que se simula cada día
+        **params_modelo: Parámetros para SimulacionPeluqueria
+
+    Returns:
+        Diccionario con eventos totales, tiempo transcurrido y throughput
+    """
+    sim = SimulacionPeluqueria(**params_modelo, semilla=semilla)
+
+    eventos_totales = 0
+    inicio = time.perf_counter()
+    for _ in range(num_dias):
+        stats = sim.simular_dia(nivel_traza=nivel_traza)
+        eventos_totales += stats['iteraciones']
+    transcurrido = time.perf_counter() - inicio
+
+    return {
+        'num_dias': num_dias,
+        'eventos': eventos_totales,
+        'segundos': transcurrido,
+        'eventos_por_seg': eventos_totales / transcurrido if transcurrido > 0 else 0.0,
+        'dias_por_seg': num_dias / transcurrido if transcurrido > 0 else 0.0,
+    }
+
+
+def medir_perfil(num_dias=1000, semilla=42, nivel_traza=NivelTraza.COMPLETO, **params_modelo):
+    """Simula num_dias días con el perfil activado y devuelve el PerfilMotor"""
+    sim = SimulacionPeluqueria(**params_modelo, semilla=semilla)
+    perfil = sim.activar_perfil()
+    for _ in range(num_dias):
+        sim.simular_dia(nivel_traza=nivel_traza)
+    return perfil
+
+
+def medir_vectorizado(num_dias=100000, semilla=42, **params_modelo):
+    """Simula num_dias días con el motor vectorizado y devuelve días/seg"""
+    from motor_vectorizado import simular_dias_vectorizado
+
+    inicio = time.perf_counter()
+    simular_dias_vectorizado(num_dias, semilla=semilla, **params_modelo)
+    transcurrido = time.perf_counter() - inicio
+
+    return {
+        'num_dias': num_dias,
+        'segundos': transcurrido,
+        'dias_por_seg': num_dias / transcurrido if transcurrido > 0 else 0.0,
+    }
+
+
+def medir_bytes_por_fila(semilla=42, **params_modelo):
+    """Compara los bytes por fila del vector de estado columnar contra filas FilaVectorEstado
+
+    Simula un día con traza completa. Para la representación con dataclasses se
+    materializan todas las filas (como las guardaba el motor antes) y se mide con
+    tracemalloc la memoria que retienen.
+
+    Returns:
+        Diccionario con filas, bytes por fila de cada representación y el factor de ahorro
+    """
+    sim = SimulacionPeluqueria(**params_modelo, semilla=semilla)
+    sim.simular_dia(nivel_traza=NivelTraza.COMPLETO)
+    traza = sim.vector_estado
+    filas = len(traza)
+
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    filas_dataclass = list(traza)
+    bytes_dataclass = tracemalloc.get_traced_memory()[0] - antes
+    tracemalloc.stop()
+    del filas_dataclass
+
+    por_fila_columnar = traza.nbytes / filas if filas else 0.0
+    por_fila_dataclass = bytes_dataclass / filas if filas else 0.0
+    return {
+        'filas': filas,
+        'snapshots': len(traza.snapshot_id),
+        'bytes_fila_columnar': por_fila_columnar,
+        'bytes_fila_dataclass': por_fila_dataclass,
+        'ahorro': por_fila_dataclass / por_fila_columnar if por_fila_columnar else 0.0,
+    }
+
+
+def medir_memoria_por_dia(num_dias=200, semilla=42, nivel_traza=NivelTraza.NINGUNO, **params_modelo):
+    """Mide con tracemalloc la memoria de cada día simulado
+
+    Returns:
+        Diccionario con el pico de memoria promedio por día (bytes por encima de la
+        memoria previa al día) y los bloques que quedan retenidos al terminar el día
+        (clientes, eventos y traza del día)
+    """
+    sim = SimulacionPeluqueria(**params_modelo, semilla=semilla)
+    sim.simular_dia(nivel_traza=nivel_traza)  # Calentamiento
+
+    picos = []
+    bloques = []
+    tracemalloc.start()
+    for _ in range(num_dias):
+        sim.reiniciar()
+        base = tracemalloc.get_traced_memory()[0]
+        base_bloques = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+        tracemalloc.reset_peak()
+        sim.simular_dia(nivel_traza=nivel_traza)
+        picos.append(tracemalloc.get_traced_memory()[1] - base)
+        bloques.append(sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename')) - base_bloques)
+    tracemalloc.stop()
+
+    return {
+        'num_dias': num_dias,
+        'pico_bytes_dia': sum(picos) / num_dias,
+        'bloques_dia': sum(bloques) / num_dias,
+    }
+
+
+def medir_arranque(repeticiones=5):
+    """Arranca main.py repeticiones veces con --medir-arranque y devuelve las medianas en ms
+
+    Cada arranque es un proceso nuevo (imports en frío, salvo la cache de disco del
+    sistema). Sin pantalla, usar QT_QPA_PLATFORM=offscreen.
+
+    Returns:
+        Diccionario con 'imports_ms', 'ventana_ms' (crear PeluqueriaVIPApp) y
+        'primer_pintado_ms' (desde el inicio de main.py hasta el primer pintado)
+    """
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
+    medidas = {}
+    for _ in range(repeticiones):
+        proceso = subprocess.run([sys.executable, script, '--medir-arranque'],
+                                 capture_output=True, text=True, check=True)
+        linea = proceso.stdout.strip().splitlines()[-1]
+        for par in linea.split():
+            clave, valor = par.split('=')
+            medidas.setdefault(clave, []).append(float(valor))
+    return {clave: statistics.median(valores) for clave, valores in medidas.items()}
+
+
+def medir_multiples_dias(num_dias=2000, semilla=42, **params_modelo):
+    """Días/seg de simular_multiples_dias en un proceso (acumuladores incluidos)"""
+    sim = SimulacionPeluqueria(**params_modelo, nivel_traza=NivelTraza.NINGUNO)
+    inicio = time.perf_counter()
+    sim.simular_multiples_dias(num_dias, semilla=semilla, guardar_diarios=False)
+    transcurrido = time.perf_counter() - inicio
+    return {
+        'num_dias': num_dias,
+        'segundos': transcurrido,
+        'dias_por_seg': num_dias / transcurrido if transcurrido > 0 else 0.0,
+    }
+
+
+def ejecutar_suite(num_dias=1000, semilla=42, repeticiones=3, dias_memoria=100, configuraciones=None):
+    """Mide cada configuración con cada nivel de traza
+
+    El throughput es el mejor de repeticiones corridas (el ruido del sistema solo
+    puede hacerlas más lentas). simular_multiples_dias se mide por configuración y
+    va en la fila de traza 'ninguno' (es la que usa para todos los días salvo el último).
+
+    Returns:
+        Lista de filas (dict) con 'configuracion', 'nivel_traza' y las METRICAS
+    """
+    configuraciones = configuraciones or CONFIGURACIONES
+    filas = []
+    for nombre, params in configuraciones.items():
+        for nivel in NivelTraza:
+            r = max((medir_throughput(num_dias, semilla, nivel, **params) for _ in range(repeticiones)),
+                    key=lambda medida: medida['dias_por_seg'])
+            m = medir_memoria_por_dia(min(dias_memoria, num_dias), semilla, nivel, **params)
+            sim = SimulacionPeluqueria(**params, semilla=semilla)
+            sim.simular_dia(nivel_traza=nivel)
+            traza = sim.vector_estado
+            filas.append({
+                'configuracion': nombre,
+                'nivel_traza': nivel.value,
+                'eventos_por_seg': r['eventos_por_seg'],
+                'dias_por_seg': r['dias_por_seg'],
+                'dias_por_seg_multiples': (max(medir_multiples_dias(num_dias, semilla, **params)['dias_por_seg']
+                                               for _ in range(repeticiones))
+                                           if nivel == NivelTraza.NINGUNO else None),
+                'pico_bytes_dia': m['pico_bytes_dia'],
+                'bytes_por_fila': traza.nbytes / len(traza) if len(traza) else None,
+            })
+    return filas
+
+
+def ajustar_exponente(x, y):
+    """Pendiente de la recta de mínimos cuadrados de log(y) contra log(x) (y ~ x^exponente)"""
+    lx = [math.log(v) for v in x]
+    ly = [math.log(v) for v in y]
+    media_x = sum(lx) / len(lx)
+    media_y = sum(ly) / len(ly)
+    return (sum((a - media_x) * (b - media_y) for a, b in zip(lx, ly)) /
+            sum((a - media_x) ** 2 for a in lx))
+
+
+def exponente_n_log_n(x):
+    """Exponente que ajusta ajustar_exponente a n log n en los mismos tamaños (algo más que 1)"""
+    return ajustar_exponente(x, [v * math.log(v) for v in x])
+
+
+def medir_escalabilidad(nivel_traza=NivelTraza.NINGUNO, semilla=42, repeticiones=3, escalones=None):
+    """Simula un día por escalón y mide tiempo y pico de memoria
+
+    Además de los eventos del día registra las entradas de snapshot (con traza
+    completa) y el trabajo (eventos + snapshot), para informar cuánto de lo que
+    crece es la traza misma.
+
+    Returns:
+        Lista de puntos (dict) con 'params', 'eventos', 'snapshot', 'trabajo',
+        'segundos' (el mejor de repeticiones) y 'pico_bytes'
+    """
+    puntos = []
+    for params in escalones or ESCALONES_ESTRES:
+        sim = SimulacionPeluqueria(**params, semilla=semilla)
+        segundos = float('inf')
+        for _ in range(repeticiones):
+            sim.sembrar(semilla)
+            inicio = time.perf_counter()
+            stats = sim.simular_dia(max_iteraciones=10 ** 9, nivel_traza=nivel_traza)
+            segundos = min(segundos, time.perf_counter() - inicio)
+        snapshot = len(sim.vector_estado.snapshot_id)
+
+        sim.sembrar(semilla)
+        sim.reiniciar()
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        sim.simular_dia(max_iteraciones=10 ** 9, nivel_traza=nivel_traza)
+        pico = tracemalloc.get_traced_memory()[1] - base
+        tracemalloc.stop()
+
+        puntos.append({
+            'params': params,
+            'eventos': stats['iteraciones'],
+            'snapshot': snapshot,
+            'trabajo': stats['iteraciones'] + snapshot,
+            'segundos': segundos,
+            'pico_bytes': pico,
+        })
+    return puntos
+
+
+def verificar_escalabilidad(puntos, margen=0.15):
+    """Compara los exponentes de tiempo y memoria contra eventos por día con el de n log n
+
+    margen absorbe el ruido de medición y los costos fijos de los días chicos.
+
+    Returns:
+        Diccionario con 'exponente_tiempo', 'exponente_memoria', 'exponente_limite'
+        (n log n + margen) y 'ok'
+    """
+    eventos = [p['eventos'] for p in puntos]
+    exponente_tiempo = ajustar_exponente(eventos, [p['segundos'] for p in puntos])
+    exponente_memoria = ajustar_exponente(eventos, [p['pico_bytes'] for p in puntos])
+    limite = exponente_n_log_n(eventos) + margen
+    return {
+        'exponente_tiempo': exponente_tiempo,
+        'exponente_memoria': exponente_memoria,
+        'exponente_limite': limite,
+        'ok': exponente_tiempo <= limite and exponente_memoria <= limite,
+    }
+
+
+def _escalabilidad_cli(args) -> int:
+    todos_ok = True
+    for nivel in NivelTraza:
+        print(f"🔄 Escalabilidad con traza={nivel.value} ({len(ESCALONES_ESTRES)} escalones)...")
+        puntos = medir_escalabilidad(nivel, args.semilla, args.repeticiones)
+        for p in puntos:
+            params = ', '.join(f"{k}={v}" for k, v in p['params'].items())
+            print(f"   {params:<50} eventos={p['eventos']:>6,} trabajo={p['trabajo']:>10,} "
+                  f"{p['segundos'] * 1000:>9.1f} ms {p['pico_bytes'] / 1024:>10,.0f} KiB")
+        v = verificar_escalabilidad(puntos, args.margen)
+        print(f"   Exponente tiempo: {v['exponente_tiempo']:.2f}, memoria: {v['exponente_memoria']:.2f} "
+              f"contra eventos (límite n log n + margen: {v['exponente_limite']:.2f})")
+        if nivel in NIVELES_SOLO_INFORME:
+            crecimiento = ajustar_exponente([p['eventos'] for p in puntos], [p['trabajo'] for p in puntos])
+            print(f"   ℹ️  Solo informe: el snapshot de cada fila tiene a todos los clientes presentes, "
+                  f"así que la traza misma crece como eventos^{crecimiento:.2f}")
+            print("   ✅ Dentro de n log n" if v['ok'] else "   ⚠️  Crece más rápido que n log n (exento)")
+            continue
+        print("   ✅ OK" if v['ok'] else "   ❌ Crece más rápido que n log n")
+        todos_ok = todos_ok and v['ok']
+    return 0 if todos_ok else 1
+
+
+def _commit_actual():
+    """(hash corto de HEAD, hay cambios sin commitear) o (None, None) fuera de git"""
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=directorio,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        cambios = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=directorio,
+                                 capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, bool(cambios)
+
+
+def registro_historial(filas, num_dias, semilla, repeticiones):
+    """Registro de una corrida de la suite para el historial"""
+    commit, modificado = _commit_actual()
+    return {
+        'fecha': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'modificado': modificado,
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'num_dias': num_dias,
+        'semilla': semilla,
+        'repeticiones': repeticiones,
+        'filas': filas,
+    }
+
+
+def cargar_historial(ruta=ARCHIVO_HISTORIAL):
+    """Registros del historial, del más viejo al más nuevo ([] si no existe)"""
+    try:
+        with open(ruta, encoding='utf-8') as archivo:
+            return [json.loads(linea) for linea in archivo if linea.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def guardar_historial(registro, ruta=ARCHIVO_HISTORIAL):
+    """Agrega el registro al final del historial (una línea JSON por corrida)"""
+    with open(ruta, 'a', encoding='utf-8') as archivo:
+        archivo.write(json.dumps(registro, sort_keys=True) + '\n')
+
+
+def buscar_referencia(historial, registro, commit=None):
+    """Último registro comparable con registro (mismos días, semilla y repeticiones)
+
+    Con commit, el último de ese commit (acepta un prefijo del hash); si no, el
+    último anterior a registro. None si no hay ninguno.
+    """
+    for anterior in reversed(historial):
+        if anterior is registro or anterior == registro:
+            continue
+        if any(anterior.get(campo) != registro[campo] for campo in ('num_dias', 'semilla', 'repeticiones')):
+            continue
+        if commit is None or (anterior['commit'] or '').startswith(commit):
+            return anterior
+    return None
+
+
+def comparar(referencia, registro, tolerancia=0.15):
+    """Métricas de registro que empeoraron más que tolerancia respecto de referencia
+
+    Returns:
+        Lista de (configuracion, nivel_traza, metrica, valor de referencia, valor actual, cambio relativo)
+    """
+    anteriores = {(f['configuracion'], f['nivel_traza']): f for f in referencia['filas']}
+    regresiones = []
+    for fila in registro['filas']:
+        anterior = anteriores.get((fila['configuracion'], fila['nivel_traza']))
+        if anterior is None:
+            continue
+        for metrica, mas_es_mejor in METRICAS.items():
+            valor, valor_anterior = fila.get(metrica), anterior.get(metrica)
+            if not valor or not valor_anterior:
+                continue
+            cambio = (valor - valor_anterior) / valor_anterior
+            if (-cambio if mas_es_mejor else cambio) > tolerancia:
+                regresiones.append((fila['configuracion'], fila['nivel_traza'], metrica,
+                                    valor_anterior, valor, cambio))
+    return regresiones
+
+
+def _ejecutar_suite_cli(args) -> int:
+    num_dias = args.dias or 1000
+    print(f"🔄 Suite: {len(CONFIGURACIONES)} configuraciones x {len(NivelTraza)} niveles de traza, "
+          f"{num_dias} días, mejor de {args.repeticiones} (semilla={args.semilla})...")
+    filas = ejecutar_suite(num_dias, args.semilla, args.repeticiones)
+    print(f"{'configuracion':<14} {'traza':<9} {'eventos/s':>10} {'dias/s':>8} {'dias/s multi':>12} "
+          f"{'pico B/dia':>10} {'B/fila':>7}")
+    for f in filas:
+        multiples = f"{f['dias_por_seg_multiples']:,.0f}" if f['dias_por_seg_multiples'] else '-'
+        bytes_fila = f"{f['bytes_por_fila']:,.0f}" if f['bytes_por_fila'] else '-'
+        print(f"{f['configuracion']:<14} {f['nivel_traza']:<9} {f['eventos_por_seg']:>10,.0f} "
+              f"{f['dias_por_seg']:>8,.0f} {multiples:>12} {f['pico_bytes_dia']:>10,.0f} {bytes_fila:>7}")
+
+    historial = cargar_historial(args.historial)
+    registro = registro_historial(filas, num_dias, args.semilla, args.repeticiones)
+    guardar_historial(registro, args.historial)
+    print(f"💾 Guardado en {args.historial} (commit {registro['commit'] or '?'}"
+          f"{', con cambios' if registro['modificado'] else ''})")
+
+    referencia = buscar_referencia(historial, registro, args.comparar)
+    if referencia is None:
+        print("ℹ️  Sin corrida anterior comparable (mismos días, semilla y repeticiones)")
+        return 0
+    regresiones = comparar(referencia, registro, args.tolerancia)
+    print(f"📊 Comparado con {referencia['commit'] or '?'} ({referencia['fecha']}), "
+          f"tolerancia {args.tolerancia:.0%}")
+    if not regresiones:
+        print("✅ Sin regresiones")
+        return 0
+    for configuracion, nivel, metrica, anterior, actual, cambio in regresiones:
+        print(f"❌ {configuracion}/{nivel} {metrica}: {anterior:,.1f} -> {actual:,.1f} ({cambio:+.1%})")
+    return 1
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark del motor de simulación")
+    parser.add_argument('--dias', type=int, default=None,
+                        help="Días a simular (default: 10000; 1000 con --suite)")
+    parser.add_argument('--semilla', type=int, default=42, help="Semilla aleatoria (default: 42)")
+    parser.add_argument('--traza', choices=[n.value for n in NivelTraza], default=NivelTraza.COMPLETO.value,
+                        help="Nivel de traza del vector de estado (default: completo)")
+    parser.add_argument('--memoria', action='store_true',
+                        help="Medir bytes por fila del vector de estado en lugar del throughput")
+    parser.add_argument('--vectorizado', action='store_true',
+                        help="Medir el motor vectorizado con NumPy (sin vector de estado)")
+    parser.add_argument('--arranque', action='store_true',
+                        help="Medir el arranque de la interfaz gráfica (requiere PyQt5)")
+    parser.add_argument('--perfil', action='store_true',
+                        help="Mostrar llamadas y tiempo por sección del motor (eventos, traza, calendario, RNG)")
+    parser.add_argument('--congestionada', action='store_true',
+                        help="Usar la configuración congestionada (tiempo_llegada_max=4) en lugar de la default")
+    parser.add_argument('--suite', action='store_true',
+                        help="Medir todas las configuraciones y niveles de traza y guardar en el historial")
+    parser.add_argument('--historial', default=ARCHIVO_HISTORIAL, metavar='ARCHIVO',
+                        help="Historial JSON Lines de la suite (default: benchmark_historial.jsonl)")
+    parser.add_argument('--comparar', default=None, metavar='COMMIT',
+                        help="Comparar la suite con la última corrida de COMMIT (default: la anterior)")
+    parser.add_argument('--repeticiones', type=int, default=3,
+                        help="Corridas por medición de la suite; se toma la mejor (default: 3)")
+    parser.add_argument('--escalabilidad', action='store_true',
+                        help="Modo de estrés: verificar que tiempo y memoria por día crezcan a lo sumo como "
+                             "n log n en los eventos (traza completa: solo informe)")
+    parser.add_argument('--margen', type=float, default=0.15,
+                        help="Margen sobre el exponente de n log n en --escalabilidad (default: 0.15)")
+    parser.add_argument('--tolerancia', type=float, default=0.15,
+                        help="Empeoramiento relativo que se considera regresión (default: 0.15)")
+    args = parser.parse_args(argv)
+
+    if args.suite:
+        return _ejecutar_suite_cli(args)
+    if args.escalabilidad:
+        return _escalabilidad_cli(args)
+    
+    if args.arranque:
+        print("🔄 Midiendo el arranque de main.py (mediana de 5)...")
+        try:
+            r = medir_arranque()
+        except subprocess.CalledProcessError as e:
+            ultima = e.stderr.strip().splitlines()[-1] if e.stderr.strip() else f"código {e.returncode}"
+            print(f"❌ main.py no pudo arrancar: {ultima}")
+            return 1
+        print(f"✅ Imports: {r['imports_ms']:.0f} ms")
+        print(f"   - Crear ventana: {r['ventana_ms']:.0f} ms")
+        print(f"   - Hasta el primer pintado: {r['primer_pintado_ms']:.0f} ms")
+        return 0
+
+    if args.vectorizado:
+        num_dias = args.dias or 10000
+        print(f"🔄 Simulando {num_dias} días con el motor vectorizado (semilla={args.semilla})...")
+        r = medir_vectorizado(num_dias, args.semilla)
+        print(f"✅ Tiempo total: {r['segundos']:.2f} s")
+        print(f"   - Días/seg: {r['dias_por_seg']:,.1f}")
+        return 0
+
+    if args.memoria:
+        for nombre, params in (('default', {}), ('congestionada', {'tiempo_llegada_max': 4})):
+            m = medir_bytes_por_fila(args.semilla, **params)
+            print(f"📦 Config {nombre}: {m['filas']} filas, {m['snapshots']} entradas de snapshot")
+            print(f"   - Columnar:     {m['bytes_fila_columnar']:,.0f} bytes/fila")
+            print(f"   - Dataclasses:  {m['bytes_fila_dataclass']:,.0f} bytes/fila")
+            print(f"   - Ahorro:       {m['ahorro']:.1f}x")
+        m = medir_memoria_por_dia(200, args.semilla, NivelTraza(args.traza))
+        print(f"🧠 Memoria por día (traza={args.traza}, {m['num_dias']} días):")
+        print(f"   - Pico: {m['pico_bytes_dia']:,.0f} bytes")
+        print(f"   - Bloques retenidos: {m['bloques_dia']:,.0f}")
+        return 0
+
+    params = CONFIGURACIONES['congestionada' if args.congestionada else 'default']
+    if args.perfil:
+        num_dias = args.dias or 1000
+        print(f"🔄 Perfilando {num_dias} días (semilla={args.semilla}, traza={args.traza})...")
+        print(medir_perfil(num_dias, args.semilla, NivelTraza(args.traza), **params).formatear())
+        return 0
+
+    num_dias = args.dias or 10000
+    print(f"🔄 Simulando {num_dias} días (semilla={args.semilla}, traza={args.traza})...")
+    r = medir_throughput(num_dias, args.semilla, NivelTraza(args.traza), **params)
+
+    print(f"✅ Eventos procesados: {r['eventos']:,}")
+    print(f"   - Tiempo total: {r['segundos']:.2f} s")
+    print(f"   - Eventos/seg: {r['eventos_por_seg']:,.0f}")
+    print(f"   - Días/seg: {r['dias_por_seg']:,.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
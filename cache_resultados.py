@@ -0,0 +1,155 @@
+"""
+Simulación de Peluquería VIP
+Cache en disco de resultados de simulación, direccionado por contenido
+"""
+
+import dataclasses
+import hashlib
+import json
+import math
+import os
+import tempfile
+import time
+from typing import Dict, Optional
+
+from estadisticas import sin_no_finitos
+from simulacion import VERSION_MOTOR
+
+# Directorio por defecto: $XDG_CACHE_HOME/peluqueria_vip (o ~/.cache/peluqueria_vip)
+DIRECTORIO_POR_DEFECTO = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'peluqueria_vip')
+
+# Temporales más viejos que esto son de escrituras interrumpidas y se borran al desalojar
+SEGUNDOS_TEMPORAL_ABANDONADO = 3600
+
+
+def clave_cache(**componentes) -> str:
+    """Hash SHA-256 canónico de los componentes de una corrida más VERSION_MOTOR
+
+    Los componentes se serializan como JSON con las claves ordenadas, así el orden
+    de los argumentos no cambia la clave.
+    """
+    componentes['version_motor'] = VERSION_MOTOR
+    texto = json.dumps(componentes, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+def clave_simulacion(params_modelo: Dict, num_dias: int, semilla, tiempo_max=None, max_iteraciones=100000,
+                     antiteticos: bool = False, objetivo=None, guardar_diarios: bool = True) -> str:
+    """Clave de una corrida de simular_multiples_dias con semilla maestra
+
+    params_modelo debe ser el de la simulación (SimulacionPeluqueria.params_modelo,
+    con los valores por defecto), así no importa qué parámetros se pasaron
+    explícitamente. La cantidad de procesos no forma parte de la clave: con semilla
+    el resultado no depende de ella. guardar_diarios sí: un resultado sin
+    'resultados_diarios' (como los del barrido) no sirve a quien los necesita.
+    """
+    return clave_cache(motor='eventos', params_modelo=params_modelo, num_dias=num_dias, semilla=semilla,
+                       tiempo_max=tiempo_max, max_iteraciones=max_iteraciones, antiteticos=antiteticos,
+                       objetivo=dataclasses.asdict(objetivo) if objetivo is not None else None,
+                       guardar_diarios=guardar_diarios)
+
+
+class CacheResultados:
+    """Resultados agregados guardados como un archivo JSON por clave, con desalojo LRU
+
+    La escritura va a un archivo temporal del mismo directorio que después se
+    renombra (os.replace es atómico), así un lector nunca ve un archivo a medias y
+    dos procesos que guardan la misma clave dejan uno de los dos resultados
+    completos (son iguales: la clave determina el resultado).
+
+    La fecha de modificación de cada archivo es su último uso: obtener la actualiza
+    y, si después de guardar el directorio supera max_bytes, se borran las entradas
+    usadas hace más tiempo. No hace falta bloquear: si dos procesos desalojan a la
+    vez, borrar un archivo que ya no existe se ignora, y un lector que pierde la
+    carrera contra un desalojo ve un fallo de cache.
+    """
+
+    def __init__(self, directorio: Optional[str] = None, max_bytes: Optional[int] = 100 * 1024 * 1024):
+        """
+        Args:
+            directorio: Directorio de la cache (None = DIRECTORIO_POR_DEFECTO)
+            max_bytes: Tamaño máximo de las entradas en disco (None = sin límite)
+        """
+        self.directorio = directorio or DIRECTORIO_POR_DEFECTO
+        self.max_bytes = max_bytes
+        os.makedirs(self.directorio, exist_ok=True)
+
+    def _ruta(self, clave: str) -> str:
+        return os.path.join(self.directorio, clave + '.json')
+
+    def obtener(self, clave: str) -> Optional[Dict]:
+        """Resultado guardado para la clave, o None si no está"""
+        ruta = self._ruta(clave)
+        try:
+            with open(ruta, encoding='utf-8') as archivo:
+                resultado = json.load(archivo)
+            os.utime(ruta)  # Marca de uso para el desalojo LRU
+        except (OSError, ValueError):
+            return None
+        # JSON no tiene tuplas: los intervalos de confianza vuelven como (inferior, superior).
+        # Los no finitos se guardaron como null (ver guardar): en un intervalo son sus
+        # cotas infinitas y en el resto de los valores, infinito positivo
+        for clave_resultado, valor in resultado.items():
+            if clave_resultado.startswith('ic_') and isinstance(valor, list):
+                inferior, superior = valor
+                resultado[clave_resultado] = (-math.inf if inferior is None else inferior,
+                                              math.inf if superior is None else superior)
+            elif valor is None:
+                resultado[clave_resultado] = math.inf
+        return resultado
+
+    def guardar(self, clave: str, resultado: Dict):
+        """Guarda el resultado para la clave (reemplaza el anterior si existía) y desaloja si hace falta
+
+        Los valores no finitos (intervalos de un solo día, reducciones de varianza
+        infinitas) se escriben como null, así el archivo es JSON estándar; obtener
+        los restaura.
+        """
+        descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as archivo:
+                json.dump(sin_no_finitos(resultado), archivo, allow_nan=False)
+            os.replace(temporal, self._ruta(clave))
+        except BaseException:
+            os.unlink(temporal)
+            raise
+        if self.max_bytes is not None:
+            self.desalojar(self.max_bytes)
+
+    def tamano(self) -> int:
+        """Bytes ocupados por las entradas de la cache"""
+        return sum(tamano for _, _, tamano in self._entradas())
+
+    def desalojar(self, max_bytes: int):
+        """Borra las entradas usadas hace más tiempo hasta que la cache ocupe a lo sumo max_bytes"""
+        entradas = self._entradas()
+        total = sum(tamano for _, _, tamano in entradas)
+        for _, ruta, tamano in sorted(entradas):
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(ruta)
+            except FileNotFoundError:
+                pass  # Otro proceso la desalojó antes
+            total -= tamano
+
+    def limpiar(self):
+        """Borra todas las entradas"""
+        self.desalojar(0)
+
+    def _entradas(self):
+        """(último uso, ruta, bytes) de cada entrada; borra los temporales abandonados"""
+        entradas = []
+        limite_temporales = time.time() - SEGUNDOS_TEMPORAL_ABANDONADO
+        with os.scandir(self.directorio) as it:
+            for entrada in it:
+                try:
+                    info = entrada.stat()
+                    if entrada.name.endswith('.json'):
+                        entradas.append((info.st_mtime, entrada.path, info.st_size))
+                    elif entrada.name.endswith('.tmp') and info.st_mtime < limite_temporales:
+                        os.remove(entrada.path)
+                except FileNotFoundError:
+                    pass  # Desalojada o renombrada por otro proceso mientras se listaba
+        return entradas
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Simulación de Peluquería VIP
+Interfaz de línea de comandos, sin interfaz gráfica (no importa PyQt5 ni openpyxl)
+
+Uso:
+    python -m cli_peluqueria --dias 1000 --semilla 42 --procesos 0
+    python -m cli_peluqueria --dias 500 --prob-aprendiz 0.2 --formato csv --salida resumen.csv \\
+        --diarios diarios.csv
+"""
+
+import argparse
+import csv
+import dataclasses
+import inspect
+import json
+import sys
+
+from estadisticas import sin_no_finitos
+from simulacion import FilaVectorEstado, NivelTraza, SimulacionPeluqueria
+
+# Parámetros del constructor que no son del modelo (tienen su propia opción o no aplican)
+PARAMETROS_NO_MODELO = ('nivel_traza', 'registrar_refrigerios_obsoletos', 'semilla')
+
+
+def _numero(texto: str):
+    """int si el texto es entero, si no float"""
+    try:
+        return int(texto)
+    except ValueError:
+        return float(texto)
+
+
+def parametros_modelo():
+    """(nombre, valor por defecto) de cada parámetro del modelo de SimulacionPeluqueria"""
+    firma = inspect.signature(SimulacionPeluqueria.__init__)
+    return [(nombre, param.default) for nombre, param in firma.parameters.items()
+            if nombre != 'self' and nombre not in PARAMETROS_NO_MODELO]
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m cli_peluqueria',
+        description="Simulación de Peluquería VIP sin interfaz gráfica")
+
+    corrida = parser.add_argument_group("corrida")
+    corrida.add_argument('--dias', type=int, default=30, help="Días a simular (default: 30)")
+    corrida.add_argument('--semilla', type=int, default=None,
+                         help="Semilla maestra; con semilla el resultado es reproducible (default: al azar)")
+    corrida.add_argument('--procesos', type=int, default=1,
+                         help="Procesos en paralelo (0 = todos los núcleos, default: 1)")
+    corrida.add_argument('--tiempo-max', type=float, default=None,
+                         help="Tiempo máximo de simulación por día en minutos (default: 2 jornadas)")
+    corrida.add_argument('--max-iteraciones', type=int, default=100000,
+                         help="Máximo de eventos por día (default: 100000)")
+    corrida.add_argument('--traza', choices=[n.value for n in NivelTraza], default=NivelTraza.NINGUNO.value,
+                         help="Nivel de traza del vector de estado del último día (default: ninguno)")
+    corrida.add_argument('--antiteticos', action='store_true', help="Simular pares de días antitéticos")
+    corrida.add_argument('--checkpoint', default=None, metavar='ARCHIVO',
+                         help="Guardar el avance en ARCHIVO y reanudar desde él si ya existe")
+    corrida.add_argument('--perfil', action='store_true',
+                         help="Mostrar en stderr llamadas y tiempo por sección del motor "
+                              "(con --procesos distinto de 1, solo el último día)")
+
+    modelo = parser.add_argument_group("modelo (parámetros de SimulacionPeluqueria)")
+    for nombre, defecto in parametros_modelo():
+        modelo.add_argument('--' + nombre.replace('_', '-'), dest=nombre, type=_numero, default=defecto,
+                            metavar='VALOR', help=f"(default: {defecto})")
+
+    salida = parser.add_argument_group("salida")
+    salida.add_argument('--formato', choices=('json', 'csv'), default='json', help="Formato (default: json)")
+    salida.add_argument('--salida', default='-', metavar='ARCHIVO',
+                        help="Archivo del resumen; '-' = salida estándar (default)")
+    salida.add_argument('--diarios', default=None, metavar='ARCHIVO',
+                        help="Archivo con los resultados de cada día ('-' = salida estándar)")
+    salida.add_argument('--vector', default=None, metavar='ARCHIVO',
+                        help="Archivo CSV con el vector de estado del último día (requiere --traza)")
+    return parser
+
+
+def _abrir(ruta: str):
+    """Archivo de salida; '-' es la salida estándar (no se cierra)"""
+    if ruta == '-':
+        return _SalidaEstandar()
+    return open(ruta, 'w', newline='', encoding='utf-8')
+
+
+class _SalidaEstandar:
+    """Context manager sobre sys.stdout que no la cierra al salir"""
+
+    def __enter__(self):
+        return sys.stdout
+
+    def __exit__(self, *args):
+        sys.stdout.flush()
+
+
+def _aplanar(resultado: dict) -> dict:
+    """Resumen sin los días y con los intervalos separados en _inferior/_superior (para CSV)"""
+    fila = {}
+    for clave, valor in resultado.items():
+        if clave == 'resultados_diarios':
+            continue
+        if isinstance(valor, tuple):
+            fila[clave + '_inferior'], fila[clave + '_superior'] = valor
+        else:
+            fila[clave] = valor
+    return fila
+
+
+def _escribir_filas(archivo, filas, formato):
+    if formato == 'json':
+        json.dump(sin_no_finitos(filas), archivo, indent=2, allow_nan=False)
+        archivo.write('\n')
+    elif filas:
+        escritor = csv.DictWriter(archivo, fieldnames=list(filas[0]))
+        escritor.writeheader()
+        escritor.writerows(filas)
+
+
+def escribir_vector(archivo, traza):
+    """Escribe el vector de estado como CSV (los RND del evento como JSON en una columna)"""
+    columnas = [f.name for f in dataclasses.fields(FilaVectorEstado) if f.name != 'clientes_snapshot']
+    escritor = csv.writer(archivo)
+    escritor.writerow(columnas)
+    for fila in traza:
+        escritor.writerow([json.dumps(fila.rnd_evento) if nombre == 'rnd_evento' else getattr(fila, nombre)
+                           for nombre in columnas])
+
+
+def main(argv=None) -> int:
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    if args.vector and args.traza == NivelTraza.NINGUNO.value:
+        parser.error("--vector requiere --traza resumen o completo")
+    if args.dias < 1:
+        parser.error("--dias debe ser al menos 1")
+    if args.antiteticos and args.dias % 2:
+        parser.error("Con --antiteticos el número de días debe ser par")
+
+    params_modelo = {nombre: getattr(args, nombre) for nombre, _ in parametros_modelo()}
+    sim = SimulacionPeluqueria(**params_modelo, nivel_traza=args.traza)
+    if args.perfil:
+        sim.activar_perfil()
+    resultado = sim.simular_multiples_dias(
+        args.dias, args.tiempo_max, args.max_iteraciones, semilla=args.semilla,
+        num_procesos=args.procesos or None, guardar_diarios=args.diarios is not None,
+        antiteticos=args.antiteticos, checkpoint=args.checkpoint)
+
+    with _abrir(args.salida) as archivo:
+        if args.formato == 'json':
+            resumen = {clave: valor for clave, valor in resultado.items() if clave != 'resultados_diarios'}
+            json.dump(sin_no_finitos(resumen), archivo, indent=2, allow_nan=False)
+            archivo.write('\n')
+        else:
+            _escribir_filas(archivo, [_aplanar(resultado)], 'csv')
+
+    if args.diarios:
+        with _abrir(args.diarios) as archivo:
+            _escribir_filas(archivo, resultado['resultados_diarios'], args.formato)
+
+    if args.vector:
+        with _abrir(args.vector) as archivo:
+            escribir_vector(archivo, sim.vector_estado)
+
+    if args.perfil:
+        print(sim.perfil.formatear(), file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Simulación de Peluquería VIP
+Cuasi-Monte Carlo: días generados con secuencias de Sobol aleatorizadas (scrambled)
+"""
+
+import math
+import random
+from typing import Dict, Optional
+
+from estadisticas import AcumuladorDias, EstadisticaWelford
+from simulacion import NivelTraza, SimulacionPeluqueria
+
+try:
+    from scipy.stats import qmc, t as distribucion_t
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Uniformes por cliente: entre-llegada, asignación y servicio
+UNIFORMES_POR_CLIENTE = 3
+
+
+class GeneradorSecuencia:
+    """Entrega en orden las coordenadas de un punto como si fueran random.random()"""
+    __slots__ = ('valores', 'indice')
+
+    def __init__(self, valores):
+        self.valores = valores
+        self.indice = 0
+
+    def random(self) -> float:
+        valor = self.valores[self.indice]
+        self.indice += 1
+        return valor
+
+
+def simular_dias_qmc(puntos_por_replica: int = 1024, num_replicas: int = 16, semilla: Optional[int] = None,
+                     tiempo_max=None, max_iteraciones=100000, **params_modelo) -> Dict:
+    """Simula días con uniformes de una secuencia de Sobol aleatorizada
+
+    Cada día es un punto del cubo [0, 1)^d con d = 3 × (máximo de clientes por día):
+    el cliente k usa las coordenadas 3k (entre-llegada), 3k+1 (asignación) y 3k+2
+    (servicio del k-ésimo cliente atendido). Así las primeras coordenadas, las de
+    mejor uniformidad en Sobol, corresponden al comienzo de la jornada.
+
+    Cada réplica usa un scrambling independiente (Owen + desplazamiento digital) de
+    puntos_por_replica puntos; los promedios de las réplicas son independientes y
+    con ellos se calculan los intervalos de confianza (t de Student).
+
+    Args:
+        puntos_por_replica: Días por réplica (potencia de 2)
+        num_replicas: Réplicas aleatorizadas independientes (al menos 2)
+        semilla: Semilla de los scramblings
+        tiempo_max: Tiempo máximo de simulación por día
+        max_iteraciones: Máximo de eventos por día
+        **params_modelo: Parámetros de SimulacionPeluqueria
+
+    Returns:
+        Diccionario como _calcular_estadisticas_agregadas (sin 'resultados_diarios'),
+        con los intervalos de confianza calculados entre réplicas y además
+        'num_replicas' y 'puntos_por_replica'
+    """
+    if not SCIPY_AVAILABLE:
+        raise ImportError("El modo cuasi-Monte Carlo requiere scipy (pip install scipy)")
+    m = int(round(math.log2(puntos_por_replica)))
+    if puntos_por_replica < 1 or 2 ** m != puntos_por_replica:
+        raise ValueError("puntos_por_replica debe ser una potencia de 2")
+    if num_replicas < 2:
+        raise ValueError("Se necesitan al menos 2 réplicas para el intervalo de confianza")
+
+    sim = SimulacionPeluqueria(**params_modelo)
+    if sim.TIEMPO_LLEGADA_MIN <= 0:
+        raise ValueError("El tiempo mínimo entre llegadas debe ser mayor que 0")
+    # Una entre-llegada más que clientes: la que cae después del cierre también se sortea
+    max_clientes = int(math.floor(sim.JORNADA_LABORAL / sim.TIEMPO_LLEGADA_MIN)) + 1
+    dimension = UNIFORMES_POR_CLIENTE * max_clientes
+
+    rng = random.Random(semilla)
+    total = AcumuladorDias(guardar_diarios=False)
+    replicas_recaudacion = EstadisticaWelford()
+    replicas_ganancia = EstadisticaWelford()
+    replicas_prob = EstadisticaWelford()
+
+    for _ in range(num_replicas):
+        puntos = qmc.Sobol(dimension, scramble=True, seed=rng.getrandbits(64)).random_base2(m)
+        replica = AcumuladorDias(guardar_diarios=False)
+        for punto in puntos.tolist():
+            sim.rng_llegadas = GeneradorSecuencia(punto[0::UNIFORMES_POR_CLIENTE])
+            sim.rng_asignacion = GeneradorSecuencia(punto[1::UNIFORMES_POR_CLIENTE])
+            sim.rng_servicio = GeneradorSecuencia(punto[2::UNIFORMES_POR_CLIENTE])
+            replica.agregar(sim.simular_dia(tiempo_max, max_iteraciones, NivelTraza.NINGUNO))
+        replicas_recaudacion.agregar(replica.recaudacion.media)
+        replicas_ganancia.agregar(replica.ganancia.media)
+        replicas_prob.agregar(replica.refrigerios_umbral.media)
+        total.combinar(replica)
+
+    resultado = total.resultado()
+    del resultado['resultados_diarios']
+
+    # Intervalos entre réplicas: los días de una réplica no son independientes
+    cuantil = distribucion_t.ppf(0.975, num_replicas - 1)
+    for clave, replicas in (('recaudacion_promedio', replicas_recaudacion),
+                            ('ganancia_promedio', replicas_ganancia),
+                            ('prob_5_o_mas_refrigerios', replicas_prob)):
+        semiancho = cuantil * math.sqrt(replicas.varianza / num_replicas)
+        resultado['ic_' + clave] = (replicas.media - semiancho, replicas.media + semiancho)
+    resultado['num_replicas'] = num_replicas
+    resultado['puntos_por_replica'] = puntos_por_replica
+    return resultado
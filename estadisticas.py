@@ -0,0 +1,450 @@
+"""
+Simulación de Peluquería VIP
+Estadísticas en línea (Welford) de múltiples días, con intervalos de confianza
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# Umbral de refrigerios de la pregunta 3 (P(5 o más refrigerios en un día))
+UMBRAL_REFRIGERIOS = 5
+
+# Cuantil de la normal para intervalos de confianza del 95%
+Z_95 = 1.959963984540054
+
+
+class EstadisticaWelford:
+    """Media, varianza, mínimo y máximo de una serie, actualizados en O(1) por valor
+
+    Usa el algoritmo de Welford para agregar y la fórmula de Chan et al. para
+    combinar dos estadísticas calculadas por separado (por ejemplo, en procesos distintos).
+    """
+    __slots__ = ('n', 'media', 'm2', 'minimo', 'maximo')
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0  # Suma de cuadrados de las desviaciones respecto de la media
+        self.minimo = math.inf
+        self.maximo = -math.inf
+
+    @classmethod
+    def desde_resumen(cls, n: int, media: float, m2: float, minimo: float, maximo: float) -> 'EstadisticaWelford':
+        """Crea la estadística de un lote ya resumido (n, media, m2, mínimo y máximo)"""
+        estadistica = cls()
+        if n > 0:
+            estadistica.n = n
+            estadistica.media = float(media)
+            estadistica.m2 = float(m2)
+            estadistica.minimo = float(minimo)
+            estadistica.maximo = float(maximo)
+        return estadistica
+
+    def agregar(self, valor: float):
+        """Incorpora un valor"""
+        self.n += 1
+        delta = valor - self.media
+        self.media += delta / self.n
+        self.m2 += delta * (valor - self.media)
+        if valor < self.minimo:
+            self.minimo = valor
+        if valor > self.maximo:
+            self.maximo = valor
+
+    def combinar(self, otra: 'EstadisticaWelford'):
+        """Incorpora todos los valores resumidos en otra estadística"""
+        if otra.n == 0:
+            return
+        if self.n == 0:
+            self.n, self.media, self.m2 = otra.n, otra.media, otra.m2
+            self.minimo, self.maximo = otra.minimo, otra.maximo
+            return
+        n = self.n + otra.n
+        delta = otra.media - self.media
+        self.media += delta * otra.n / n
+        self.m2 += otra.m2 + delta * delta * self.n * otra.n / n
+        self.n = n
+        self.minimo = min(self.minimo, otra.minimo)
+        self.maximo = max(self.maximo, otra.maximo)
+
+    @property
+    def varianza(self) -> float:
+        """Varianza muestral (0 con menos de dos valores)"""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def semiancho(self) -> float:
+        """Semiancho del intervalo de confianza del 95% para la media"""
+        return Z_95 * math.sqrt(self.varianza / self.n) if self.n > 1 else math.inf
+
+    def intervalo_confianza(self) -> Tuple[float, float]:
+        """Intervalo de confianza del 95% para la media (aproximación normal)"""
+        semiancho = self.semiancho
+        return (self.media - semiancho, self.media + semiancho)
+
+
+def intervalo_wilson(proporcion: float, n: float) -> Tuple[float, float]:
+    """Intervalo de Wilson del 95% para una proporción estimada con n observaciones 0/1
+
+    A diferencia del de Wald (p ± z·sqrt(p(1-p)/n)) no se anula cuando la proporción
+    observada es 0 o 1: con 0 éxitos en n días va de 0 a z²/(n + z²). n puede ser un
+    tamaño efectivo no entero.
+    """
+    if n <= 0:
+        return (0.0, 1.0)
+    z2 = Z_95 * Z_95
+    denominador = 1 + z2 / n
+    centro = (proporcion + z2 / (2 * n)) / denominador
+    semiancho = Z_95 * math.sqrt(proporcion * (1 - proporcion) / n + z2 / (4 * n * n)) / denominador
+    return (max(0.0, centro - semiancho), min(1.0, centro + semiancho))
+
+
+class CovarianzaWelford:
+    """Medias, varianzas y covarianza de pares (x, y), actualizadas en O(1) por par
+
+    Sirve para el estimador con variable de control: x es la variable de control
+    (media conocida) e y la variable a estimar.
+    """
+    __slots__ = ('n', 'media_x', 'media_y', 'm2_x', 'm2_y', 'c')
+
+    def __init__(self):
+        self.n = 0
+        self.media_x = 0.0
+        self.media_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c = 0.0  # Suma de productos de las desviaciones de x e y
+
+    @classmethod
+    def desde_resumen(cls, n: int, media_x: float, media_y: float,
+                      m2_x: float, m2_y: float, c: float) -> 'CovarianzaWelford':
+        """Crea la covarianza de un lote ya resumido"""
+        covarianza = cls()
+        if n > 0:
+            covarianza.n = n
+            covarianza.media_x, covarianza.media_y = float(media_x), float(media_y)
+            covarianza.m2_x, covarianza.m2_y, covarianza.c = float(m2_x), float(m2_y), float(c)
+        return covarianza
+
+    def agregar(self, x: float, y: float):
+        """Incorpora un par"""
+        self.n += 1
+        delta_x = x - self.media_x
+        self.media_x += delta_x / self.n
+        delta_y = y - self.media_y
+        self.media_y += delta_y / self.n
+        self.m2_x += delta_x * (x - self.media_x)
+        self.m2_y += delta_y * (y - self.media_y)
+        self.c += delta_x * (y - self.media_y)
+
+    def combinar(self, otra: 'CovarianzaWelford'):
+        """Incorpora todos los pares resumidos en otra covarianza"""
+        if otra.n == 0:
+            return
+        if self.n == 0:
+            self.n, self.media_x, self.media_y = otra.n, otra.media_x, otra.media_y
+            self.m2_x, self.m2_y, self.c = otra.m2_x, otra.m2_y, otra.c
+            return
+        n = self.n + otra.n
+        delta_x = otra.media_x - self.media_x
+        delta_y = otra.media_y - self.media_y
+        factor = self.n * otra.n / n
+        self.media_x += delta_x * otra.n / n
+        self.media_y += delta_y * otra.n / n
+        self.m2_x += otra.m2_x + delta_x * delta_x * factor
+        self.m2_y += otra.m2_y + delta_y * delta_y * factor
+        self.c += otra.c + delta_x * delta_y * factor
+        self.n = n
+
+    def estimar_con_control(self, media_control: float) -> Tuple[float, float, float]:
+        """Estimador de la media de y ajustado con la variable de control x
+
+        ȳ - β (x̄ - media_control), con β = Cov(x, y) / Var(x) estimado de los datos.
+
+        Returns:
+            (estimación, semiancho del IC del 95%, reducción de varianza respecto de ȳ)
+        """
+        if self.n < 3 or self.m2_x == 0.0:
+            semiancho = Z_95 * math.sqrt(self.m2_y / (self.n - 1) / self.n) if self.n > 1 else math.inf
+            return self.media_y, semiancho, 1.0
+        beta = self.c / self.m2_x
+        estimacion = self.media_y - beta * (self.media_x - media_control)
+        # Varianza residual de la regresión de y sobre x
+        varianza_residual = max(self.m2_y - self.c * beta, 0.0) / (self.n - 2)
+        varianza_y = self.m2_y / (self.n - 1)
+        if varianza_residual == 0.0:
+            reduccion = math.inf if varianza_y > 0.0 else 1.0
+        else:
+            reduccion = varianza_y / varianza_residual
+        return estimacion, Z_95 * math.sqrt(varianza_residual / self.n), reduccion
+
+
+class AcumuladorDias:
+    """Acumula las estadísticas de cada día simulado sin guardar los días
+
+    Produce el mismo diccionario que SimulacionPeluqueria._calcular_estadisticas_agregadas,
+    con intervalos de confianza del 95% para la recaudación promedio, la ganancia
+    promedio (aproximación normal) y P(5 o más refrigerios) (Wilson, que no se anula
+    cuando ningún día o todos superan el umbral). Los acumuladores de distintos
+    procesos se combinan con combinar().
+
+    Con pares=True los días llegan de a pares antitéticos (2k-1, 2k): los intervalos
+    se calculan con el promedio de cada par, que son las observaciones independientes.
+
+    Con media_llegadas (la esperanza de 'clientes_llegados' por día), el resultado
+    incluye además las estimaciones con variable de control de la recaudación
+    promedio y de P(5 o más refrigerios), con sus intervalos.
+    """
+
+    def __init__(self, guardar_diarios: bool = True, pares: bool = False,
+                 media_llegadas: Optional[float] = None):
+        """
+        Args:
+            guardar_diarios: Si es True, guarda el diccionario de cada día en
+                'resultados_diarios'; si es False la memoria es constante
+            pares: Si es True, los días se agrupan en pares antitéticos consecutivos
+            media_llegadas: Esperanza de clientes llegados por día (variable de
+                control); None para no calcular las estimaciones ajustadas
+        """
+        self.recaudacion = EstadisticaWelford()
+        self.ganancia = EstadisticaWelford()
+        self.sillas = EstadisticaWelford()
+        self.refrigerios = EstadisticaWelford()
+        # Indicador 0/1 de "el día tuvo 5 o más refrigerios": su media es la probabilidad
+        self.refrigerios_umbral = EstadisticaWelford()
+        self.dias_5_o_mas = 0
+        # Promedios de cada par antitético (recaudación, ganancia, indicador de 5+ refrigerios)
+        self.pares = pares
+        self.pares_recaudacion = EstadisticaWelford()
+        self.pares_ganancia = EstadisticaWelford()
+        self.pares_refrigerios_umbral = EstadisticaWelford()
+        self._primero_del_par: Optional[Tuple[float, float, float]] = None
+        # Variable de control: clientes llegados contra recaudación e indicador de 5+ refrigerios
+        self.media_llegadas = media_llegadas
+        self.control_recaudacion = CovarianzaWelford()
+        self.control_refrigerios_umbral = CovarianzaWelford()
+        self.guardar_diarios = guardar_diarios
+        self.resultados_diarios: List[Dict] = []
+
+    def __len__(self):
+        return self.recaudacion.n
+
+    def agregar(self, stats: Dict):
+        """Incorpora las estadísticas de un día (diccionario de simular_dia)"""
+        self.recaudacion.agregar(stats['recaudacion'])
+        self.ganancia.agregar(stats['ganancia_neta'])
+        self.sillas.agregar(stats['max_sillas_necesarias'])
+        self.refrigerios.agregar(stats['clientes_con_refrigerio'])
+        supera_umbral = stats['clientes_con_refrigerio'] >= UMBRAL_REFRIGERIOS
+        self.refrigerios_umbral.agregar(1.0 if supera_umbral else 0.0)
+        self.dias_5_o_mas += supera_umbral
+        if self.media_llegadas is not None:
+            self.control_recaudacion.agregar(stats['clientes_llegados'], stats['recaudacion'])
+            self.control_refrigerios_umbral.agregar(stats['clientes_llegados'], 1.0 if supera_umbral else 0.0)
+        if self.pares:
+            valores = (stats['recaudacion'], stats['ganancia_neta'], 1.0 if supera_umbral else 0.0)
+            if self._primero_del_par is None:
+                self._primero_del_par = valores
+            else:
+                primero, self._primero_del_par = self._primero_del_par, None
+                self.pares_recaudacion.agregar((primero[0] + valores[0]) / 2)
+                self.pares_ganancia.agregar((primero[1] + valores[1]) / 2)
+                self.pares_refrigerios_umbral.agregar((primero[2] + valores[2]) / 2)
+        if self.guardar_diarios:
+            self.resultados_diarios.append(stats)
+
+    def combinar(self, otro: 'AcumuladorDias'):
+        """Incorpora los días de otro acumulador (los días guardados se agregan al final)"""
+        self.recaudacion.combinar(otro.recaudacion)
+        self.ganancia.combinar(otro.ganancia)
+        self.sillas.combinar(otro.sillas)
+        self.refrigerios.combinar(otro.refrigerios)
+        self.refrigerios_umbral.combinar(otro.refrigerios_umbral)
+        self.dias_5_o_mas += otro.dias_5_o_mas
+        self.pares_recaudacion.combinar(otro.pares_recaudacion)
+        self.pares_ganancia.combinar(otro.pares_ganancia)
+        self.pares_refrigerios_umbral.combinar(otro.pares_refrigerios_umbral)
+        self.control_recaudacion.combinar(otro.control_recaudacion)
+        self.control_refrigerios_umbral.combinar(otro.control_refrigerios_umbral)
+        if self.guardar_diarios:
+            self.resultados_diarios.extend(otro.resultados_diarios)
+
+    @property
+    def estimador_recaudacion(self) -> EstadisticaWelford:
+        """Observaciones independientes de la recaudación (días, o promedios de pares)"""
+        return self.pares_recaudacion if self.pares else self.recaudacion
+
+    @property
+    def estimador_ganancia(self) -> EstadisticaWelford:
+        """Observaciones independientes de la ganancia (días, o promedios de pares)"""
+        return self.pares_ganancia if self.pares else self.ganancia
+
+    @property
+    def estimador_refrigerios_umbral(self) -> EstadisticaWelford:
+        """Observaciones independientes del indicador de 5+ refrigerios (días, o promedios de pares)"""
+        return self.pares_refrigerios_umbral if self.pares else self.refrigerios_umbral
+
+    def intervalo_prob_refrigerios(self) -> Tuple[float, float]:
+        """Intervalo de Wilson del 95% para P(5 o más refrigerios)
+
+        Con pares antitéticos el tamaño efectivo es días x reducción de varianza de
+        los pares (los días, si la reducción no es finita: pares sin varianza).
+        """
+        num_dias = len(self)
+        if num_dias == 0:
+            return (0.0, 1.0)
+        n = num_dias
+        if self.pares:
+            reduccion = _reduccion_varianza(self.refrigerios_umbral, self.pares_refrigerios_umbral)
+            if math.isfinite(reduccion):
+                n = num_dias * reduccion
+        return intervalo_wilson(self.dias_5_o_mas / num_dias, n)
+
+    def semiancho_prob_refrigerios(self) -> float:
+        """Semiancho del intervalo de Wilson de P(5 o más refrigerios)"""
+        inferior, superior = self.intervalo_prob_refrigerios()
+        return (superior - inferior) / 2
+
+    def resultado(self) -> Dict:
+        """Diccionario de estadísticas agregadas ({} si no hay días)"""
+        num_dias = len(self)
+        if num_dias == 0:
+            return {}
+
+        dias_5_o_mas = self.dias_5_o_mas
+        resultado = {
+            'num_dias': num_dias,
+            'recaudacion_promedio': self.recaudacion.media,
+            'recaudacion_min': self.recaudacion.minimo,
+            'recaudacion_max': self.recaudacion.maximo,
+            'ganancia_promedio': self.ganancia.media,
+            'max_sillas_necesarias': int(self.sillas.maximo),
+            'sillas_promedio': self.sillas.media,
+            'refrigerios_promedio': self.refrigerios.media,
+            'prob_5_o_mas_refrigerios': dias_5_o_mas / num_dias,
+            'dias_5_o_mas_refrigerios': dias_5_o_mas,
+            'ic_recaudacion_promedio': self.estimador_recaudacion.intervalo_confianza(),
+            'ic_ganancia_promedio': self.estimador_ganancia.intervalo_confianza(),
+            'ic_prob_5_o_mas_refrigerios': self.intervalo_prob_refrigerios(),
+            'resultados_diarios': self.resultados_diarios
+        }
+        if self.media_llegadas is not None and not self.pares:
+            # Variable de control: los días con más llegadas recaudan más; se corrige la
+            # estimación por la diferencia entre las llegadas observadas y las esperadas
+            resultado['llegadas_esperadas'] = self.media_llegadas
+            for clave, control in (('recaudacion_promedio', self.control_recaudacion),
+                                   ('prob_5_o_mas_refrigerios', self.control_refrigerios_umbral)):
+                estimacion, semiancho, reduccion = control.estimar_con_control(self.media_llegadas)
+                resultado[clave + '_vc'] = estimacion
+                resultado['ic_' + clave + '_vc'] = (estimacion - semiancho, estimacion + semiancho)
+                resultado['reduccion_varianza_vc_' + clave] = reduccion
+        if self.pares:
+            # Varianza con días independientes / varianza con pares, a igual cantidad de días:
+            # > 1 significa que los pares antitéticos redujeron la varianza
+            resultado['reduccion_varianza_recaudacion'] = _reduccion_varianza(
+                self.recaudacion, self.pares_recaudacion)
+            resultado['reduccion_varianza_prob_5_o_mas'] = _reduccion_varianza(
+                self.refrigerios_umbral, self.pares_refrigerios_umbral)
+        return resultado
+
+
+def _reduccion_varianza(dias: EstadisticaWelford, pares: EstadisticaWelford) -> float:
+    """Factor de reducción de varianza de los pares antitéticos respecto de días independientes"""
+    if pares.varianza == 0.0:
+        return math.inf if dias.varianza > 0.0 else 1.0
+    return (dias.varianza / 2) / pares.varianza
+
+
+def sin_no_finitos(valor):
+    """Copia de un resultado con los floats infinitos o NaN reemplazados por None
+
+    Los resultados tienen infinitos legítimos (intervalos de un solo día, reducciones
+    de varianza con varianza nula), pero JSON estándar no los admite: json.dump los
+    escribiría como Infinity, que muchos lectores rechazan. Las tuplas quedan como
+    listas, igual que al serializarlas.
+    """
+    if isinstance(valor, float):
+        return valor if math.isfinite(valor) else None
+    if isinstance(valor, dict):
+        return {clave: sin_no_finitos(v) for clave, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [sin_no_finitos(v) for v in valor]
+    return valor
+
+
+@dataclass
+class ObjetivoPrecision:
+    """Criterio de parada secuencial de simular_multiples_dias
+
+    La simulación se detiene cuando todos los semianchos indicados (IC del 95%)
+    quedan por debajo del objetivo, o cuando se agota max_segundos. Los objetivos
+    en None no se controlan.
+    """
+    semiancho_recaudacion: Optional[float] = None  # En pesos
+    semiancho_prob_refrigerios: Optional[float] = None  # Probabilidad (0-1), ej. 0.01 = ±1 punto
+    max_segundos: Optional[float] = None
+    min_dias: int = 30  # Mínimo de días antes de confiar en la aproximación normal
+
+    def cumplido(self, acumulador: AcumuladorDias) -> bool:
+        """True si el acumulador ya alcanzó la precisión pedida"""
+        if len(acumulador) < self.min_dias:
+            return False
+        if self.semiancho_recaudacion is None and self.semiancho_prob_refrigerios is None:
+            return False
+        if (self.semiancho_recaudacion is not None
+                and acumulador.estimador_recaudacion.semiancho > self.semiancho_recaudacion):
+            return False
+        # Para la probabilidad, el semiancho de Wilson: el de Wald vale 0 mientras
+        # ningún día supere el umbral y pararía en min_dias con P = 0 ± 0
+        if (self.semiancho_prob_refrigerios is not None
+                and acumulador.semiancho_prob_refrigerios() > self.semiancho_prob_refrigerios):
+            return False
+        return True
+
+    def tiempo_agotado(self, inicio: float) -> bool:
+        """True si desde inicio (time.perf_counter) pasaron más de max_segundos"""
+        return self.max_segundos is not None and time.perf_counter() - inicio > self.max_segundos
+
+
+def llegadas_esperadas(jornada: float, minimo: float, maximo: float, pasos: int = 20000) -> float:
+    """Esperanza de la cantidad de llegadas en [0, jornada] con entre-llegadas U(minimo, maximo)
+
+    Es la función de renovación M(t) = F(t) + ∫ M(t - x) f(x) dx, que se resuelve
+    numéricamente sobre una grilla de paso jornada / pasos (regla del trapecio con la
+    integral acumulada de M).
+    """
+    if minimo <= 0:
+        raise ValueError("El tiempo mínimo entre llegadas debe ser mayor que 0")
+    if maximo <= minimo:
+        return float(math.floor(jornada / minimo))
+
+    # El paso tiene que ser menor que minimo para que M(t - minimo) ya esté calculado
+    pasos = max(pasos, math.ceil(4 * jornada / minimo))
+    h = jornada / pasos
+    ancho = maximo - minimo
+    m = [0.0] * (pasos + 1)  # M(k h)
+    integral = [0.0] * (pasos + 1)  # ∫_0^{k h} M(u) du
+
+    def integral_hasta(u):
+        """Integral acumulada de M en u (interpolación lineal entre nodos)"""
+        if u <= 0.0:
+            return 0.0
+        k = int(u / h)
+        if k >= pasos:
+            return integral[pasos]
+        fraccion = u / h - k
+        return integral[k] + fraccion * (integral[k + 1] - integral[k])
+
+    for k in range(1, pasos + 1):
+        t = k * h
+        f_acumulada = min(max((t - minimo) / ancho, 0.0), 1.0)
+        # ∫ M(t - x) f(x) dx = (1/ancho) ∫_{max(t-maximo,0)}^{t-minimo} M(u) du, que solo usa
+        # valores de M ya calculados porque t - minimo < t
+        convolucion = 0.0
+        if t > minimo:
+            convolucion = (integral_hasta(t - minimo) - integral_hasta(max(t - maximo, 0.0))) / ancho
+        m[k] = f_acumulada + convolucion
+        integral[k] = integral[k - 1] + h * (m[k - 1] + m[k]) / 2
+    return m[pasos]
@@ -3,26 +3,30 @@ Peluquería VIP - Aplicación de Simulación
 Interfaz gráfica con PyQt5
 """
 
+import time
+_INICIO_ARRANQUE = time.perf_counter()  # Para --medir-arranque: antes de importar PyQt5
+
+import os
 import sys
+import tempfile
 from datetime import datetime
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QLabel, QSpinBox, 
+                             QDoubleSpinBox, QCheckBox, 
                              QTableWidget, QTableWidgetItem, QGroupBox, 
                              QGridLayout, QHeaderView, QProgressBar, QTextEdit,
                              QSplitter, QTabWidget, QMessageBox, QFileDialog)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QThread
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QThread, QObject, QEvent
 from PyQt5.QtGui import QFont, QColor
 import random
 
-from simulacion import SimulacionPeluqueria, EstadoPeluquero
+from simulacion import SimulacionPeluqueria, EstadoPeluquero, NivelTraza
+from estadisticas import ObjetivoPrecision
+from cache_resultados import CacheResultados, clave_simulacion
 
-try:
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils import get_column_letter
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = False
+# openpyxl se importa recién al exportar (ver exportar_simulacion): tarda en cargar
+# y la mayoría de las sesiones no exportan
+_FIN_IMPORTS = time.perf_counter()
 
 
 class SimulacionThread(QThread):
@@ -31,30 +35,44 @@ class SimulacionThread(QThread):
     completado = pyqtSignal(dict)  # resultados
     dia_completado = pyqtSignal(dict, int)  # stats de un día, número de día
     
-    def __init__(self, num_dias, tiempo_max, max_iteraciones, params_modelo):
+    def __init__(self, num_dias, tiempo_max, max_iteraciones, params_modelo, num_procesos=1, objetivo=None,
+                 antiteticos=False, semilla=None, cache=None, clave=None, checkpoint=None):
         super().__init__()
-        self.num_dias = num_dias
+        self.num_dias = num_dias  # Con objetivo de precisión, es el máximo de días
         self.tiempo_max = tiempo_max
         self.max_iteraciones = max_iteraciones
         self.params_modelo = params_modelo
-        self.simulacion = SimulacionPeluqueria(**params_modelo)
+        self.num_procesos = num_procesos
+        self.objetivo = objetivo
+        self.antiteticos = antiteticos
+        self.semilla = semilla
+        self.cache = cache  # Si se indica, el resultado se guarda con la clave dada
+        self.clave = clave
+        self.checkpoint = checkpoint  # Archivo para reanudar la corrida si se cierra la aplicación
+        self.ultimo_dia = None
+        # Solo se muestra el vector del último día: los demás se simulan sin traza
+        self.simulacion = SimulacionPeluqueria(**params_modelo, nivel_traza=NivelTraza.COMPLETO)
     
     def run(self):
-        resultados = []
-        
-        for dia in range(self.num_dias):
-            stats = self.simulacion.simular_dia(self.tiempo_max, self.max_iteraciones)
-            stats['dia'] = dia + 1
-            resultados.append(stats)
-            
-            # Emitir evento de día completado (solo guardamos el último día)
-            if dia == self.num_dias - 1:
-                self.dia_completado.emit(stats, dia + 1)
-            
-            self.progreso.emit(dia + 1, self.num_dias)
-        
-        stats_agregadas = self.simulacion._calcular_estadisticas_agregadas(resultados)
+        stats_agregadas = self.simulacion.simular_multiples_dias(
+            self.num_dias, self.tiempo_max, self.max_iteraciones,
+            semilla=self.semilla, num_procesos=self.num_procesos, objetivo=self.objetivo,
+            al_completar_dia=self._al_completar_dia, antiteticos=self.antiteticos,
+            checkpoint=self.checkpoint)
+        if self.cache is not None and stats_agregadas:
+            try:
+                self.cache.guardar(self.clave, stats_agregadas)
+            except OSError as e:
+                print(f"⚠️  No se pudo guardar el resultado en la cache: {e}")
+        
+        # Emitir evento de día completado (solo guardamos el último día)
+        if self.ultimo_dia is not None:
+            self.dia_completado.emit(self.ultimo_dia, self.ultimo_dia['dia'])
         self.completado.emit(stats_agregadas)
+    
+    def _al_completar_dia(self, stats):
+        self.ultimo_dia = stats
+        self.progreso.emit(stats['dia'], self.num_dias)
 
 
 class PeluqueriaVIPApp(QMainWindow):
@@ -68,6 +86,16 @@ class PeluqueriaVIPApp(QMainWindow):
         self.simulacion = None  # Se creará con parámetros al ejecutar
         self.resultados = None
         self.ultima_simulacion = None  # Guardar referencia a la última simulación
+        # Cache de resultados en disco (solo para corridas con semilla)
+        try:
+            self.cache = CacheResultados()
+        except OSError as e:
+            print(f"⚠️  Cache de resultados deshabilitada: {e}")
+            self.cache = None
+        # Checkpoint de la corrida en curso: si la aplicación se cierra, la misma
+        # configuración se reanuda desde el último día guardado
+        directorio = self.cache.directorio if self.cache is not None else tempfile.gettempdir()
+        self.archivo_checkpoint = os.path.join(directorio, 'simulacion_en_curso.ckpt')
         self.init_ui()
     
     def init_ui(self):
@@ -105,28 +133,32 @@ class PeluqueriaVIPApp(QMainWindow):
         
         # Tabs para diferentes vistas
         tabs = QTabWidget()
+        self.tabs = tabs
         
-        # Tab 1: Vector de Estado
+        # Tab 1: Vector de Estado (visible al abrir)
         self.tab_vector = self._crear_tab_vector_estado()
         tabs.addTab(self.tab_vector, "📋 Vector de Estado")
         
-        # Tab 2: Resultados agregados
-        self.tab_resultados = self._crear_tab_resultados()
-        tabs.addTab(self.tab_resultados, "📊 Resultados Agregados")
-        
-        # Tab 3: Resultados por día
-        self.tab_diarios = self._crear_tab_diarios()
-        tabs.addTab(self.tab_diarios, "📅 Resultados Diarios")
-        
-        # Tab 4: Información del modelo
-        self.tab_info = self._crear_tab_informacion()
-        tabs.addTab(self.tab_info, "ℹ️ Información del Modelo")
+        # Tabs 2 a 4: se construyen la primera vez que se muestran (ver _mostrar_tab).
+        # Hasta entonces son un contenedor vacío; al construirse muestran el estado actual.
+        self._tabs_diferidos = {}
+        for atributo, titulo, crear, actualizar in (
+                ('tab_resultados', "📊 Resultados Agregados", self._crear_tab_resultados,
+                 self._actualizar_tab_resultados),
+                ('tab_diarios', "📅 Resultados Diarios", self._crear_tab_diarios,
+                 self._actualizar_tab_diarios),
+                ('tab_info', "ℹ️ Información del Modelo", self._crear_tab_informacion,
+                 self._actualizar_info_modelo)):
+            contenedor = QWidget()
+            contenedor.setLayout(QVBoxLayout())
+            contenedor.layout().setContentsMargins(0, 0, 0, 0)
+            setattr(self, atributo, contenedor)
+            self._tabs_diferidos[tabs.addTab(contenedor, titulo)] = (contenedor, crear, actualizar)
+        self._tabs_construidos = set()
+        tabs.currentChanged.connect(self._mostrar_tab)
         
         main_layout.addWidget(tabs)
         
-        # Actualizar información del modelo con valores iniciales
-        self._actualizar_info_modelo()
-        
         # Estilo
         self.setStyleSheet("""
             QMainWindow {
@@ -169,6 +201,22 @@ class PeluqueriaVIPApp(QMainWindow):
             }
         """)
     
+    def _mostrar_tab(self, indice):
+        """Construye un tab diferido la primera vez que se muestra"""
+        if indice not in self._tabs_diferidos:
+            return
+        contenedor, crear, actualizar = self._tabs_diferidos[indice]
+        if contenedor not in self._tabs_construidos:
+            contenedor.layout().addWidget(crear())
+            self._tabs_construidos.add(contenedor)
+            actualizar()
+        elif contenedor is self.tab_info:
+            actualizar()  # La información refleja los parámetros actuales del panel
+    
+    def _tab_construido(self, contenedor) -> bool:
+        """True si el tab diferido de ese contenedor ya se construyó"""
+        return contenedor in self._tabs_construidos
+    
     def _crear_panel_control(self):
         """Crea el panel de control"""
         group = QGroupBox()  # Sin título para ahorrar espacio
@@ -225,7 +273,81 @@ class PeluqueriaVIPApp(QMainWindow):
         self.spin_max_iter.setSingleStep(1000)
         self.spin_max_iter.setMinimumHeight(18)  # Reducido de 20 a 18
         self.spin_max_iter.setFont(font_spin)
-        layout.addWidget(self.spin_max_iter, row, 1, 1, 3)
+        layout.addWidget(self.spin_max_iter, row, 1)
+        
+        # Procesos en paralelo
+        lbl_procesos = QLabel("Procesos en paralelo:")
+        lbl_procesos.setFont(font_label)
+        layout.addWidget(lbl_procesos, row, 2)
+        self.spin_procesos = QSpinBox()
+        self.spin_procesos.setMinimum(1)
+        self.spin_procesos.setMaximum(os.cpu_count() or 1)
+        self.spin_procesos.setValue(os.cpu_count() or 1)
+        self.spin_procesos.setMinimumHeight(18)
+        self.spin_procesos.setFont(font_spin)
+        layout.addWidget(self.spin_procesos, row, 3)
+        row += 1
+        
+        # Parada por precisión: los días pasan a ser el máximo a simular
+        self.chk_precision = QCheckBox("Detener por precisión (IC 95%):")
+        self.chk_precision.setFont(font_label)
+        self.chk_precision.setToolTip("Simula hasta que los semianchos del IC 95% queden por debajo "
+                                      "del objetivo; el número de días pasa a ser el máximo")
+        layout.addWidget(self.chk_precision, row, 0)
+        self.spin_semiancho_recaudacion = QSpinBox()
+        self.spin_semiancho_recaudacion.setMinimum(100)
+        self.spin_semiancho_recaudacion.setMaximum(1000000)
+        self.spin_semiancho_recaudacion.setValue(10000)
+        self.spin_semiancho_recaudacion.setSingleStep(1000)
+        self.spin_semiancho_recaudacion.setPrefix("Recaudación ± $")
+        self.spin_semiancho_recaudacion.setMinimumHeight(18)
+        self.spin_semiancho_recaudacion.setFont(font_spin)
+        layout.addWidget(self.spin_semiancho_recaudacion, row, 1)
+        self.spin_semiancho_prob = QDoubleSpinBox()
+        self.spin_semiancho_prob.setMinimum(0.1)
+        self.spin_semiancho_prob.setMaximum(50.0)
+        self.spin_semiancho_prob.setValue(2.0)
+        self.spin_semiancho_prob.setSingleStep(0.5)
+        self.spin_semiancho_prob.setPrefix("P(5+) ± ")
+        self.spin_semiancho_prob.setSuffix(" %")
+        self.spin_semiancho_prob.setMinimumHeight(18)
+        self.spin_semiancho_prob.setFont(font_spin)
+        layout.addWidget(self.spin_semiancho_prob, row, 2)
+        self.spin_max_segundos = QSpinBox()
+        self.spin_max_segundos.setMinimum(0)
+        self.spin_max_segundos.setMaximum(3600)
+        self.spin_max_segundos.setValue(0)
+        self.spin_max_segundos.setSuffix(" s")
+        self.spin_max_segundos.setSpecialValueText("Sin límite de tiempo")
+        self.spin_max_segundos.setMinimumHeight(18)
+        self.spin_max_segundos.setFont(font_spin)
+        layout.addWidget(self.spin_max_segundos, row, 3)
+        for spin in (self.spin_semiancho_recaudacion, self.spin_semiancho_prob, self.spin_max_segundos):
+            spin.setEnabled(False)
+            self.chk_precision.toggled.connect(spin.setEnabled)
+        row += 1
+        
+        # Variables antitéticas: días de a pares con uniformes U y 1 - U
+        self.chk_antiteticos = QCheckBox("Pares de días antitéticos (reduce la varianza)")
+        self.chk_antiteticos.setFont(font_label)
+        self.chk_antiteticos.setToolTip("Cada par de días usa las uniformes U y 1 - U; "
+                                        "si el número de días es impar se simula uno más")
+        layout.addWidget(self.chk_antiteticos, row, 0, 1, 2)
+        
+        # Semilla: con semilla la corrida es reproducible y su resultado se guarda en la cache
+        lbl_semilla = QLabel("Semilla:")
+        lbl_semilla.setFont(font_label)
+        layout.addWidget(lbl_semilla, row, 2)
+        self.spin_semilla = QSpinBox()
+        self.spin_semilla.setMinimum(0)
+        self.spin_semilla.setMaximum(2147483647)
+        self.spin_semilla.setValue(0)
+        self.spin_semilla.setSpecialValueText("Al azar")
+        self.spin_semilla.setToolTip("Con una semilla, repetir la simulación con los mismos parámetros "
+                                     "devuelve el resultado guardado sin volver a simular")
+        self.spin_semilla.setMinimumHeight(18)
+        self.spin_semilla.setFont(font_spin)
+        layout.addWidget(self.spin_semilla, row, 3)
         row += 1
         
         # ===== SECCIÓN: PARÁMETROS DEL MODELO =====
@@ -677,7 +799,6 @@ class PeluqueriaVIPApp(QMainWindow):
         
         self.info_text = QTextEdit()
         self.info_text.setReadOnly(True)
-        self._actualizar_info_modelo()
         
         layout.addWidget(self.info_text)
         widget.setLayout(layout)
@@ -988,6 +1109,16 @@ class PeluqueriaVIPApp(QMainWindow):
         num_dias = self.spin_dias.value()
         tiempo_max = self.spin_tiempo_max.value()
         max_iter = self.spin_max_iter.value()
+        num_procesos = self.spin_procesos.value()
+        antiteticos = self.chk_antiteticos.isChecked()
+        if antiteticos and num_dias % 2:
+            num_dias += 1  # Los días antitéticos van de a pares
+        objetivo = None
+        if self.chk_precision.isChecked():
+            objetivo = ObjetivoPrecision(
+                semiancho_recaudacion=self.spin_semiancho_recaudacion.value(),
+                semiancho_prob_refrigerios=self.spin_semiancho_prob.value() / 100.0,
+                max_segundos=self.spin_max_segundos.value() or None)
         
         # Recoger parámetros del modelo desde la UI
         params_modelo = {
@@ -1004,11 +1135,31 @@ class PeluqueriaVIPApp(QMainWindow):
             'tiempo_refrigerio': self.spin_tiempo_refrig.value()
         }
         
+        # Con semilla, buscar el resultado en la cache (salvo con límite de tiempo, que no es reproducible)
+        semilla = self.spin_semilla.value() or None
+        clave = None
+        if semilla is not None and self.cache is not None and (objetivo is None or objetivo.max_segundos is None):
+            simulacion = SimulacionPeluqueria(**params_modelo, nivel_traza=NivelTraza.COMPLETO)
+            clave = clave_simulacion(simulacion.params_modelo, num_dias, semilla, tiempo_max, max_iter,
+                                     antiteticos, objetivo)
+            resultados = self.cache.obtener(clave)
+            if resultados is not None:
+                # El vector de estado del último día se recupera volviendo a simular solo ese día
+                simulacion.repetir_dia(resultados['num_dias'], semilla, tiempo_max, max_iter, antiteticos)
+                self.ultima_simulacion = simulacion
+                resultados['desde_cache'] = True
+                self._mostrar_resultados(resultados)
+                return
+        
         # Deshabilitar controles
         self.btn_simular.setEnabled(False)
         self.spin_dias.setEnabled(False)
         self.spin_tiempo_max.setEnabled(False)
         self.spin_max_iter.setEnabled(False)
+        self.spin_procesos.setEnabled(False)
+        self.chk_precision.setEnabled(False)
+        self.chk_antiteticos.setEnabled(False)
+        self.spin_semilla.setEnabled(False)
         
         # Mostrar barra de progreso
         self.progress_bar.setVisible(True)
@@ -1016,7 +1167,9 @@ class PeluqueriaVIPApp(QMainWindow):
         self.progress_bar.setMaximum(num_dias)
         
         # Crear y ejecutar thread
-        self.sim_thread = SimulacionThread(num_dias, tiempo_max, max_iter, params_modelo)
+        self.sim_thread = SimulacionThread(num_dias, tiempo_max, max_iter, params_modelo, num_procesos, objetivo,
+                                           antiteticos, semilla, self.cache if clave else None, clave,
+                                           self.archivo_checkpoint)
         self.sim_thread.progreso.connect(self._actualizar_progreso)
         self.sim_thread.completado.connect(self._mostrar_resultados)
         self.sim_thread.dia_completado.connect(self._guardar_ultima_simulacion)
@@ -1035,6 +1188,71 @@ class PeluqueriaVIPApp(QMainWindow):
         """Muestra los resultados de la simulación"""
         self.resultados = resultados
         
+        # Los tabs de resultados solo se actualizan si ya se construyeron
+        self._actualizar_tab_resultados()
+        self._actualizar_tab_diarios()
+        
+        # Ocultar progreso y habilitar controles
+        self.progress_bar.setVisible(False)
+        self.btn_simular.setEnabled(True)
+        self.spin_dias.setEnabled(True)
+        self.spin_tiempo_max.setEnabled(True)
+        self.spin_max_iter.setEnabled(True)
+        self.spin_procesos.setEnabled(True)
+        self.chk_precision.setEnabled(True)
+        self.chk_antiteticos.setEnabled(True)
+        self.spin_semilla.setEnabled(True)
+        self.btn_actualizar_vector.setEnabled(True)
+        self.btn_exportar.setEnabled(True)
+        
+        # Actualizar el vector de estado
+        self.actualizar_vector_estado()
+        
+        # Mostrar mensaje de completado
+        # Con parada por precisión, informar por qué se detuvo
+        motivos = {
+            'precision': "Se alcanzó la precisión pedida",
+            'tiempo': "Se agotó el tiempo máximo",
+            'dias': "Se alcanzó el máximo de días sin llegar a la precisión pedida",
+        }
+        parada = f"{motivos[resultados['criterio_parada']]}.\n" if 'criterio_parada' in resultados else ""
+        if resultados.get('reanudado_desde_dia'):
+            parada += f"Reanudada desde el día {resultados['reanudado_desde_dia']} (corrida interrumpida).\n"
+        if resultados.get('desde_cache'):
+            parada += "Resultado recuperado de la cache (misma configuración y semilla).\n"
+        if 'reduccion_varianza_recaudacion' in resultados:
+            parada += (f"Pares antitéticos: varianza de la recaudación "
+                       f"{resultados['reduccion_varianza_recaudacion']:.1f} veces menor.\n")
+        
+        QMessageBox.information(
+            self,
+            "Simulación Completada",
+            f"Se han simulado {resultados['num_dias']} días exitosamente.\n{parada}\n"
+            f"Recaudación promedio: ${resultados['recaudacion_promedio']:,.2f}\n"
+            f"Sillas necesarias: {resultados['max_sillas_necesarias']}\n"
+            f"Prob. 5+ refrigerios: {resultados['prob_5_o_mas_refrigerios']*100:.2f}%"
+        )
+    
+    def _actualizar_tab_resultados(self):
+        """Muestra self.resultados en el tab de resultados agregados (si ya se construyó)"""
+        if not self._tab_construido(self.tab_resultados):
+            return
+        resultados = self.resultados
+        if not resultados:
+            self.lbl_num_dias.setText("N/A")
+            self.lbl_recaudacion_prom.setText("N/A")
+            self.lbl_recaudacion_min.setText("N/A")
+            self.lbl_recaudacion_max.setText("N/A")
+            self.lbl_ganancia_prom.setText("N/A")
+            self.lbl_sillas_prom.setText("N/A")
+            self.lbl_refrig_prom.setText("N/A")
+            self.lbl_dias_5_mas.setText("N/A")
+            
+            self.lbl_resp1.setText("<b style='font-size:15px;'>¿Cuál es el promedio de recaudación diaria?</b><br/><span style='font-size:20px; color:#2196F3;'>N/A</span>")
+            self.lbl_resp2.setText("<b style='font-size:15px;'>¿Cantidad de sillas necesarias?</b><br/><span style='font-size:20px; color:#2196F3;'>N/A</span>")
+            self.lbl_resp3.setText("<b style='font-size:15px;'>¿Probabilidad de 5+ refrigerios en un día?</b><br/><span style='font-size:20px; color:#2196F3;'>N/A</span>")
+            return
+        
         # Actualizar estadísticas generales
         self.lbl_num_dias.setText(f"{resultados['num_dias']}")
         self.lbl_recaudacion_prom.setText(f"${resultados['recaudacion_promedio']:,.2f}")
@@ -1043,17 +1261,23 @@ class PeluqueriaVIPApp(QMainWindow):
         self.lbl_ganancia_prom.setText(f"${resultados['ganancia_promedio']:,.2f}")
         
         # Actualizar respuestas
+        ic_inf, ic_sup = resultados['ic_recaudacion_promedio']
         self.lbl_resp1.setText(
             f"<b style='font-size:15px;'>¿Cuál es el promedio de recaudación diaria?</b><br/>"
-            f"<span style='font-size:20px; color:#2196F3; font-weight:bold;'>${resultados['recaudacion_promedio']:,.2f}</span>"
+            f"<span style='font-size:20px; color:#2196F3; font-weight:bold;'>${resultados['recaudacion_promedio']:,.2f}</span><br/>"
+            f"<span style='font-size:11px;'>IC 95%: ${ic_inf:,.2f} – ${ic_sup:,.2f}</span>"
+            + self._texto_variable_control(resultados, 'recaudacion_promedio', "${:,.2f}")
         )
         self.lbl_resp2.setText(
             f"<b style='font-size:15px;'>¿Cantidad de sillas necesarias?</b><br/>"
             f"<span style='font-size:20px; color:#2196F3; font-weight:bold;'>{resultados['max_sillas_necesarias']} sillas</span>"
         )
+        ic_inf, ic_sup = resultados['ic_prob_5_o_mas_refrigerios']
         self.lbl_resp3.setText(
             f"<b style='font-size:15px;'>¿Probabilidad de 5+ refrigerios en un día?</b><br/>"
-            f"<span style='font-size:20px; color:#2196F3; font-weight:bold;'>{resultados['prob_5_o_mas_refrigerios']*100:.2f}%</span>"
+            f"<span style='font-size:20px; color:#2196F3; font-weight:bold;'>{resultados['prob_5_o_mas_refrigerios']*100:.2f}%</span><br/>"
+            f"<span style='font-size:11px;'>IC 95%: {max(ic_inf, 0.0)*100:.2f}% – {min(ic_sup, 1.0)*100:.2f}%</span>"
+            + self._texto_variable_control(resultados, 'prob_5_o_mas_refrigerios', "{:.2%}")
         )
         
         # Actualizar estadísticas adicionales
@@ -1063,31 +1287,21 @@ class PeluqueriaVIPApp(QMainWindow):
             f"{resultados['dias_5_o_mas_refrigerios']} de {resultados['num_dias']} "
             f"({resultados['dias_5_o_mas_refrigerios']*100/resultados['num_dias']:.1f}%)"
         )
-        
-        # Actualizar tabla de resultados diarios
-        self._actualizar_tabla_diarios(resultados['resultados_diarios'])
-        
-        # Ocultar progreso y habilitar controles
-        self.progress_bar.setVisible(False)
-        self.btn_simular.setEnabled(True)
-        self.spin_dias.setEnabled(True)
-        self.spin_tiempo_max.setEnabled(True)
-        self.spin_max_iter.setEnabled(True)
-        self.btn_actualizar_vector.setEnabled(True)
-        self.btn_exportar.setEnabled(True)
-        
-        # Actualizar el vector de estado
-        self.actualizar_vector_estado()
-        
-        # Mostrar mensaje de completado
-        QMessageBox.information(
-            self,
-            "Simulación Completada",
-            f"Se han simulado {resultados['num_dias']} días exitosamente.\n\n"
-            f"Recaudación promedio: ${resultados['recaudacion_promedio']:,.2f}\n"
-            f"Sillas necesarias: {resultados['max_sillas_necesarias']}\n"
-            f"Prob. 5+ refrigerios: {resultados['prob_5_o_mas_refrigerios']*100:.2f}%"
-        )
+    
+    def _actualizar_tab_diarios(self):
+        """Muestra los días de self.resultados en su tab (si ya se construyó)"""
+        if not self._tab_construido(self.tab_diarios):
+            return
+        self._actualizar_tabla_diarios(self.resultados['resultados_diarios'] if self.resultados else [])
+    
+    def _texto_variable_control(self, resultados, clave, formato):
+        """Línea con la estimación ajustada por variable de control (vacía si no se calculó)"""
+        if clave + '_vc' not in resultados:
+            return ""
+        ic_inf, ic_sup = resultados['ic_' + clave + '_vc']
+        return (f"<br/><span style='font-size:11px;'>Con variable de control (llegadas): "
+                f"{formato.format(resultados[clave + '_vc'])} "
+                f"(IC 95%: {formato.format(ic_inf)} – {formato.format(ic_sup)})</span>")
     
     def _actualizar_tabla_diarios(self, resultados_diarios):
         """Actualiza la tabla de resultados diarios"""
@@ -1351,23 +1565,8 @@ class PeluqueriaVIPApp(QMainWindow):
         """Limpia los resultados mostrados"""
         self.resultados = None
         self.ultima_simulacion = None
-        
-        # Limpiar labels
-        self.lbl_num_dias.setText("N/A")
-        self.lbl_recaudacion_prom.setText("N/A")
-        self.lbl_recaudacion_min.setText("N/A")
-        self.lbl_recaudacion_max.setText("N/A")
-        self.lbl_ganancia_prom.setText("N/A")
-        self.lbl_sillas_prom.setText("N/A")
-        self.lbl_refrig_prom.setText("N/A")
-        self.lbl_dias_5_mas.setText("N/A")
-        
-        self.lbl_resp1.setText("<b style='font-size:15px;'>¿Cuál es el promedio de recaudación diaria?</b><br/><span style='font-size:20px; color:#2196F3;'>N/A</span>")
-        self.lbl_resp2.setText("<b style='font-size:15px;'>¿Cantidad de sillas necesarias?</b><br/><span style='font-size:20px; color:#2196F3;'>N/A</span>")
-        self.lbl_resp3.setText("<b style='font-size:15px;'>¿Probabilidad de 5+ refrigerios en un día?</b><br/><span style='font-size:20px; color:#2196F3;'>N/A</span>")
-        
-        # Limpiar tablas
-        self.tabla_diarios.setRowCount(0)
+        self._actualizar_tab_resultados()
+        self._actualizar_tab_diarios()
         self.tabla_vector.setRowCount(0)
         
         # Deshabilitar botones
@@ -1376,7 +1575,9 @@ class PeluqueriaVIPApp(QMainWindow):
     
     def exportar_simulacion(self):
         """Exporta la simulación a un archivo Excel"""
-        if not OPENPYXL_AVAILABLE:
+        try:
+            import openpyxl  # noqa: F401 (solo se verifica que esté instalado)
+        except ImportError:
             QMessageBox.warning(
                 self,
                 "Biblioteca No Disponible",
@@ -1425,6 +1626,10 @@ class PeluqueriaVIPApp(QMainWindow):
     
     def _exportar_a_excel(self, archivo):
         """Exporta los datos a un archivo Excel"""
+        from openpyxl import Workbook
+        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+        from openpyxl.utils import get_column_letter
+        
         wb = Workbook()
         
         # Estilos
@@ -1709,10 +1914,32 @@ class PeluqueriaVIPApp(QMainWindow):
         wb.save(archivo)
 
 
+class _MedidorArranque(QObject):
+    """Con --medir-arranque: informa los tiempos hasta el primer pintado de la ventana y sale"""
+    
+    def __init__(self, app, fin_ventana):
+        super().__init__()
+        self.app = app
+        self.fin_ventana = fin_ventana
+    
+    def eventFilter(self, objeto, evento):
+        if evento.type() == QEvent.Paint:
+            ahora = time.perf_counter()
+            print(f"imports_ms={(_FIN_IMPORTS - _INICIO_ARRANQUE) * 1000:.1f} "
+                  f"ventana_ms={(self.fin_ventana - _FIN_IMPORTS) * 1000:.1f} "
+                  f"primer_pintado_ms={(ahora - _INICIO_ARRANQUE) * 1000:.1f}")
+            objeto.removeEventFilter(self)
+            QTimer.singleShot(0, self.app.quit)
+        return False
+
+
 def main():
     """Función principal"""
     app = QApplication(sys.argv)
     ventana = PeluqueriaVIPApp()
+    if '--medir-arranque' in sys.argv:
+        medidor = _MedidorArranque(app, time.perf_counter())
+        ventana.installEventFilter(medidor)
     ventana.show()
     sys.exit(app.exec_())
 
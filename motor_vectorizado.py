@@ -0,0 +1,188 @@
+"""
+Simulación de Peluquería VIP
+Motor vectorizado con NumPy: simula lotes de días independientes a la vez
+"""
+
+import math
+
+from estadisticas import UMBRAL_REFRIGERIOS, AcumuladorDias, CovarianzaWelford, EstadisticaWelford
+from simulacion import SimulacionPeluqueria
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def simular_dias_vectorizado(num_dias, semilla=None, tiempo_max=None, tamano_lote=5000,
+                             guardar_diarios=False, **params_modelo):
+    """Simula num_dias días en lotes, avanzando todos los días de un lote a la vez
+
+    Cada peluquero atiende su propia cola FIFO, así que el día se reduce a la
+    recurrencia inicio_k = max(llegada_k, libre[peluquero_k]) aplicada cliente por
+    cliente sobre arrays (clientes × días del lote). Las reglas son las del motor
+    de eventos de SimulacionPeluqueria: llegadas hasta la jornada laboral,
+    recaudación al iniciar la atención, refrigerio si la espera supera
+    TIEMPO_REFRIGERIO y corte en tiempo_max. No hay vector de estado ni
+    max_iteraciones.
+
+    Args:
+        num_dias: Cantidad de días a simular
+        semilla: Semilla del generador de NumPy (None = no reproducible)
+        tiempo_max: Tiempo máximo de simulación por día (por defecto 2 jornadas)
+        tamano_lote: Días simulados juntos (acota la memoria: ~50 bytes × clientes por día)
+        guardar_diarios: Si es True, 'resultados_diarios' contiene un dict por día
+        **params_modelo: Parámetros de SimulacionPeluqueria
+
+    Returns:
+        Diccionario con la misma forma que SimulacionPeluqueria._calcular_estadisticas_agregadas
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("El motor vectorizado requiere numpy (pip install numpy)")
+    if num_dias <= 0:
+        return {}
+
+    modelo = SimulacionPeluqueria(**params_modelo)
+    if modelo.TIEMPO_LLEGADA_MIN <= 0:
+        raise ValueError("El tiempo mínimo entre llegadas debe ser mayor que 0")
+    if tiempo_max is None:
+        tiempo_max = modelo.JORNADA_LABORAL * 2
+
+    # Última llegada posible y cantidad máxima de clientes en un día
+    limite_llegadas = min(modelo.JORNADA_LABORAL, tiempo_max)
+    max_clientes = int(math.floor(limite_llegadas / modelo.TIEMPO_LLEGADA_MIN)) + 1
+
+    rng = np.random.default_rng(semilla)
+
+    media_llegadas = modelo.llegadas_esperadas() if tiempo_max >= modelo.JORNADA_LABORAL else None
+    acumulador = AcumuladorDias(guardar_diarios, media_llegadas=media_llegadas)
+
+    for inicio_lote in range(0, num_dias, tamano_lote):
+        n = min(tamano_lote, num_dias - inicio_lote)
+        dia = _simular_lote(modelo, rng, n, max_clientes, limite_llegadas, tiempo_max)
+
+        # Cada lote se resume con NumPy y se combina en el acumulador
+        lote = AcumuladorDias(guardar_diarios, media_llegadas=media_llegadas)
+        lote.recaudacion = _resumir(dia['recaudacion'])
+        lote.ganancia = _resumir(dia['ganancia_neta'])
+        lote.sillas = _resumir(dia['max_sillas_necesarias'])
+        lote.refrigerios = _resumir(dia['clientes_con_refrigerio'])
+        supera_umbral = dia['clientes_con_refrigerio'] >= UMBRAL_REFRIGERIOS
+        lote.refrigerios_umbral = _resumir(supera_umbral)
+        lote.dias_5_o_mas = int(supera_umbral.sum())
+        lote.control_recaudacion = _resumir_pares(dia['clientes_llegados'], dia['recaudacion'])
+        lote.control_refrigerios_umbral = _resumir_pares(dia['clientes_llegados'], supera_umbral)
+
+        if guardar_diarios:
+            columnas = {clave: valores.tolist() for clave, valores in dia.items()}
+            for i in range(n):
+                stats = {clave: valores[i] for clave, valores in columnas.items()}
+                stats['dia'] = inicio_lote + i + 1
+                lote.resultados_diarios.append(stats)
+
+        acumulador.combinar(lote)
+
+    return acumulador.resultado()
+
+
+def _resumir(valores):
+    """EstadisticaWelford de un array de valores del lote"""
+    valores = valores.astype(float)
+    media = valores.mean()
+    return EstadisticaWelford.desde_resumen(len(valores), media, ((valores - media) ** 2).sum(),
+                                            valores.min(), valores.max())
+
+
+def _resumir_pares(x, y):
+    """CovarianzaWelford de dos arrays de valores del lote"""
+    desvio_x = x - x.mean()
+    desvio_y = y - y.mean()
+    return CovarianzaWelford.desde_resumen(len(x), x.mean(), y.mean(), (desvio_x ** 2).sum(),
+                                           (desvio_y ** 2).sum(), (desvio_x * desvio_y).sum())
+
+
+def _simular_lote(modelo, rng, n, max_clientes, limite_llegadas, tiempo_max):
+    """Simula n días en paralelo y devuelve un array por estadística del día
+
+    Los arrays son (clientes × días): la fila k tiene el k-ésimo cliente de cada día,
+    contigua en memoria para la recurrencia cliente por cliente.
+    """
+    peluqueros = modelo.peluqueros
+    num_peluqueros = len(peluqueros)
+    t_min = np.array([p.tiempo_min for p in peluqueros], dtype=float)
+    t_max = np.array([p.tiempo_max for p in peluqueros], dtype=float)
+    tarifas = np.array([p.tarifa for p in peluqueros], dtype=float)
+    prob_acum = np.cumsum([p.probabilidad for p in peluqueros[:-1]])
+
+    # Llegadas: U(min, max) acumuladas; solo cuentan las que caen dentro de la jornada
+    forma = (max_clientes, n)
+    rnd_llegada = rng.random(forma)
+    entre_llegadas = modelo.TIEMPO_LLEGADA_MIN + rnd_llegada * (modelo.TIEMPO_LLEGADA_MAX - modelo.TIEMPO_LLEGADA_MIN)
+    llegada = np.cumsum(entre_llegadas, axis=0)
+    activo = llegada <= limite_llegadas
+
+    # Asignación (misma regla que _seleccionar_peluquero_con_rnd: rnd <= acumulada)
+    rnd_asignacion = rng.random(forma)
+    peluquero = np.zeros(forma, dtype=np.intp)
+    for acumulada in prob_acum:
+        peluquero += rnd_asignacion > acumulada
+    servicio = t_min[peluquero] + rng.random(forma) * (t_max - t_min)[peluquero]
+
+    # Recurrencia FIFO por peluquero, un cliente a la vez para todos los días del lote.
+    # libre[d * num_peluqueros + b] = hora en que el peluquero b del día d queda libre.
+    # Los clientes inactivos (después de la jornada) también actualizan libre, pero
+    # como las llegadas son crecientes ningún cliente activo viene después de ellos.
+    base = np.arange(n) * num_peluqueros
+    libre = np.zeros(n * num_peluqueros)
+    inicio = np.empty(forma)
+    for k in range(max_clientes):
+        indice = base + peluquero[k]
+        inicio_k = np.maximum(llegada[k], libre.take(indice))
+        inicio[k] = inicio_k
+        libre.put(indice, inicio_k + servicio[k])
+    fin = inicio + servicio
+
+    atendido = activo & (inicio <= tiempo_max)
+    finalizado = activo & (fin <= tiempo_max)
+    hora_refrigerio = llegada + modelo.TIEMPO_REFRIGERIO
+    refrigerio = activo & (hora_refrigerio < inicio) & (hora_refrigerio <= tiempo_max)
+
+    recaudacion = np.where(atendido, tarifas[peluquero], 0.0).sum(axis=0)
+    refrigerios = refrigerio.sum(axis=0)
+    costo = refrigerios * modelo.COSTO_REFRIGERIO
+
+    # Clientes esperando al llegar el cliente k = (k + 1) - (atenciones iniciadas hasta
+    # su llegada). Las atenciones iniciadas se cuentan con un searchsorted sobre los
+    # inicios ordenados de cada día, desplazados por día para buscar en un solo array.
+    # Recortar en tope (mayor que cualquier llegada activa) deja ordenadas también las
+    # consultas, que es el caso rápido de searchsorted.
+    tope = limite_llegadas + 1.0
+    inicios = np.sort(np.where(activo, np.minimum(inicio, tope), tope), axis=0)
+    desplazamiento = np.arange(n) * (tope + 1.0)
+    iniciados = np.searchsorted((inicios + desplazamiento).ravel(order='F'),
+                                (np.minimum(llegada, tope) + desplazamiento).ravel(order='F'),
+                                side='right')
+    iniciados = iniciados.reshape(n, max_clientes).T - np.arange(n) * max_clientes
+    en_espera = np.arange(1, max_clientes + 1)[:, None] - iniciados
+    max_sillas = np.where(activo, en_espera, 0).max(axis=0)
+
+    # Eventos procesados y hora del último (como iteraciones / tiempo_fin del motor de eventos)
+    iteraciones = activo.sum(axis=0) + finalizado.sum(axis=0) + refrigerios
+    tiempo_fin = np.maximum.reduce([
+        np.where(activo, llegada, 0.0).max(axis=0),
+        np.where(finalizado, fin, 0.0).max(axis=0),
+        np.where(refrigerio, hora_refrigerio, 0.0).max(axis=0),
+    ])
+
+    return {
+        'recaudacion': recaudacion,
+        'costo_refrigerios': costo,
+        'ganancia_neta': recaudacion - costo,
+        'clientes_atendidos': finalizado.sum(axis=0),
+        'clientes_con_refrigerio': refrigerios,
+        'clientes_llegados': activo.sum(axis=0),
+        'max_sillas_necesarias': max_sillas,
+        'tiempo_fin': tiempo_fin,
+        'iteraciones': iteraciones
+    }
@@ -0,0 +1,241 @@
+"""
+Simulación de Peluquería VIP
+Muestreo de importancia para P(5 o más refrigerios): estimador experimental
+
+No es un modo acelerado. Contando los días del piloto, la reducción de varianza
+medida queda alrededor de 1 (entre 0.1x y 3x según la semilla con
+tiempo_refrigerio=90) y con P ≈ 2e-4 la inclinación no llega al evento: el
+resultado sale marcado como no confiable. La referencia sigue siendo
+simular_multiples_dias con su intervalo de Wilson.
+"""
+
+import math
+import random
+from typing import Dict, Optional, Tuple
+
+from estadisticas import UMBRAL_REFRIGERIOS, Z_95, EstadisticaWelford
+from simulacion import NivelTraza, SimulacionPeluqueria, semilla_dia
+
+
+class GeneradorInclinado:
+    """Uniformes inclinadas exponencialmente, con su razón de verosimilitud acumulada
+
+    Envuelve un random.Random y devuelve V en [0, 1) con densidad
+    h(v) = λ e^(-λ v) / (1 - e^(-λ)). Con λ > 0 favorece valores chicos (entre-llegadas
+    cortas) y con λ < 0 valores grandes (servicios largos); λ = 0 es la uniforme.
+    log_razon acumula log(1 / h(V)) de todas las uniformes entregadas.
+    """
+    __slots__ = ('base', 'inclinacion', 'log_razon', 'suma', 'cantidad', '_escala', '_log_normalizacion')
+
+    def __init__(self, base: random.Random, inclinacion: float):
+        self.base = base
+        self.inclinacion = inclinacion
+        self.log_razon = 0.0
+        self.suma = 0.0  # Suma de las V entregadas (para ajustar la inclinación)
+        self.cantidad = 0
+        if inclinacion != 0.0:
+            self._escala = -math.expm1(-inclinacion)  # 1 - e^(-λ), con el signo de λ
+            self._log_normalizacion = math.log(self._escala / inclinacion)
+
+    def random(self) -> float:
+        u = self.base.random()
+        self.cantidad += 1
+        if self.inclinacion == 0.0:
+            self.suma += u
+            return u
+        v = -math.log1p(-u * self._escala) / self.inclinacion
+        self.log_razon += self.inclinacion * v + self._log_normalizacion
+        self.suma += v
+        return v
+
+
+def media_inclinada(inclinacion: float) -> float:
+    """Media de V bajo la densidad de GeneradorInclinado"""
+    if abs(inclinacion) < 1e-8:
+        return 0.5
+    return 1.0 / inclinacion - 1.0 / math.expm1(inclinacion)
+
+
+def inclinacion_para_media(media: float) -> float:
+    """Inclinación λ cuya media de V es la pedida (bisección; media_inclinada es decreciente)"""
+    media = min(max(media, 0.01), 0.99)
+    inferior, superior = -100.0, 100.0
+    for _ in range(100):
+        medio = (inferior + superior) / 2
+        if media_inclinada(medio) > media:
+            inferior = medio
+        else:
+            superior = medio
+    return (inferior + superior) / 2
+
+
+# Fuentes de azar que se inclinan y el signo con que se aplica su inclinación: una
+# inclinación positiva acorta las entre-llegadas y alarga los servicios. La asignación
+# no se inclina: una uniforme exponencial sobre la lista de peluqueros solo corre la
+# probabilidad hacia un extremo (el Veterano B) y se aleja del Aprendiz, que es quien
+# acumula la mayoría de los refrigerios
+FUENTES = (('rng_llegadas', 1.0), ('rng_servicio', -1.0))
+
+# Mínimos para considerar confiable una estimación: con pocos días con evento o un
+# tamaño de muestra efectivo chico la varianza estimada no sirve y el intervalo tampoco
+MIN_DIAS_CON_EVENTO = 30
+MIN_MUESTRA_EFECTIVA = 10
+
+
+def _simular_dia_inclinado(sim: SimulacionPeluqueria, semilla, inclinaciones: Tuple[float, float],
+                           tiempo_max, max_iteraciones):
+    """Simula un día con las fuentes de azar de FUENTES inclinadas
+
+    Returns:
+        (estadísticas del día, razón de verosimilitud, generadores inclinados por fuente)
+    """
+    sim.sembrar(semilla)
+    generadores = []
+    for (atributo, signo), inclinacion in zip(FUENTES, inclinaciones):
+        generador = GeneradorInclinado(getattr(sim, atributo), signo * inclinacion)
+        setattr(sim, atributo, generador)
+        generadores.append(generador)
+    stats = sim.simular_dia(tiempo_max, max_iteraciones, NivelTraza.NINGUNO)
+    return stats, math.exp(sum(g.log_razon for g in generadores)), generadores
+
+
+def _puntaje_dia(sim: SimulacionPeluqueria, umbral: int) -> float:
+    """Puntaje continuo del día simulado, que llega a umbral solo si ocurre el evento
+
+    Es la cantidad de clientes que esperaron más que el tiempo de refrigerio más la
+    espera del siguiente (el de mayor espera entre los demás) como fracción de ese
+    tiempo. Los clientes que no llegaron a ser atendidos cuentan hasta el fin del día.
+    Así los niveles intermedios de la entropía cruzada distinguen días que los
+    refrigerios enteros (casi siempre 0) no distinguen.
+    """
+    espera_refrigerio = sim.TIEMPO_REFRIGERIO
+    esperas = sorted(
+        ((c.tiempo_inicio_atencion if c.tiempo_inicio_atencion > 0 else sim.tiempo_actual) - c.tiempo_llegada
+         for c in sim.clientes),
+        reverse=True)
+    excedidos = sum(1 for espera in esperas if espera > espera_refrigerio)
+    if excedidos >= umbral:
+        return float(umbral)
+    siguiente = esperas[excedidos] if excedidos < len(esperas) else 0.0
+    return excedidos + siguiente / espera_refrigerio
+
+
+def ajustar_inclinacion(sim: SimulacionPeluqueria, semilla, dias_piloto: int = 1000, rho: float = 0.1,
+                        max_rondas: int = 10, umbral: int = UMBRAL_REFRIGERIOS, suavizado: float = 0.7,
+                        tiempo_max=None, max_iteraciones=100000) -> Tuple[Tuple[float, float], int]:
+    """Elige las inclinaciones de llegadas y servicio con entropía cruzada
+
+    En cada ronda simula dias_piloto días con la inclinación actual, toma como nivel
+    intermedio el cuantil 1 - rho de _puntaje_dia (tope umbral) y ajusta cada
+    inclinación para que la media de sus V sea el promedio ponderado (por la razón
+    de verosimilitud) de los días que alcanzaron el nivel. La inclinación nueva se
+    suaviza con la anterior (peso suavizado para la nueva). Termina después de la
+    primera ronda cuyo nivel es umbral.
+
+    Returns:
+        ((inclinacion_llegadas, inclinacion_servicio), días simulados)
+    """
+    inclinaciones = (0.0,) * len(FUENTES)
+    dias_simulados = 0
+    nivel = 0.0
+    for ronda in range(max_rondas):
+        dias_simulados += dias_piloto
+        dias = []
+        for dia in range(1, dias_piloto + 1):
+            stats, peso, generadores = _simular_dia_inclinado(
+                sim, f"{semilla}:piloto{ronda}:{dia}", inclinaciones, tiempo_max, max_iteraciones)
+            dias.append((_puntaje_dia(sim, umbral), peso, generadores))
+
+        puntajes = sorted(d[0] for d in dias)
+        # El nivel no baja entre rondas aunque el cuantil lo haga
+        nivel = min(float(umbral), max(nivel, puntajes[int((1 - rho) * (len(puntajes) - 1))]))
+        elite = [(peso, generadores) for puntaje, peso, generadores in dias if puntaje >= nivel]
+        if not elite:
+            break
+
+        # Media ponderada de las V de los días de élite, por fuente de azar
+        nuevas = []
+        for i, (_, signo) in enumerate(FUENTES):
+            suma = sum(peso * generadores[i].suma for peso, generadores in elite)
+            cantidad = sum(peso * generadores[i].cantidad for peso, generadores in elite)
+            nuevas.append(signo * inclinacion_para_media(suma / cantidad) if cantidad > 0 else 0.0)
+        inclinaciones = tuple(suavizado * nueva + (1 - suavizado) * vieja
+                              for nueva, vieja in zip(nuevas, inclinaciones))
+        if nivel >= umbral:
+            break
+    return inclinaciones, dias_simulados
+
+
+def estimar_prob_refrigerios(num_dias: int, semilla: Optional[int] = None,
+                             inclinaciones: Optional[Tuple[float, float]] = None,
+                             umbral: int = UMBRAL_REFRIGERIOS, dias_piloto: int = 1000,
+                             tiempo_max=None, max_iteraciones=100000, **params_modelo) -> Dict:
+    """Estima P(umbral o más refrigerios en un día) con muestreo de importancia
+
+    Las entre-llegadas y los tiempos de servicio se generan inclinados hacia la
+    congestión (ver GeneradorInclinado y FUENTES) y cada día se pondera por su razón
+    de verosimilitud, así la estimación sigue siendo insesgada. Si hubo menos de
+    MIN_DIAS_CON_EVENTO días con evento o el tamaño de muestra efectivo es menor que
+    MIN_MUESTRA_EFECTIVA, el resultado se marca como no confiable: la estimación puede
+    estar muy lejos y el intervalo no tiene la cobertura nominal. 'reduccion_varianza'
+    informa cuánto se ganó (o perdió) frente a Monte Carlo simple; no hay garantía
+    de que supere 1 (ver el docstring del módulo).
+
+    Args:
+        num_dias: Días a simular para la estimación
+        semilla: Semilla maestra (cada día usa semilla_dia(semilla, dia))
+        inclinaciones: (llegadas, servicio); None = ajustarlas con
+            ajustar_inclinacion usando dias_piloto días por ronda
+        umbral: Cantidad de refrigerios del evento
+        **params_modelo: Parámetros de SimulacionPeluqueria
+
+    Returns:
+        Diccionario con 'prob_refrigerios' (estimación), 'error_relativo' (error
+        estándar / estimación), 'ic_prob_refrigerios' (acotado inferiormente en 0),
+        'dias_con_evento', 'tamano_muestra_efectivo', 'confiable',
+        'reduccion_varianza' (respecto de Monte Carlo simple con los mismos días
+        totales, piloto incluido), las inclinaciones usadas y 'dias_piloto_usados'
+        (días simulados para ajustarlas)
+    """
+    if semilla is None:
+        semilla = random.getrandbits(64)
+    sim = SimulacionPeluqueria(**params_modelo)
+    dias_piloto_usados = 0
+    if inclinaciones is None:
+        inclinaciones, dias_piloto_usados = ajustar_inclinacion(
+            sim, semilla, dias_piloto, umbral=umbral, tiempo_max=tiempo_max, max_iteraciones=max_iteraciones)
+
+    estimador = EstadisticaWelford()  # Valores peso * indicador: su media es la probabilidad
+    suma_pesos = suma_pesos_cuadrado = 0.0
+    dias_con_evento = 0
+    for dia in range(1, num_dias + 1):
+        stats, peso, _ = _simular_dia_inclinado(
+            sim, semilla_dia(semilla, dia), inclinaciones, tiempo_max, max_iteraciones)
+        evento = stats['clientes_con_refrigerio'] >= umbral
+        estimador.agregar(peso if evento else 0.0)
+        if evento:
+            dias_con_evento += 1
+            suma_pesos += peso
+            suma_pesos_cuadrado += peso * peso
+
+    prob = estimador.media
+    error_estandar = math.sqrt(estimador.varianza / num_dias) if num_dias > 1 else math.inf
+    # Días "útiles" equivalentes según la dispersión de los pesos de los días con evento
+    muestra_efectiva = suma_pesos ** 2 / suma_pesos_cuadrado if suma_pesos_cuadrado else 0.0
+    # Varianza de Monte Carlo simple (Bernoulli) con todos los días simulados, piloto
+    # incluido, sobre la varianza del estimador con muestreo de importancia
+    dias_totales = num_dias + dias_piloto_usados
+    reduccion = (prob * (1 - prob) * num_dias / (dias_totales * estimador.varianza)
+                 if estimador.varianza > 0 else 1.0)
+    return {
+        'num_dias': num_dias,
+        'prob_refrigerios': prob,
+        'error_relativo': error_estandar / prob if prob > 0 else math.inf,
+        'ic_prob_refrigerios': (max(0.0, prob - Z_95 * error_estandar), prob + Z_95 * error_estandar),
+        'dias_con_evento': dias_con_evento,
+        'tamano_muestra_efectivo': muestra_efectiva,
+        'confiable': dias_con_evento >= MIN_DIAS_CON_EVENTO and muestra_efectiva >= MIN_MUESTRA_EFECTIVA,
+        'reduccion_varianza': reduccion,
+        'inclinaciones': inclinaciones,
+        'dias_piloto_usados': dias_piloto_usados,
+    }
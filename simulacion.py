@@ -3,11 +3,21 @@ Simulación de Peluquería VIP
 Motor de simulación con eventos discretos
 """
 
+import bisect
+import heapq
+import itertools
+import math
+import os
 import random
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+import time
+from array import array
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Callable, FrozenSet, Iterable, List, Optional, Dict, Tuple
 from enum import Enum
 
+from estadisticas import AcumuladorDias, ObjetivoPrecision, llegadas_esperadas
+
 
 class EstadoPeluquero(Enum):
     LIBRE = "Libre"
@@ -20,25 +30,56 @@ class TipoPeluquero(Enum):
     VETERANO_B = "Veterano B"
 
 
-@dataclass
+# Estado del cliente en el snapshot según el peluquero asignado
+ESTADO_ESPERANDO = {
+    TipoPeluquero.APRENDIZ: 'Esperando Aprendiz',
+    TipoPeluquero.VETERANO_A: 'Esperando Vet A',
+    TipoPeluquero.VETERANO_B: 'Esperando Vet B',
+}
+ESTADO_EN_SERVICIO = {
+    TipoPeluquero.APRENDIZ: 'En Servicio Aprendiz',
+    TipoPeluquero.VETERANO_A: 'En Servicio Vet A',
+    TipoPeluquero.VETERANO_B: 'En Servicio Vet B',
+}
+
+# Orden fijo de los peluqueros (índice = código en la traza columnar)
+TIPOS_PELUQUERO = list(TipoPeluquero)
+
+
 class Peluquero:
     """Representa un peluquero de la peluquería"""
-    tipo: TipoPeluquero
-    probabilidad: float
-    tiempo_min: int
-    tiempo_max: int
-    tarifa: int
-    estado: EstadoPeluquero = EstadoPeluquero.LIBRE
-    cliente_actual: Optional['Cliente'] = None
-    tiempo_fin_atencion: float = 0.0
-    
-    def asignar_cliente(self, cliente: 'Cliente', tiempo_inicio: float):
-        """Asigna un cliente al peluquero"""
+    __slots__ = ('tipo', 'probabilidad', 'tiempo_min', 'tiempo_max', 'tarifa',
+                 'estado', 'cliente_actual', 'tiempo_fin_atencion', 'cola')
+    
+    def __init__(self, tipo: TipoPeluquero, probabilidad: float, tiempo_min: int,
+                 tiempo_max: int, tarifa: int):
+        self.tipo = tipo
+        self.probabilidad = probabilidad
+        self.tiempo_min = tiempo_min
+        self.tiempo_max = tiempo_max
+        self.tarifa = tarifa
+        self.estado = EstadoPeluquero.LIBRE
+        self.cliente_actual: Optional['Cliente'] = None
+        self.tiempo_fin_atencion = 0.0
+        # Cola FIFO propia: clientes asignados a este peluquero que esperan atención
+        self.cola: deque = deque()
+    
+    def __repr__(self):
+        return f"Peluquero({self.tipo.value}, {self.estado.value})"
+    
+    def encolar(self, cliente: 'Cliente'):
+        """Agrega un cliente al final de la cola del peluquero"""
+        self.cola.append(cliente)
+    
+    def siguiente_en_cola(self) -> Optional['Cliente']:
+        """Quita y devuelve el primer cliente de la cola (None si está vacía)"""
+        return self.cola.popleft() if self.cola else None
+    
+    def asignar_cliente(self, cliente: 'Cliente', tiempo_inicio: float, tiempo_servicio: float):
+        """Asigna un cliente al peluquero por tiempo_servicio minutos"""
         self.estado = EstadoPeluquero.OCUPADO
         self.cliente_actual = cliente
-        tiempo_servicio = random.uniform(self.tiempo_min, self.tiempo_max)
         self.tiempo_fin_atencion = tiempo_inicio + tiempo_servicio
-        return tiempo_servicio
     
     def liberar(self):
         """Libera al peluquero"""
@@ -47,16 +88,25 @@ class Peluquero:
         self.tiempo_fin_atencion = 0.0
 
 
-@dataclass
 class Cliente:
     """Representa un cliente de la peluquería"""
-    id: int
-    tiempo_llegada: float
-    peluquero_asignado: Optional[Peluquero] = None
-    tiempo_inicio_atencion: float = 0.0
-    tiempo_fin_atencion: float = 0.0
-    recibio_refrigerio: bool = False
-    tiempo_refrigerio: float = 0.0
+    __slots__ = ('id', 'tiempo_llegada', 'peluquero_asignado', 'tiempo_inicio_atencion',
+                 'tiempo_fin_atencion', 'recibio_refrigerio', 'tiempo_refrigerio',
+                 'evento_refrigerio')
+    
+    def __init__(self, id: int, tiempo_llegada: float):
+        self.id = id
+        self.tiempo_llegada = tiempo_llegada
+        self.peluquero_asignado: Optional[Peluquero] = None
+        self.tiempo_inicio_atencion = 0.0
+        self.tiempo_fin_atencion = 0.0
+        self.recibio_refrigerio = False
+        self.tiempo_refrigerio = 0.0
+        # Evento REFRIGERIO pendiente (para cancelarlo si empieza a ser atendido antes)
+        self.evento_refrigerio: Optional['Evento'] = None
+    
+    def __repr__(self):
+        return f"Cliente(id={self.id}, tiempo_llegada={self.tiempo_llegada:.2f})"
     
     @property
     def tiempo_espera(self) -> float:
@@ -73,20 +123,127 @@ class Cliente:
         return 0.0
 
 
+class NivelTraza(Enum):
+    """Cuánto del vector de estado se registra al simular un día"""
+    NINGUNO = "ninguno"    # Solo acumuladores (estadísticas del día)
+    RESUMEN = "resumen"    # Filas del vector sin snapshot de clientes
+    COMPLETO = "completo"  # Filas del vector con snapshot de clientes
+
+
 class TipoEvento(Enum):
     LLEGADA_CLIENTE = "Llegada Cliente"
     FIN_ATENCION = "Fin Atención"
     REFRIGERIO = "Refrigerio"
 
 
-@dataclass
+class TipoNotificacion(Enum):
+    """Qué avisa el motor a los coleccionistas suscriptos (ver SimulacionPeluqueria.suscribir)"""
+    LLEGADA = "Llegada"                     # Llegó un cliente (ya tiene peluquero asignado)
+    INICIO_ATENCION = "Inicio Atención"     # Un peluquero empezó a atender a un cliente
+    FIN_ATENCION = "Fin Atención"           # Un peluquero terminó con un cliente
+    REFRIGERIO = "Refrigerio"               # Un cliente recibió el refrigerio
+    EVENTO_PROCESADO = "Evento Procesado"   # Terminó de procesarse un evento del calendario
+
+
 class Evento:
     """Representa un evento en la simulación"""
-    tiempo: float
-    tipo: TipoEvento
-    cliente: Optional[Cliente] = None
-    peluquero: Optional[Peluquero] = None
-    descripcion: str = ""
+    __slots__ = ('tiempo', 'tipo', 'cliente', 'peluquero', 'cancelado')
+    
+    def __init__(self, tiempo: float, tipo: TipoEvento, cliente: Optional[Cliente] = None,
+                 peluquero: Optional[Peluquero] = None):
+        self.tiempo = tiempo
+        self.tipo = tipo
+        self.cliente = cliente
+        self.peluquero = peluquero
+        self.cancelado = False
+    
+    def __repr__(self):
+        return f"Evento({self.tiempo:.2f}, {self.tipo.value})"
+    
+    @property
+    def descripcion(self) -> str:
+        """Descripción legible del evento (se arma solo cuando se pide)"""
+        if self.cliente is None:
+            return self.tipo.value
+        if self.tipo == TipoEvento.LLEGADA_CLIENTE:
+            return f"Cliente {self.cliente.id} llega"
+        elif self.tipo == TipoEvento.FIN_ATENCION:
+            return f"Cliente {self.cliente.id} termina con {self.peluquero.tipo.value}"
+        elif self.tipo == TipoEvento.REFRIGERIO:
+            return f"Cliente {self.cliente.id} recibe refrigerio"
+        return self.tipo.value
+
+
+class RegistroEvento:
+    """Lo que recibe un coleccionista en cada notificación
+
+    cliente, peluquero y evento son los objetos del motor (no copias): se leen en
+    el momento de la notificación. evento solo está en EVENTO_PROCESADO.
+    """
+    __slots__ = ('tipo', 'tiempo', 'cliente', 'peluquero', 'evento')
+
+    def __init__(self, tipo: TipoNotificacion, tiempo: float, cliente: Optional[Cliente] = None,
+                 peluquero: Optional[Peluquero] = None, evento: Optional[Evento] = None):
+        self.tipo = tipo
+        self.tiempo = tiempo
+        self.cliente = cliente
+        self.peluquero = peluquero
+        self.evento = evento
+
+    def __repr__(self):
+        return f"RegistroEvento({self.tipo.value}, {self.tiempo:.2f})"
+
+
+class CalendarioEventos:
+    """Lista de eventos futuros implementada como heap binario
+
+    Cada entrada es (tiempo, secuencia, evento). La secuencia creciente desempata
+    eventos simultáneos por orden de programación (FIFO), igual que el ordenamiento
+    estable de la lista original.
+    
+    Los eventos cancelados quedan en el heap marcados (lápida) y se descartan al
+    llegar a la cima, sin ser devueltos por extraer().
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._secuencia = itertools.count()
+        self._vivos = 0
+
+    def programar(self, evento: Evento):
+        """Agrega un evento al calendario en O(log n)"""
+        heapq.heappush(self._heap, (evento.tiempo, next(self._secuencia), evento))
+        self._vivos += 1
+
+    def cancelar(self, evento: Evento):
+        """Cancela un evento pendiente en O(1); extraer() nunca lo devolverá"""
+        if not evento.cancelado:
+            evento.cancelado = True
+            self._vivos -= 1
+
+    def extraer(self) -> Evento:
+        """Quita y devuelve el evento vivo más próximo en O(log n)"""
+        evento = heapq.heappop(self._heap)[2]
+        while evento.cancelado:
+            evento = heapq.heappop(self._heap)[2]
+        self._vivos -= 1
+        return evento
+
+    def limpiar(self):
+        """Vacía el calendario"""
+        self._heap.clear()
+        self._secuencia = itertools.count()
+        self._vivos = 0
+
+    def __len__(self):
+        return self._vivos
+
+    def __bool__(self):
+        return self._vivos > 0
+
+    def __iter__(self):
+        """Itera los eventos pendientes no cancelados (sin orden garantizado)"""
+        return (entrada[2] for entrada in self._heap if not entrada[2].cancelado)
 
 
 @dataclass
@@ -134,6 +291,361 @@ class FilaVectorEstado:
     clientes_snapshot: List[Dict] = field(default_factory=list)
 
 
+class TrazaVectorEstado:
+    """Vector de estado en almacenamiento columnar
+
+    Cada columna es un array tipado; los textos (evento, estados, cliente en
+    atención) se guardan como códigos enteros y se reconstruyen al leer. Los
+    snapshots de clientes van en columnas propias indexadas por offsets
+    (las filas de la fila i están en [offsets[i], offsets[i+1])).
+
+    traza[i] (o un slice) devuelve FilaVectorEstado armadas bajo demanda, de modo
+    que el código que lee el vector (UI, exportación) no cambia.
+    """
+
+    # Claves de rnd_evento, en el orden de sus columnas (NaN = no usado en la fila)
+    CLAVES_RND = ('llegada', 'tiempo_entre_llegadas', 'asignacion_peluquero',
+                  'tiempo_servicio', 'duracion_servicio')
+    TIPOS_EVENTO = list(TipoEvento)
+    ESTADOS_PELUQUERO = list(EstadoPeluquero)
+    _CODIGO_EVENTO = {tipo: i for i, tipo in enumerate(TIPOS_EVENTO)}
+    _CODIGO_ESTADO = {estado: i for i, estado in enumerate(ESTADOS_PELUQUERO)}
+    _CODIGO_PELUQUERO = {tipo: i for i, tipo in enumerate(TIPOS_PELUQUERO)}
+    # Código de estado del cliente: índice del peluquero (+3 si está en servicio)
+    ESTADOS_CLIENTE = ([ESTADO_ESPERANDO[t] for t in TIPOS_PELUQUERO] +
+                       [ESTADO_EN_SERVICIO[t] for t in TIPOS_PELUQUERO])
+
+    def __init__(self):
+        self.limpiar()
+
+    def limpiar(self):
+        """Vacía la traza"""
+        self.iteracion = array('i')
+        self.reloj = array('d')
+        self.evento_tipo = array('b')
+        self.evento_cliente = array('i')
+        self.evento_peluquero = array('b')  # -1 = sin peluquero
+        self.rnd = {clave: array('d') for clave in self.CLAVES_RND}
+        self.proximo_llegada = array('d')
+        # Por peluquero (en orden de TIPOS_PELUQUERO)
+        self.tiempo_fin = [array('d') for _ in TIPOS_PELUQUERO]  # = próximo fin de atención
+        self.estado = [array('b') for _ in TIPOS_PELUQUERO]
+        self.cliente = [array('i') for _ in TIPOS_PELUQUERO]  # 0 = sin cliente
+        self.cola = [array('i') for _ in TIPOS_PELUQUERO]
+        # Acumuladores
+        self.clientes_atendidos = array('i')
+        self.recaudacion_acum = array('d')
+        self.costo_refrigerios_acum = array('d')
+        self.clientes_con_refrigerio = array('i')
+        self.max_cola_total = array('i')
+        # Snapshots de clientes
+        self.snapshot_offsets = array('q', [0])
+        self.snapshot_id = array('i')
+        self.snapshot_estado = array('b')
+        self.snapshot_llegada = array('d')
+        self.snapshot_espera = array('d')
+
+    def agregar(self, iteracion, reloj, evento, rnd, proximo_llegada, peluqueros,
+                clientes_atendidos, recaudacion_acum, costo_refrigerios_acum,
+                clientes_con_refrigerio, max_cola_total, clientes=None):
+        """Agrega una fila. clientes: clientes activos para el snapshot (None = sin snapshot)"""
+        self.iteracion.append(iteracion)
+        self.reloj.append(reloj)
+        self.evento_tipo.append(self._CODIGO_EVENTO[evento.tipo])
+        self.evento_cliente.append(evento.cliente.id if evento.cliente else 0)
+        self.evento_peluquero.append(
+            self._CODIGO_PELUQUERO[evento.peluquero.tipo] if evento.peluquero else -1)
+        for clave, columna in self.rnd.items():
+            columna.append(rnd.get(clave, math.nan))
+        self.proximo_llegada.append(proximo_llegada)
+
+        for i, p in enumerate(peluqueros):
+            self.tiempo_fin[i].append(p.tiempo_fin_atencion)
+            self.estado[i].append(self._CODIGO_ESTADO[p.estado])
+            self.cliente[i].append(p.cliente_actual.id if p.cliente_actual else 0)
+            self.cola[i].append(len(p.cola))
+
+        self.clientes_atendidos.append(clientes_atendidos)
+        self.recaudacion_acum.append(recaudacion_acum)
+        self.costo_refrigerios_acum.append(costo_refrigerios_acum)
+        self.clientes_con_refrigerio.append(clientes_con_refrigerio)
+        self.max_cola_total.append(max_cola_total)
+
+        if clientes is not None:
+            for c in clientes:
+                codigo = self._CODIGO_PELUQUERO[c.peluquero_asignado.tipo]
+                if c.tiempo_inicio_atencion > 0:
+                    codigo += len(TIPOS_PELUQUERO)
+                self.snapshot_id.append(c.id)
+                self.snapshot_estado.append(codigo)
+                self.snapshot_llegada.append(c.tiempo_llegada)
+                self.snapshot_espera.append(c.tiempo_espera)
+        self.snapshot_offsets.append(len(self.snapshot_id))
+
+    def indice_desde_reloj(self, hora: float) -> int:
+        """Índice de la primera fila con reloj >= hora (O(log n))"""
+        return bisect.bisect_left(self.reloj, hora)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados por los datos de todas las columnas"""
+        columnas = [self.iteracion, self.reloj, self.evento_tipo, self.evento_cliente,
+                    self.evento_peluquero, self.proximo_llegada, self.clientes_atendidos,
+                    self.recaudacion_acum, self.costo_refrigerios_acum,
+                    self.clientes_con_refrigerio, self.max_cola_total, self.snapshot_offsets,
+                    self.snapshot_id, self.snapshot_estado, self.snapshot_llegada,
+                    self.snapshot_espera]
+        columnas += list(self.rnd.values()) + self.tiempo_fin + self.estado + self.cliente + self.cola
+        return sum(c.itemsize * len(c) for c in columnas)
+
+    def _nombre_evento(self, i: int) -> str:
+        """Nombre del evento de la fila i (columna 'Evento' del vector)"""
+        tipo = self.TIPOS_EVENTO[self.evento_tipo[i]]
+        cliente_id = self.evento_cliente[i]
+        if tipo == TipoEvento.LLEGADA_CLIENTE:
+            return f"Llegada Cliente {cliente_id}"
+        elif tipo == TipoEvento.FIN_ATENCION:
+            peluquero = TIPOS_PELUQUERO[self.evento_peluquero[i]]
+            return f"Fin Atención C{cliente_id} ({peluquero.value})"
+        elif tipo == TipoEvento.REFRIGERIO:
+            return f"Refrigerio Cliente {cliente_id}"
+        return ""
+
+    def _fila(self, i: int) -> FilaVectorEstado:
+        """Arma la FilaVectorEstado de la fila i"""
+        rnd_evento = {}
+        for clave, columna in self.rnd.items():
+            if not math.isnan(columna[i]):
+                rnd_evento[clave] = columna[i]
+
+        estados = [self.ESTADOS_PELUQUERO[e[i]].value for e in self.estado]
+        clientes = [f"C{c[i]}" if c[i] else "-" for c in self.cliente]
+        fines = [t[i] for t in self.tiempo_fin]
+
+        clientes_snapshot = [
+            {
+                'id': self.snapshot_id[j],
+                'estado': self.ESTADOS_CLIENTE[self.snapshot_estado[j]],
+                'hora_inicio_espera': self.snapshot_llegada[j],
+                'tiempo_espera': self.snapshot_espera[j]
+            }
+            for j in range(self.snapshot_offsets[i], self.snapshot_offsets[i + 1])
+        ]
+
+        return FilaVectorEstado(
+            iteracion=self.iteracion[i],
+            reloj=self.reloj[i],
+            evento=self._nombre_evento(i),
+            rnd_evento=rnd_evento,
+            proximo_llegada=self.proximo_llegada[i],
+            proximo_fin_aprendiz=fines[0],
+            proximo_fin_veterano_a=fines[1],
+            proximo_fin_veterano_b=fines[2],
+            estado_aprendiz=estados[0],
+            estado_veterano_a=estados[1],
+            estado_veterano_b=estados[2],
+            cliente_aprendiz=clientes[0],
+            cliente_veterano_a=clientes[1],
+            cliente_veterano_b=clientes[2],
+            cola_aprendiz=self.cola[0][i],
+            cola_veterano_a=self.cola[1][i],
+            cola_veterano_b=self.cola[2][i],
+            clientes_atendidos=self.clientes_atendidos[i],
+            recaudacion_acum=self.recaudacion_acum[i],
+            costo_refrigerios_acum=self.costo_refrigerios_acum[i],
+            clientes_con_refrigerio=self.clientes_con_refrigerio[i],
+            max_cola_total=self.max_cola_total[i],
+            tiempo_fin_aprendiz=fines[0],
+            tiempo_fin_veterano_a=fines[1],
+            tiempo_fin_veterano_b=fines[2],
+            clientes_snapshot=clientes_snapshot
+        )
+
+    def __len__(self):
+        return len(self.iteracion)
+
+    def __bool__(self):
+        return len(self.iteracion) > 0
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._fila(i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("índice de fila fuera de rango")
+        return self._fila(indice)
+
+    def __iter__(self):
+        return (self._fila(i) for i in range(len(self)))
+
+
+class Coleccionista:
+    """Base de los observadores del motor
+
+    Se suscribe con SimulacionPeluqueria.suscribir() y recibe en notificar() un
+    RegistroEvento por cada notificación de los tipos de `tipos`. Un día sin
+    suscriptores para un tipo no arma registros de ese tipo: cada coleccionista
+    cuesta solo lo que mira. Los métodos que no se redefinen no hacen nada.
+    """
+
+    tipos: FrozenSet[TipoNotificacion] = frozenset(TipoNotificacion)
+
+    def al_iniciar_dia(self, sim: 'SimulacionPeluqueria'):
+        """Antes del primer evento del día (con la simulación ya reiniciada)"""
+
+    def notificar(self, registro: RegistroEvento):
+        """Una notificación de alguno de los tipos suscriptos"""
+
+    def al_terminar_dia(self, sim: 'SimulacionPeluqueria', estadisticas: Dict):
+        """Después del último evento del día, con las estadísticas que devuelve simular_dia"""
+
+
+class RegistradorVectorEstado(Coleccionista):
+    """Coleccionista que arma el vector de estado: una fila por evento procesado
+
+    La simulación tiene uno propio (registrador_vector) y lo suscribe solo en los
+    días con traza; completo indica si cada fila lleva el snapshot de clientes.
+    """
+
+    tipos = frozenset({TipoNotificacion.EVENTO_PROCESADO})
+
+    def __init__(self):
+        self.traza = TrazaVectorEstado()
+        self.completo = False
+        self._sim: Optional['SimulacionPeluqueria'] = None
+
+    def al_iniciar_dia(self, sim: 'SimulacionPeluqueria'):
+        self._sim = sim
+
+    def notificar(self, registro: RegistroEvento):
+        sim = self._sim
+        proximo_llegada = sim.proximo_llegada if sim.proximo_llegada != float('inf') else 0
+        # Snapshot de clientes desde el registro de activos: SOLO los clientes que
+        # aún existen en el sistema (objetos temporales esperando o en servicio).
+        # El costo es proporcional a los clientes presentes, no a todos los del día.
+        snapshot = sim.clientes_activos.values() if self.completo else None
+        self.traza.agregar(
+            sim.iteracion, sim.tiempo_actual, registro.evento, sim.ultimo_rnd,
+            proximo_llegada, sim.peluqueros,
+            sim.clientes_atendidos_total, sim.recaudacion_total, sim.costo_refrigerios,
+            sim.clientes_con_refrigerio, sim.max_clientes_esperando,
+            snapshot
+        )
+
+
+class GeneradorAntitetico(random.Random):
+    """random.Random que devuelve 1 - U: la secuencia antitética de la misma semilla"""
+    
+    def random(self):
+        return 1.0 - super().random()
+
+
+class PerfilMotor:
+    """Cantidad de llamadas y tiempo acumulado (perf_counter) por sección del motor
+
+    Secciones:
+        'Llegada Cliente', 'Fin Atención', 'Refrigerio': manejo de cada TipoEvento en
+            _procesar_evento, descontando el tiempo de las secciones de abajo que
+            ocurren dentro (así las secciones no se solapan y suman el total medido)
+        'traza': notificar del registrador del vector de estado
+        'calendario.programar', 'calendario.extraer', 'calendario.cancelar'
+        'rng.llegadas', 'rng.asignacion', 'rng.servicio': cada U generada
+
+    SimulacionPeluqueria.activar_perfil() reemplaza esos métodos en la instancia
+    por versiones cronometradas; sin perfil el motor ejecuta los métodos de la
+    clase tal cual y la instrumentación no cuesta nada.
+    """
+
+    SECCIONES_COMPONENTES = ('traza', 'calendario.programar', 'calendario.extraer', 'calendario.cancelar',
+                             'rng.llegadas', 'rng.asignacion', 'rng.servicio')
+
+    def __init__(self):
+        secciones = [tipo.value for tipo in TipoEvento] + list(self.SECCIONES_COMPONENTES)
+        self.llamadas: Dict[str, int] = dict.fromkeys(secciones, 0)
+        self.segundos: Dict[str, float] = dict.fromkeys(secciones, 0.0)
+        self._anidado = 0.0  # Tiempo acumulado de los componentes, para descontarlo de los eventos
+
+    def reiniciar(self):
+        """Pone los contadores en cero (los métodos instalados siguen sumando en ellos)"""
+        for seccion in self.llamadas:
+            self.llamadas[seccion] = 0
+            self.segundos[seccion] = 0.0
+
+    def _cronometrar(self, seccion: str, funcion: Callable) -> Callable:
+        llamadas, segundos, reloj = self.llamadas, self.segundos, time.perf_counter
+
+        def cronometrada(*args):
+            inicio = reloj()
+            resultado = funcion(*args)
+            transcurrido = reloj() - inicio
+            llamadas[seccion] += 1
+            segundos[seccion] += transcurrido
+            self._anidado += transcurrido
+            return resultado
+        return cronometrada
+
+    def _cronometrar_eventos(self, procesar_evento: Callable) -> Callable:
+        llamadas, segundos, reloj = self.llamadas, self.segundos, time.perf_counter
+
+        def cronometrada(evento):
+            anidado = self._anidado
+            inicio = reloj()
+            procesar_evento(evento)
+            transcurrido = reloj() - inicio
+            seccion = evento.tipo.value
+            llamadas[seccion] += 1
+            segundos[seccion] += transcurrido - (self._anidado - anidado)
+        return cronometrada
+
+    def instalar(self, sim: 'SimulacionPeluqueria'):
+        """Reemplaza los métodos cronometrados en la instancia sim y su calendario"""
+        self.desinstalar(sim)
+        sim._procesar_evento = self._cronometrar_eventos(sim._procesar_evento)
+        sim.registrador_vector.notificar = self._cronometrar('traza', sim.registrador_vector.notificar)
+        for nombre in ('programar', 'extraer', 'cancelar'):
+            setattr(sim.eventos, nombre, self._cronometrar('calendario.' + nombre, getattr(sim.eventos, nombre)))
+        self.instalar_generadores(sim)
+
+    def instalar_generadores(self, sim: 'SimulacionPeluqueria'):
+        """Cronometra random() de los generadores actuales de sim (sembrar puede reemplazarlos)"""
+        for fuente in ('llegadas', 'asignacion', 'servicio'):
+            generador = getattr(sim, 'rng_' + fuente)
+            generador.__dict__.pop('random', None)
+            generador.random = self._cronometrar('rng.' + fuente, generador.random)
+
+    @staticmethod
+    def desinstalar(sim: 'SimulacionPeluqueria'):
+        """Vuelve a los métodos de la clase"""
+        objetos_metodos = [(sim, ('_procesar_evento',)), (sim.registrador_vector, ('notificar',)),
+                           (sim.eventos, ('programar', 'extraer', 'cancelar'))]
+        objetos_metodos += [(generador, ('random',))
+                            for generador in (sim.rng_llegadas, sim.rng_asignacion, sim.rng_servicio)]
+        for objeto, nombres in objetos_metodos:
+            for nombre in nombres:
+                objeto.__dict__.pop(nombre, None)
+
+    def resumen(self) -> List[Dict]:
+        """Una fila por sección con llamadas, segundos, µs por llamada y fracción del total, de mayor a menor"""
+        total = sum(self.segundos.values())
+        filas = [{
+            'seccion': seccion,
+            'llamadas': self.llamadas[seccion],
+            'segundos': segundos,
+            'us_por_llamada': segundos / self.llamadas[seccion] * 1e6 if self.llamadas[seccion] else 0.0,
+            'fraccion': segundos / total if total > 0 else 0.0,
+        } for seccion, segundos in self.segundos.items()]
+        return sorted(filas, key=lambda fila: fila['segundos'], reverse=True)
+
+    def formatear(self) -> str:
+        """Tabla de texto del resumen"""
+        lineas = [f"{'sección':<22} {'llamadas':>10} {'total ms':>10} {'µs/llamada':>11} {'%':>6}"]
+        for fila in self.resumen():
+            lineas.append(f"{fila['seccion']:<22} {fila['llamadas']:>10,} {fila['segundos'] * 1000:>10.1f} "
+                          f"{fila['us_por_llamada']:>11.2f} {fila['fraccion']:>6.1%}")
+        return '\n'.join(lineas)
+
+
 class SimulacionPeluqueria:
     """Motor de simulación de la peluquería"""
     
@@ -152,7 +664,12 @@ class SimulacionPeluqueria:
                  tarifa_vet_b: Optional[float]=None,
                  jornada_laboral_horas: Optional[int]=None,
                  costo_refrigerio: Optional[float]=None,
-                 prob_veterano_b: Optional[float]=None):
+                 prob_veterano_b: Optional[float]=None,
+                 # Traza y depuración
+                 nivel_traza=NivelTraza.COMPLETO,
+                 registrar_refrigerios_obsoletos: bool=False,
+                 # Generadores aleatorios
+                 semilla: Optional[int]=None):
         """
         Inicializa la simulación con parámetros configurables
         
@@ -168,6 +685,14 @@ class SimulacionPeluqueria:
             tiempo_llegada_min: Tiempo mínimo entre llegadas (minutos)
             tiempo_llegada_max: Tiempo máximo entre llegadas (minutos)
             tiempo_refrigerio: Tiempo de espera para dar refrigerio (minutos)
+            nivel_traza: NivelTraza (o su valor: 'ninguno', 'resumen', 'completo') por
+                defecto para simular_dia
+            registrar_refrigerios_obsoletos: Si es True, los REFRIGERIO de clientes que ya
+                empezaron a ser atendidos no se cancelan y siguen generando su fila
+                (sin efecto) en el vector de estado. Solo para depuración.
+            semilla: Semilla de los generadores de llegadas, asignación y servicio (ver
+                sembrar). Con None se siembran desde el módulo random, así
+                random.seed(...) antes de crear la simulación sigue siendo reproducible.
         """
         # Constantes NO PARAMETRIZABLES (valores fijos del enunciado)
         # Valores por defecto (permite sobrescribir desde parámetros opcionales)
@@ -186,6 +711,23 @@ class SimulacionPeluqueria:
         self.COSTO_REFRIGERIO = COSTO_REFRIGERIO
         self.TIEMPO_LLEGADA_MIN = tiempo_llegada_min
         self.TIEMPO_LLEGADA_MAX = tiempo_llegada_max
+        self.registrar_refrigerios_obsoletos = registrar_refrigerios_obsoletos
+        self._llegadas_esperadas: Optional[float] = None
+        self.nivel_traza = NivelTraza(nivel_traza)
+        self._nivel_traza_dia = self.nivel_traza
+        
+        # Parámetros del modelo tal como se recibieron (para recrear la simulación en otro proceso)
+        self.params_modelo = {
+            'prob_aprendiz': prob_aprendiz, 'tiempo_min_aprendiz': tiempo_min_aprendiz,
+            'tiempo_max_aprendiz': tiempo_max_aprendiz, 'prob_veterano_a': prob_veterano_a,
+            'tiempo_min_vet_a': tiempo_min_vet_a, 'tiempo_max_vet_a': tiempo_max_vet_a,
+            'tiempo_min_vet_b': tiempo_min_vet_b, 'tiempo_max_vet_b': tiempo_max_vet_b,
+            'tiempo_llegada_min': tiempo_llegada_min, 'tiempo_llegada_max': tiempo_llegada_max,
+            'tiempo_refrigerio': tiempo_refrigerio,
+            'tarifa_aprendiz': tarifa_aprendiz, 'tarifa_vet_a': tarifa_vet_a, 'tarifa_vet_b': tarifa_vet_b,
+            'jornada_laboral_horas': jornada_laboral_horas, 'costo_refrigerio': costo_refrigerio,
+            'prob_veterano_b': prob_veterano_b,
+        }
         
         # Parámetros de peluqueros
         self.params_peluqueros = {
@@ -196,8 +738,10 @@ class SimulacionPeluqueria:
         
         self.peluqueros: List[Peluquero] = []
         self.clientes: List[Cliente] = []
-        self.cola_espera: List[Cliente] = []
-        self.eventos: List[Evento] = []
+        # Clientes presentes en la peluquería (esperando o en servicio), por id y en orden de llegada
+        self.clientes_activos: Dict[int, Cliente] = {}
+        self.clientes_en_espera = 0  # Total de clientes en las colas de todos los peluqueros
+        self.eventos = CalendarioEventos()
         
         self.tiempo_actual = 0.0
         self.cliente_contador = 0
@@ -210,8 +754,19 @@ class SimulacionPeluqueria:
         self.clientes_con_refrigerio = 0
         self.clientes_atendidos_total = 0
         
-        # Vector de estado
-        self.vector_estado: List[FilaVectorEstado] = []
+        # Coleccionistas suscriptos y sus tipos, y los suscriptores de cada tipo de notificación
+        self._suscripciones: List[Tuple[Coleccionista, FrozenSet[TipoNotificacion]]] = []
+        self._suscriptores: Dict[TipoNotificacion, List[Coleccionista]] = {tipo: [] for tipo in TipoNotificacion}
+        # Las mismas listas, a mano para el camino caliente (sin suscriptores solo se evalúa `if lista`)
+        self._suscriptores_llegada = self._suscriptores[TipoNotificacion.LLEGADA]
+        self._suscriptores_inicio = self._suscriptores[TipoNotificacion.INICIO_ATENCION]
+        self._suscriptores_fin = self._suscriptores[TipoNotificacion.FIN_ATENCION]
+        self._suscriptores_refrigerio = self._suscriptores[TipoNotificacion.REFRIGERIO]
+        self._suscriptores_evento = self._suscriptores[TipoNotificacion.EVENTO_PROCESADO]
+        
+        # Vector de estado (almacenamiento columnar; cada índice devuelve una FilaVectorEstado),
+        # armado por un coleccionista que se suscribe en los días con traza
+        self.registrador_vector = RegistradorVectorEstado()
         
         # Próximo evento de llegada
         self.proximo_llegada = 0.0
@@ -219,6 +774,15 @@ class SimulacionPeluqueria:
         # RNDs temporales para registro
         self.ultimo_rnd = {}
         
+        # Un generador por fuente de azar: dos configuraciones con la misma semilla
+        # comparten las llegadas aunque cambien las probabilidades o los tiempos de servicio
+        self.semilla = semilla
+        self.perfil: Optional[PerfilMotor] = None
+        self.rng_llegadas = random.Random()
+        self.rng_asignacion = random.Random()
+        self.rng_servicio = random.Random()
+        self.sembrar(random.getrandbits(64) if semilla is None else semilla)
+        
         self._inicializar_peluqueros()
     
     def _inicializar_peluqueros(self):
@@ -233,11 +797,111 @@ class SimulacionPeluqueria:
             Peluquero(TipoPeluquero.VETERANO_B, prob_vet_b, t_min_vet_b, t_max_vet_b, tarifa_vet_b)
         ]
     
+    def sembrar(self, semilla, antitetico: bool=False):
+        """Reinicia los generadores de llegadas, asignación y servicio desde una semilla
+        
+        Cada generador usa una semilla derivada distinta, así las tres secuencias son
+        independientes entre sí.
+        
+        Args:
+            semilla: Entero o texto (por ejemplo semilla_dia(semilla_maestra, dia))
+            antitetico: Si es True, cada U de las tres secuencias se reemplaza por 1 - U
+        """
+        clase = GeneradorAntitetico if antitetico else random.Random
+        if type(self.rng_llegadas) is not clase:
+            self.rng_llegadas, self.rng_asignacion, self.rng_servicio = clase(), clase(), clase()
+            if self.perfil is not None:
+                self.perfil.instalar_generadores(self)
+        self.rng_llegadas.seed(f"{semilla}:llegadas")
+        self.rng_asignacion.seed(f"{semilla}:asignacion")
+        self.rng_servicio.seed(f"{semilla}:servicio")
+    
+    @property
+    def vector_estado(self) -> TrazaVectorEstado:
+        """Vector de estado del último día simulado con traza"""
+        return self.registrador_vector.traza
+    
+    def suscribir(self, coleccionista: Coleccionista,
+                  tipos: Optional[Iterable[TipoNotificacion]] = None) -> Coleccionista:
+        """Suscribe un coleccionista a las notificaciones del motor
+        
+        Los coleccionistas reciben las notificaciones en el orden en que se
+        suscribieron. Con simulación paralela solo ven los días simulados en este
+        proceso (en simular_multiples_dias con num_procesos distinto de 1, el último).
+        
+        Args:
+            coleccionista: Objeto con los métodos de Coleccionista
+            tipos: TipoNotificacion a recibir (None = coleccionista.tipos)
+        
+        Returns:
+            El mismo coleccionista
+        """
+        self.desuscribir(coleccionista)
+        tipos = frozenset(coleccionista.tipos if tipos is None else (TipoNotificacion(t) for t in tipos))
+        self._suscripciones.append((coleccionista, tipos))
+        for tipo in tipos:
+            self._suscriptores[tipo].append(coleccionista)
+        return coleccionista
+    
+    def desuscribir(self, coleccionista: Coleccionista):
+        """Deja de notificar al coleccionista (no hace nada si no estaba suscripto)"""
+        for i, (suscripto, tipos) in enumerate(self._suscripciones):
+            if suscripto is coleccionista:
+                del self._suscripciones[i]
+                for tipo in tipos:
+                    self._suscriptores[tipo].remove(coleccionista)
+                return
+    
+    def _suscripciones_externas(self) -> List[Tuple[Coleccionista, FrozenSet[TipoNotificacion]]]:
+        """Suscripciones de los coleccionistas agregados con suscribir (sin el registrador del vector)"""
+        return [(c, tipos) for c, tipos in self._suscripciones if c is not self.registrador_vector]
+    
+    def _preparar_registrador(self, nivel_traza: NivelTraza):
+        """Suscribe el registrador del vector (primero) solo si el día tiene traza"""
+        registrador = self.registrador_vector
+        registrador.completo = nivel_traza is NivelTraza.COMPLETO
+        suscripto = any(c is registrador for c, _ in self._suscripciones)
+        if nivel_traza is NivelTraza.NINGUNO:
+            self.desuscribir(registrador)
+        elif not suscripto:
+            self._suscripciones.insert(0, (registrador, registrador.tipos))
+            self._suscriptores_evento.insert(0, registrador)
+    
+    def _notificar(self, suscriptores: List[Coleccionista], tipo: TipoNotificacion,
+                   cliente: Optional[Cliente] = None, peluquero: Optional[Peluquero] = None,
+                   evento: Optional[Evento] = None):
+        registro = RegistroEvento(tipo, self.tiempo_actual, cliente, peluquero, evento)
+        for coleccionista in suscriptores:
+            coleccionista.notificar(registro)
+    
+    def activar_perfil(self) -> PerfilMotor:
+        """Empieza a contar llamadas y tiempo por sección del motor (ver PerfilMotor)
+
+        Con simulación paralela solo se cuentan los días simulados en este proceso
+        (en simular_multiples_dias con num_procesos distinto de 1, el último).
+
+        Returns:
+            El PerfilMotor nuevo (también queda en self.perfil)
+        """
+        self.desactivar_perfil()
+        self.perfil = PerfilMotor()
+        self.perfil.instalar(self)
+        return self.perfil
+
+    def desactivar_perfil(self) -> Optional[PerfilMotor]:
+        """Deja de contar y devuelve el perfil (sus contadores siguen legibles)"""
+        perfil = self.perfil
+        if perfil is not None:
+            PerfilMotor.desinstalar(self)
+            self.perfil = None
+        return perfil
+    
     def reiniciar(self):
         """Reinicia la simulación"""
         self.clientes = []
-        self.cola_espera = []
-        self.eventos = []
+        self.clientes_activos = {}
+        self.clientes_en_espera = 0
+        self.eventos.limpiar()
         self.tiempo_actual = 0.0
         self.cliente_contador = 0
         self.iteracion = 0
@@ -246,28 +910,22 @@ class SimulacionPeluqueria:
         self.max_clientes_esperando = 0
         self.clientes_con_refrigerio = 0
         self.clientes_atendidos_total = 0
-        self.vector_estado = []
+        self.vector_estado.limpiar()
         self.proximo_llegada = 0.0
         self.ultimo_rnd = {}
         
         for peluquero in self.peluqueros:
             peluquero.liberar()
+            peluquero.cola.clear()
     
-    def _seleccionar_peluquero(self) -> Peluquero:
-        """Selecciona un peluquero basado en las probabilidades"""
-        rand = random.random()
-        acumulado = 0.0
-        
-        for peluquero in self.peluqueros:
-            acumulado += peluquero.probabilidad
-            if rand <= acumulado:
-                return peluquero
-        
-        return self.peluqueros[-1]
+    @property
+    def cola_espera(self) -> List[Cliente]:
+        """Clientes esperando (todas las colas). Vista de compatibilidad, O(n)"""
+        return [c for p in self.peluqueros for c in p.cola]
     
     def _generar_llegada_cliente(self):
         """Genera un nuevo cliente"""
-        rnd_llegada = random.random()
+        rnd_llegada = self.rng_llegadas.random()
         tiempo_entre_llegadas = self.TIEMPO_LLEGADA_MIN + rnd_llegada * (self.TIEMPO_LLEGADA_MAX - self.TIEMPO_LLEGADA_MIN)
         tiempo_llegada = self.tiempo_actual + tiempo_entre_llegadas
         
@@ -283,41 +941,46 @@ class SimulacionPeluqueria:
             evento = Evento(
                 tiempo=tiempo_llegada,
                 tipo=TipoEvento.LLEGADA_CLIENTE,
-                cliente=cliente,
-                descripcion=f"Cliente {cliente.id} llega"
+                cliente=cliente
             )
-            self.eventos.append(evento)
+            self.eventos.programar(evento)
             self.proximo_llegada = tiempo_llegada
         else:
             self.proximo_llegada = float('inf')
     
     def _atender_cliente(self, cliente: Cliente):
         """Asigna un cliente a un peluquero"""
+        # El cliente llega: pasa a estar presente en la peluquería
+        self.clientes_activos[cliente.id] = cliente
+        
         # Seleccionar peluquero según probabilidades
-        rnd_peluquero = random.random()
+        rnd_peluquero = self.rng_asignacion.random()
         self.ultimo_rnd['asignacion_peluquero'] = rnd_peluquero
         
         peluquero = self._seleccionar_peluquero_con_rnd(rnd_peluquero)
         cliente.peluquero_asignado = peluquero
+        if self._suscriptores_llegada:
+            self._notificar(self._suscriptores_llegada, TipoNotificacion.LLEGADA, cliente, peluquero)
         
         # Verificar si hay peluquero del tipo seleccionado disponible
         if peluquero.estado == EstadoPeluquero.LIBRE:
             self._iniciar_atencion(cliente, peluquero)
         else:
-            # Agregar a cola de espera
-            self.cola_espera.append(cliente)
-            cola_total = len(self.cola_espera)
-            self.max_clientes_esperando = max(self.max_clientes_esperando, cola_total)
+            # Agregar a la cola del peluquero asignado
+            peluquero.encolar(cliente)
+            self.clientes_en_espera += 1
+            if self.clientes_en_espera > self.max_clientes_esperando:
+                self.max_clientes_esperando = self.clientes_en_espera
             
             # Programar refrigerio si espera más de 30 minutos
             tiempo_refrigerio = self.tiempo_actual + self.TIEMPO_REFRIGERIO
             evento_refrigerio = Evento(
                 tiempo=tiempo_refrigerio,
                 tipo=TipoEvento.REFRIGERIO,
-                cliente=cliente,
-                descripcion=f"Cliente {cliente.id} recibe refrigerio"
+                cliente=cliente
             )
-            self.eventos.append(evento_refrigerio)
+            self.eventos.programar(evento_refrigerio)
+            cliente.evento_refrigerio = evento_refrigerio
     
     def _seleccionar_peluquero_con_rnd(self, rnd: float) -> Peluquero:
         """Selecciona un peluquero basado en un RND dado"""
@@ -335,14 +998,19 @@ class SimulacionPeluqueria:
         """Inicia la atención de un cliente"""
         cliente.tiempo_inicio_atencion = self.tiempo_actual
         
+        # El refrigerio pendiente ya no puede entregarse: cancelarlo
+        if cliente.evento_refrigerio is not None:
+            if not self.registrar_refrigerios_obsoletos:
+                self.eventos.cancelar(cliente.evento_refrigerio)
+            cliente.evento_refrigerio = None
+        
         # Generar tiempo de servicio con RND
-        rnd_servicio = random.random()
+        rnd_servicio = self.rng_servicio.random()
         tiempo_servicio = peluquero.tiempo_min + rnd_servicio * (peluquero.tiempo_max - peluquero.tiempo_min)
         self.ultimo_rnd['tiempo_servicio'] = rnd_servicio
         self.ultimo_rnd['duracion_servicio'] = tiempo_servicio
         
-        peluquero.asignar_cliente(cliente, self.tiempo_actual)
-        peluquero.tiempo_fin_atencion = self.tiempo_actual + tiempo_servicio
+        peluquero.asignar_cliente(cliente, self.tiempo_actual, tiempo_servicio)
         cliente.tiempo_fin_atencion = peluquero.tiempo_fin_atencion
         
         # Programar fin de atención
@@ -350,46 +1018,44 @@ class SimulacionPeluqueria:
             tiempo=peluquero.tiempo_fin_atencion,
             tipo=TipoEvento.FIN_ATENCION,
             cliente=cliente,
-            peluquero=peluquero,
-            descripcion=f"Cliente {cliente.id} termina con {peluquero.tipo.value}"
+            peluquero=peluquero
         )
-        self.eventos.append(evento)
+        self.eventos.programar(evento)
         
         # Registrar recaudación
         self.recaudacion_total += peluquero.tarifa
+        if self._suscriptores_inicio:
+            self._notificar(self._suscriptores_inicio, TipoNotificacion.INICIO_ATENCION, cliente, peluquero)
     
     def _procesar_evento(self, evento: Evento):
         """Procesa un evento"""
         self.tiempo_actual = evento.tiempo
         self.iteracion += 1
-        self.ultimo_rnd = {}  # Resetear RNDs
-        
-        nombre_evento = ""
+        avisar_evento = bool(self._suscriptores_evento)
+        if avisar_evento:
+            self.ultimo_rnd = {}  # Resetear RNDs (el vector de estado registra los del evento)
         
         if evento.tipo == TipoEvento.LLEGADA_CLIENTE:
-            nombre_evento = f"Llegada Cliente {evento.cliente.id}"
             self._atender_cliente(evento.cliente)
             self._generar_llegada_cliente()
         
         elif evento.tipo == TipoEvento.FIN_ATENCION:
             peluquero = evento.peluquero
-            nombre_evento = f"Fin Atención C{evento.cliente.id} ({peluquero.tipo.value})"
             self.clientes_atendidos_total += 1
+            del self.clientes_activos[evento.cliente.id]
             peluquero.liberar()
+            if self._suscriptores_fin:
+                self._notificar(self._suscriptores_fin, TipoNotificacion.FIN_ATENCION, evento.cliente, peluquero)
             
-            # Atender siguiente cliente en cola del mismo tipo de peluquero
-            clientes_en_espera = [c for c in self.cola_espera 
-                                 if c.peluquero_asignado == peluquero 
-                                 and c.tiempo_inicio_atencion == 0]
-            
-            if clientes_en_espera:
-                siguiente = clientes_en_espera[0]
-                self.cola_espera.remove(siguiente)
+            # Atender siguiente cliente en la cola de este peluquero
+            siguiente = peluquero.siguiente_en_cola()
+            if siguiente is not None:
+                self.clientes_en_espera -= 1
                 self._iniciar_atencion(siguiente, peluquero)
         
         elif evento.tipo == TipoEvento.REFRIGERIO:
             cliente = evento.cliente
-            nombre_evento = f"Refrigerio Cliente {cliente.id}"
+            cliente.evento_refrigerio = None
             # Solo dar refrigerio si aún está esperando
             if cliente.tiempo_inicio_atencion == 0 or cliente.tiempo_inicio_atencion > evento.tiempo:
                 if not cliente.recibio_refrigerio:
@@ -397,141 +1063,27 @@ class SimulacionPeluqueria:
                     cliente.tiempo_refrigerio = evento.tiempo
                     self.costo_refrigerios += self.COSTO_REFRIGERIO
                     self.clientes_con_refrigerio += 1
+                    if self._suscriptores_refrigerio:
+                        self._notificar(self._suscriptores_refrigerio, TipoNotificacion.REFRIGERIO, cliente)
         
-        # Registrar fila del vector de estado
-        self._registrar_vector_estado(nombre_evento)
-    
-    def _registrar_vector_estado(self, nombre_evento: str):
-        """Registra una fila en el vector de estado"""
-        aprendiz = self.peluqueros[0]
-        veterano_a = self.peluqueros[1]
-        veterano_b = self.peluqueros[2]
-        
-        # Calcular próximos eventos
-        proximos_eventos = [e for e in self.eventos if e.tiempo >= self.tiempo_actual]
-        
-        proximo_llegada = self.proximo_llegada if self.proximo_llegada != float('inf') else 0
-        
-        # Encontrar próximo fin de atención para cada peluquero
-        proximo_fin_aprendiz = 0.0
-        proximo_fin_vet_a = 0.0
-        proximo_fin_vet_b = 0.0
-        
-        for evento in proximos_eventos:
-            if evento.tipo == TipoEvento.FIN_ATENCION and evento.peluquero:
-                if evento.peluquero.tipo == TipoPeluquero.APRENDIZ:
-                    proximo_fin_aprendiz = evento.tiempo
-                elif evento.peluquero.tipo == TipoPeluquero.VETERANO_A:
-                    proximo_fin_vet_a = evento.tiempo
-                elif evento.peluquero.tipo == TipoPeluquero.VETERANO_B:
-                    proximo_fin_vet_b = evento.tiempo
-        
-        # Contar clientes en cada cola
-        cola_aprendiz = len([c for c in self.cola_espera if c.peluquero_asignado == aprendiz])
-        cola_vet_a = len([c for c in self.cola_espera if c.peluquero_asignado == veterano_a])
-        cola_vet_b = len([c for c in self.cola_espera if c.peluquero_asignado == veterano_b])
-        
-        fila = FilaVectorEstado(
-            iteracion=self.iteracion,
-            reloj=self.tiempo_actual,
-            evento=nombre_evento,
-            rnd_evento=self.ultimo_rnd.copy(),
-            
-            # Próximos eventos
-            proximo_llegada=proximo_llegada,
-            proximo_fin_aprendiz=proximo_fin_aprendiz,
-            proximo_fin_veterano_a=proximo_fin_vet_a,
-            proximo_fin_veterano_b=proximo_fin_vet_b,
-            
-            # Estado peluqueros
-            estado_aprendiz=aprendiz.estado.value,
-            estado_veterano_a=veterano_a.estado.value,
-            estado_veterano_b=veterano_b.estado.value,
-            
-            # Clientes atendiendo
-            cliente_aprendiz=f"C{aprendiz.cliente_actual.id}" if aprendiz.cliente_actual else "-",
-            cliente_veterano_a=f"C{veterano_a.cliente_actual.id}" if veterano_a.cliente_actual else "-",
-            cliente_veterano_b=f"C{veterano_b.cliente_actual.id}" if veterano_b.cliente_actual else "-",
-            
-            # Colas
-            cola_aprendiz=cola_aprendiz,
-            cola_veterano_a=cola_vet_a,
-            cola_veterano_b=cola_vet_b,
-            
-            # Acumuladores
-            clientes_atendidos=self.clientes_atendidos_total,
-            recaudacion_acum=self.recaudacion_total,
-            costo_refrigerios_acum=self.costo_refrigerios,
-            clientes_con_refrigerio=self.clientes_con_refrigerio,
-            max_cola_total=self.max_clientes_esperando,
-            
-            # Tiempos fin
-            tiempo_fin_aprendiz=aprendiz.tiempo_fin_atencion,
-            tiempo_fin_veterano_a=veterano_a.tiempo_fin_atencion,
-            tiempo_fin_veterano_b=veterano_b.tiempo_fin_atencion
-        )
-        # Construir snapshot de clientes: incluir SOLO los clientes que aún existen en el sistema
-        # (objetos temporales activos: esperando o en servicio)
-        clientes_snapshot = []
-        for c in self.clientes:
-            # Determinar estado del cliente
-            if c.tiempo_fin_atencion > 0 and c.tiempo_fin_atencion <= self.tiempo_actual:
-                # Cliente ya fue atendido = objeto destruido, NO incluir en snapshot
-                continue
-            elif c.tiempo_inicio_atencion > 0 and c.tiempo_inicio_atencion <= self.tiempo_actual:
-                # Está siendo atendido
-                if c.tiempo_fin_atencion > self.tiempo_actual:
-                    # Determinar nombre del peluquero
-                    if c.peluquero_asignado:
-                        if c.peluquero_asignado.tipo == TipoPeluquero.APRENDIZ:
-                            estado = 'En Servicio Aprendiz'
-                        elif c.peluquero_asignado.tipo == TipoPeluquero.VETERANO_A:
-                            estado = 'En Servicio Vet A'
-                        else:
-                            estado = 'En Servicio Vet B'
-                    else:
-                        estado = 'En Servicio'
-                else:
-                    # Ya terminó = objeto destruido, NO incluir
-                    continue
-            else:
-                # No inició atención aún
-                if c.tiempo_llegada > self.tiempo_actual:
-                    # Aún no ha llegado, NO incluir (no existe todavía)
-                    continue
-                # Está esperando - determinar a qué peluquero
-                if c.peluquero_asignado:
-                    if c.peluquero_asignado.tipo == TipoPeluquero.APRENDIZ:
-                        estado = 'Esperando Aprendiz'
-                    elif c.peluquero_asignado.tipo == TipoPeluquero.VETERANO_A:
-                        estado = 'Esperando Vet A'
-                    else:
-                        estado = 'Esperando Vet B'
-                else:
-                    estado = 'Esperando'
-
-            hora_inicio_espera = c.tiempo_llegada
-            tiempo_espera = c.tiempo_espera if c.tiempo_espera else 0.0
-
-            clientes_snapshot.append({
-                'id': c.id,
-                'estado': estado,
-                'hora_inicio_espera': hora_inicio_espera,
-                'tiempo_espera': tiempo_espera
-            })
-
-        fila.clientes_snapshot = clientes_snapshot
-
-        self.vector_estado.append(fila)
-    
-    def simular_dia(self, tiempo_max=None, max_iteraciones=100000):
+        # Avisar el evento procesado (el registrador agrega aquí la fila del vector de estado)
+        if avisar_evento:
+            self._notificar(self._suscriptores_evento, TipoNotificacion.EVENTO_PROCESADO,
+                            evento.cliente, evento.peluquero, evento)
+    
+    def simular_dia(self, tiempo_max=None, max_iteraciones=100000, nivel_traza=None):
         """Simula un día de trabajo
         
         Args:
             tiempo_max: Tiempo máximo de simulación en minutos (por defecto jornada completa)
             max_iteraciones: Máximo número de iteraciones permitidas
+            nivel_traza: NivelTraza para este día (None = el de la simulación)
         """
         self.reiniciar()
+        self._nivel_traza_dia = self.nivel_traza if nivel_traza is None else NivelTraza(nivel_traza)
+        self._preparar_registrador(self._nivel_traza_dia)
+        for coleccionista, _ in list(self._suscripciones):
+            coleccionista.al_iniciar_dia(self)
         
         if tiempo_max is None:
             tiempo_max = self.JORNADA_LABORAL * 2  # Permitir tiempo extra para terminar
@@ -541,11 +1093,8 @@ class SimulacionPeluqueria:
         
         # Procesar eventos mientras haya eventos pendientes
         while self.eventos and self.iteracion < max_iteraciones:
-            # Ordenar eventos por tiempo
-            self.eventos.sort(key=lambda e: e.tiempo)
-            
-            # Procesar siguiente evento
-            evento = self.eventos.pop(0)
+            # Procesar siguiente evento (el de menor tiempo)
+            evento = self.eventos.extraer()
             
             # Si el evento supera el tiempo máximo, detener
             if evento.tiempo > tiempo_max:
@@ -559,11 +1108,14 @@ class SimulacionPeluqueria:
             
             # Terminar cuando no queden clientes por atender y todos los peluqueros estén libres
             if (self.tiempo_actual > self.JORNADA_LABORAL and 
-                not self.cola_espera and 
+                self.clientes_en_espera == 0 and 
                 all(p.estado == EstadoPeluquero.LIBRE for p in self.peluqueros)):
                 break
         
-        return self._obtener_estadisticas_dia()
+        estadisticas = self._obtener_estadisticas_dia()
+        for coleccionista, _ in list(self._suscripciones):
+            coleccionista.al_terminar_dia(self, estadisticas)
+        return estadisticas
     
     def _obtener_estadisticas_dia(self):
         """Obtiene las estadísticas del día simulado"""
@@ -573,6 +1125,7 @@ class SimulacionPeluqueria:
             'ganancia_neta': self.recaudacion_total - self.costo_refrigerios,
             'clientes_atendidos': self.clientes_atendidos_total,
             'clientes_con_refrigerio': self.clientes_con_refrigerio,
+            'clientes_llegados': len(self.clientes_activos) + self.clientes_atendidos_total,
             'max_sillas_necesarias': self.max_clientes_esperando,
             'tiempo_fin': self.tiempo_actual,
             'iteraciones': self.iteracion
@@ -588,56 +1141,351 @@ class SimulacionPeluqueria:
         Returns:
             Lista de filas del vector de estado + última fila
         """
-        # Filtrar filas desde hora_inicio
-        filas_filtradas = [f for f in self.vector_estado if f.reloj >= hora_inicio]
+        traza = self.vector_estado
         
-        if num_filas is not None and len(filas_filtradas) > num_filas:
-            # Tomar las primeras num_filas
-            resultado = filas_filtradas[:num_filas]
-        else:
-            resultado = filas_filtradas
+        # El reloj es no decreciente: la primera fila con reloj >= hora_inicio se busca por bisección
+        inicio = traza.indice_desde_reloj(hora_inicio)
+        fin = len(traza) if num_filas is None else min(len(traza), inicio + num_filas)
+        resultado = traza[inicio:fin]
         
         # Siempre agregar la última fila si no está incluida
-        if self.vector_estado and (not resultado or resultado[-1] != self.vector_estado[-1]):
-            resultado.append(self.vector_estado[-1])
+        if traza and (fin < len(traza) or not resultado):
+            resultado.append(traza[-1])
         
         return resultado
     
-    def simular_multiples_dias(self, num_dias: int):
-        """Simula múltiples días y devuelve estadísticas agregadas"""
-        resultados = []
+    def simular_multiples_dias(self, num_dias: int, tiempo_max=None, max_iteraciones=100000,
+                               semilla: Optional[int]=None, num_procesos: Optional[int]=1,
+                               guardar_diarios: bool=True,
+                               objetivo: Optional[ObjetivoPrecision]=None,
+                               al_completar_dia: Optional[Callable[[Dict], None]]=None,
+                               antiteticos: bool=False, checkpoint: Optional[str]=None,
+                               segundos_checkpoint: float=5.0):
+        """Simula múltiples días y devuelve estadísticas agregadas
         
-        for dia in range(num_dias):
-            stats = self.simular_dia()
-            stats['dia'] = dia + 1
-            resultados.append(stats)
+        Solo el último día registra el vector de estado (con el nivel_traza de la
+        simulación); los demás días se simulan sin traza. Ver iterar_dias para
+        semilla, num_procesos y antiteticos. Con guardar_diarios=False,
+        'resultados_diarios' queda vacío y la memoria no crece con num_dias.
+        
+        Con un objetivo de precisión, num_dias pasa a ser el máximo de días: la
+        simulación se detiene antes si se alcanzan los semianchos pedidos o se agota
+        objetivo.max_segundos. El resultado indica en 'criterio_parada' el motivo
+        ('precision', 'tiempo' o 'dias').
+        
+        Con antiteticos, los intervalos de confianza se calculan sobre los promedios
+        de cada par y el resultado incluye la reducción de varianza lograda.
+        
+        Sin antiteticos y con tiempo_max de al menos una jornada, el resultado
+        incluye además las estimaciones con variable de control (clientes llegados)
+        de la recaudación promedio y de P(5+ refrigerios): claves terminadas en '_vc'.
         
-        return self._calcular_estadisticas_agregadas(resultados)
+        Con checkpoint (ruta de archivo), cada segundos_checkpoint se guardan ahí los
+        acumuladores, el último día simulado y la semilla maestra. Si el archivo ya
+        existe y es de una corrida con la misma configuración, la simulación se
+        reanuda desde el día siguiente y da el mismo resultado que sin interrupción
+        (cada día tiene su semilla; sin semilla se usa la guardada o una al azar). El
+        archivo se borra al terminar. El resultado indica en 'reanudado_desde_dia' el
+        último día que venía del checkpoint (0 si se empezó de cero).
+        
+        Args:
+            al_completar_dia: Función llamada con las estadísticas de cada día (en orden);
+                al reanudar, solo con los días nuevos
+        """
+        # La variable de control supone que las llegadas de toda la jornada se procesan
+        media_llegadas = None
+        if tiempo_max is None or tiempo_max >= self.JORNADA_LABORAL:
+            media_llegadas = self.llegadas_esperadas()
+        acumulador = AcumuladorDias(guardar_diarios, pares=antiteticos, media_llegadas=media_llegadas)
+        primer_dia = 1
+        if checkpoint is not None:
+            firma = {'version_motor': VERSION_MOTOR, 'params_modelo': self.params_modelo, 'num_dias': num_dias,
+                     'tiempo_max': tiempo_max, 'max_iteraciones': max_iteraciones,
+                     'guardar_diarios': guardar_diarios, 'antiteticos': antiteticos,
+                     'objetivo': asdict(objetivo) if objetivo is not None else None}
+            estado = _cargar_checkpoint(checkpoint)
+            if estado is not None and estado['firma'] == firma and semilla in (None, estado['semilla']):
+                semilla = estado['semilla']
+                acumulador = estado['acumulador']
+                primer_dia = estado['dia'] + 1
+            elif semilla is None:
+                semilla = self.semilla if self.semilla is not None else random.getrandbits(64)
+            ultimo_checkpoint = time.perf_counter()
+        detener = None
+        if objetivo is not None:
+            inicio = time.perf_counter()
+            detener = lambda: objetivo.cumplido(acumulador) or objetivo.tiempo_agotado(inicio)
+        
+        dias = self.iterar_dias(num_dias, tiempo_max, max_iteraciones, semilla, num_procesos, detener, antiteticos,
+                                primer_dia)
+        for stats in dias:
+            acumulador.agregar(stats)
+            if al_completar_dia is not None:
+                al_completar_dia(stats)
+            # Con antitéticos solo se guarda con el par completo
+            if (checkpoint is not None and stats['dia'] % (2 if antiteticos else 1) == 0
+                    and time.perf_counter() - ultimo_checkpoint >= segundos_checkpoint):
+                _guardar_checkpoint(checkpoint, {'firma': firma, 'semilla': semilla, 'dia': stats['dia'],
+                                                 'acumulador': acumulador})
+                ultimo_checkpoint = time.perf_counter()
+        
+        resultado = acumulador.resultado()
+        if checkpoint is not None:
+            if os.path.exists(checkpoint):
+                os.remove(checkpoint)
+            resultado['reanudado_desde_dia'] = primer_dia - 1
+        if objetivo is not None and resultado:
+            if objetivo.cumplido(acumulador):
+                resultado['criterio_parada'] = 'precision'
+            elif objetivo.tiempo_agotado(inicio):
+                resultado['criterio_parada'] = 'tiempo'
+            else:
+                resultado['criterio_parada'] = 'dias'
+        return resultado
     
-    def _calcular_estadisticas_agregadas(self, resultados):
-        """Calcula estadísticas agregadas de múltiples días"""
-        if not resultados:
-            return {}
+    def iterar_dias(self, num_dias: int, tiempo_max=None, max_iteraciones=100000,
+                    semilla: Optional[int]=None, num_procesos: Optional[int]=1,
+                    detener: Optional[Callable[[], bool]]=None, antiteticos: bool=False,
+                    primer_dia: int=1):
+        """Simula num_dias días y devuelve (generador) las estadísticas de cada uno en orden
         
-        recaudaciones = [r['recaudacion'] for r in resultados]
-        ganancias = [r['ganancia_neta'] for r in resultados]
-        sillas = [r['max_sillas_necesarias'] for r in resultados]
-        refrigerios = [r['clientes_con_refrigerio'] for r in resultados]
+        Con semilla, con más de un proceso o con antiteticos, cada día usa su propia
+        semilla derivada de la semilla maestra (ver semilla_dia), así el resultado es
+        idéntico con cualquier cantidad de procesos. Los días 1..num_dias-1 se reparten
+        en bloques entre num_procesos procesos (None = todos los núcleos); el último
+        día se simula en esta instancia para que quede su vector de estado.
         
-        # Probabilidad de 5 o más refrigerios
-        dias_5_o_mas = len([r for r in refrigerios if r >= 5])
-        prob_5_o_mas = dias_5_o_mas / len(resultados) if resultados else 0
+        Args:
+            num_dias: Cantidad de días a simular
+            tiempo_max: Tiempo máximo de simulación por día
+            max_iteraciones: Máximo de eventos por día
+            semilla: Semilla maestra (None = la de la instancia, o una al azar si no tiene)
+            num_procesos: Procesos a usar (1 = sin pool, en este proceso)
+            detener: Se consulta después de cada día (de cada par con antiteticos); si
+                devuelve True se simula un único día más (un par) y se termina
+            antiteticos: Simular pares de días con uniformes U y 1 - U (num_dias par)
+            primer_dia: Primer día a simular (para reanudar; requiere semilla maestra
+                y, con antiteticos, que sea el primero de un par)
+        """
+        if num_dias < primer_dia:
+            return
+        # La semilla del constructor vale como semilla maestra en todos los caminos,
+        # así el resultado no depende de la cantidad de procesos
+        if semilla is None:
+            semilla = self.semilla
+        if antiteticos and num_dias % 2:
+            raise ValueError("Con variables antitéticas el número de días debe ser par")
+        if primer_dia > 1 and (semilla is None or (antiteticos and primer_dia % 2 == 0)):
+            raise ValueError("Para empezar después del día 1 hace falta la semilla maestra y un par completo")
         
-        return {
-            'num_dias': len(resultados),
-            'recaudacion_promedio': sum(recaudaciones) / len(recaudaciones),
-            'recaudacion_min': min(recaudaciones),
-            'recaudacion_max': max(recaudaciones),
-            'ganancia_promedio': sum(ganancias) / len(ganancias),
-            'max_sillas_necesarias': max(sillas),
-            'sillas_promedio': sum(sillas) / len(sillas),
-            'refrigerios_promedio': sum(refrigerios) / len(refrigerios),
-            'prob_5_o_mas_refrigerios': prob_5_o_mas,
-            'dias_5_o_mas_refrigerios': dias_5_o_mas,
-            'resultados_diarios': resultados
-        }
+        dia = 0
+        if semilla is None and num_procesos == 1 and not antiteticos:
+            for dia in range(1, num_dias):
+                stats = self.simular_dia(tiempo_max, max_iteraciones, NivelTraza.NINGUNO)
+                stats['dia'] = dia
+                yield stats
+                if detener is not None and detener():
+                    break
+            stats = self.simular_dia(tiempo_max, max_iteraciones, self.nivel_traza)
+            stats['dia'] = dia + 1
+            yield stats
+            return
+        
+        if semilla is None:
+            semilla = random.getrandbits(64)
+        num_procesos = num_procesos or os.cpu_count() or 1
+        
+        dias_previos = num_dias - 1
+        tamano_bloque = max(1, math.ceil((dias_previos - primer_dia + 1) / (num_procesos * 4)))
+        if detener is not None:
+            # detener se consulta a medida que llegan los días: con bloques chicos los
+            # que quedan en vuelo al detenerse (y se descartan) son pocos
+            tamano_bloque = min(tamano_bloque, DIAS_POR_BLOQUE_CON_DETENER)
+        bloques = [(self.params_modelo, inicio, min(inicio + tamano_bloque, dias_previos + 1),
+                    semilla, tiempo_max, max_iteraciones, antiteticos)
+                   for inicio in range(primer_dia, dias_previos + 1, tamano_bloque)]
+        
+        # Días entregados antes del último; con antitéticos solo se corta al completar un par
+        paso = 2 if antiteticos else 1
+        ultimo_dia = num_dias
+        
+        def dias_previos_al_ultimo(estadisticas):
+            nonlocal ultimo_dia
+            for stats in estadisticas:
+                yield stats
+                if stats['dia'] == ultimo_dia - 1:
+                    return
+                if stats['dia'] % paso == 0 and detener is not None and detener():
+                    ultimo_dia = stats['dia'] + paso
+                    if paso == 1:
+                        return
+        
+        if num_procesos == 1 or len(bloques) <= 1:
+            # En este proceso los días se simulan de a uno, a medida que se piden: al
+            # detenerse no queda ningún día simulado de más
+            suscripciones = self._suscripciones_externas()
+            yield from dias_previos_al_ultimo(_estadisticas_desde_tuplas(
+                _iterar_bloque_dias(*bloque, perfil=self.perfil, suscripciones=suscripciones) for bloque in bloques))
+        else:
+            # Import diferido: multiprocessing solo hace falta para correr en paralelo
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=min(num_procesos, len(bloques)),
+                                     mp_context=contexto_procesos()) as pool:
+                # A lo sumo dos bloques por proceso en vuelo; cada bloque entregado
+                # libera el lugar para el siguiente
+                en_vuelo = deque()
+                por_enviar = iter(bloques)
+                
+                def resultados_en_orden():
+                    for bloque in itertools.islice(por_enviar, num_procesos * 2):
+                        en_vuelo.append(pool.submit(_simular_bloque_dias, *bloque))
+                    while en_vuelo:
+                        tuplas = en_vuelo[0].result()
+                        en_vuelo.popleft()
+                        for bloque in itertools.islice(por_enviar, 1):
+                            en_vuelo.append(pool.submit(_simular_bloque_dias, *bloque))
+                        yield tuplas
+                
+                yield from dias_previos_al_ultimo(_estadisticas_desde_tuplas(resultados_en_orden()))
+                # Los bloques que todavía no empezaron no se simulan
+                for futuro in en_vuelo:
+                    futuro.cancel()
+        
+        # Último día, con su semilla y vector de estado
+        yield self.repetir_dia(ultimo_dia, semilla, tiempo_max, max_iteraciones, antiteticos)
+    
+    def repetir_dia(self, dia: int, semilla, tiempo_max=None, max_iteraciones=100000,
+                    antiteticos: bool=False):
+        """Vuelve a simular, con el nivel_traza de la simulación, el día número dia de
+        una corrida con semilla maestra (iterar_dias con semilla)
+        
+        Deja el mismo vector de estado y clientes que dejó esa corrida en su último
+        día; sirve para recuperar la traza de un resultado guardado sin guardarla.
+        """
+        _sembrar_dia(self, semilla, dia, antiteticos)
+        stats = self.simular_dia(tiempo_max, max_iteraciones, self.nivel_traza)
+        stats['dia'] = dia
+        return stats
+    
+    def llegadas_esperadas(self) -> float:
+        """Esperanza de clientes llegados en una jornada (se calcula una vez por simulación)"""
+        if self._llegadas_esperadas is None:
+            self._llegadas_esperadas = llegadas_esperadas(
+                self.JORNADA_LABORAL, self.TIEMPO_LLEGADA_MIN, self.TIEMPO_LLEGADA_MAX)
+        return self._llegadas_esperadas
+    
+    def _calcular_estadisticas_agregadas(self, resultados, variable_control: bool=True):
+        """Calcula estadísticas agregadas de múltiples días
+        
+        Con variable_control, agrega las estimaciones ajustadas por la cantidad de
+        clientes llegados (claves '_vc'); solo son válidas si los días se simularon
+        con tiempo_max de al menos una jornada.
+        """
+        acumulador = AcumuladorDias(media_llegadas=self.llegadas_esperadas() if variable_control else None)
+        for stats in resultados:
+            acumulador.agregar(stats)
+        return acumulador.resultado()
+
+
+# Versión del motor: cambiarla cuando un cambio del motor altere los resultados de una
+# misma configuración y semilla (invalida los resultados guardados en cache)
+VERSION_MOTOR = 1
+
+
+# Estadísticas de un día que devuelven los procesos de iterar_dias, en este orden
+# Tamaño máximo de los bloques del pool cuando iterar_dias tiene criterio de parada
+DIAS_POR_BLOQUE_CON_DETENER = 64
+
+CAMPOS_ESTADISTICAS_DIA = ('recaudacion', 'costo_refrigerios', 'ganancia_neta', 'clientes_atendidos',
+                           'clientes_con_refrigerio', 'clientes_llegados', 'max_sillas_necesarias',
+                           'tiempo_fin', 'iteraciones')
+
+
+def semilla_dia(semilla_maestra: int, dia: int) -> str:
+    """Semilla del día número dia (desde 1) derivada de la semilla maestra
+    
+    Depende solo de (semilla_maestra, dia), no del proceso que simula el día.
+    random.Random.seed pasa el texto por SHA-512, así días consecutivos quedan
+    con secuencias independientes.
+    """
+    return f"{semilla_maestra}:{dia}"
+
+
+def contexto_procesos():
+    """Contexto de multiprocessing para los pools de procesos de la simulación
+    
+    Siempre 'spawn': con 'fork' (el default en Linux) un pool creado desde un hilo,
+    como el QThread de la interfaz, copia locks tomados por otros hilos y los
+    procesos hijos pueden quedar bloqueados para siempre.
+    """
+    # Import diferido: multiprocessing solo hace falta para correr en paralelo
+    import multiprocessing
+    return multiprocessing.get_context('spawn')
+
+
+def _sembrar_dia(sim: 'SimulacionPeluqueria', semilla_maestra, dia: int, antiteticos: bool):
+    """Siembra sim para el día número dia
+    
+    Con antiteticos, los días 2k-1 y 2k forman un par: comparten la semilla
+    semilla_dia(semilla_maestra, k) y el día par usa las uniformes espejadas (1 - U).
+    """
+    if antiteticos:
+        sim.sembrar(semilla_dia(semilla_maestra, (dia + 1) // 2), antitetico=dia % 2 == 0)
+    else:
+        sim.sembrar(semilla_dia(semilla_maestra, dia))
+
+
+def _iterar_bloque_dias(params_modelo, primer_dia, fin_dias, semilla_maestra, tiempo_max, max_iteraciones,
+                       antiteticos=False, perfil: Optional[PerfilMotor]=None,
+                       suscripciones: Iterable[Tuple[Coleccionista, FrozenSet[TipoNotificacion]]]=()):
+    """Simula los días [primer_dia, fin_dias) sin traza y devuelve (generador) una tupla por día
+    
+    Las tuplas (CAMPOS_ESTADISTICAS_DIA) viajan compactas desde los procesos del
+    pool. En el proceso principal, perfil y los coleccionistas de suscripciones (los
+    de la simulación que itera) también ven estos días.
+    """
+    sim = SimulacionPeluqueria(**params_modelo)
+    for coleccionista, tipos in suscripciones:
+        sim.suscribir(coleccionista, tipos)
+    if perfil is not None:
+        sim.perfil = perfil
+        perfil.instalar(sim)
+    for dia in range(primer_dia, fin_dias):
+        _sembrar_dia(sim, semilla_maestra, dia, antiteticos)
+        stats = sim.simular_dia(tiempo_max, max_iteraciones, NivelTraza.NINGUNO)
+        yield (dia,) + tuple(stats[campo] for campo in CAMPOS_ESTADISTICAS_DIA)
+
+
+def _simular_bloque_dias(params_modelo, primer_dia, fin_dias, semilla_maestra, tiempo_max, max_iteraciones,
+                         antiteticos=False):
+    """Lista de _iterar_bloque_dias (se ejecuta en los procesos del pool)"""
+    return list(_iterar_bloque_dias(params_modelo, primer_dia, fin_dias, semilla_maestra, tiempo_max,
+                                    max_iteraciones, antiteticos))
+
+
+def _guardar_checkpoint(ruta: str, estado: Dict):
+    """Guarda el estado de una corrida (escritura a un temporal y renombrado atómico)"""
+    import pickle
+    temporal = ruta + '.tmp'
+    with open(temporal, 'wb') as archivo:
+        pickle.dump(estado, archivo, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporal, ruta)
+
+
+def _cargar_checkpoint(ruta: str) -> Optional[Dict]:
+    """Estado guardado por _guardar_checkpoint, o None si no hay uno legible"""
+    import pickle
+    try:
+        with open(ruta, 'rb') as archivo:
+            return pickle.load(archivo)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+
+
+def _estadisticas_desde_tuplas(tuplas_por_bloque):
+    """Convierte las tuplas de _iterar_bloque_dias en diccionarios de estadísticas del día"""
+    for tuplas in tuplas_por_bloque:
+        for dia, *valores in tuplas:
+            stats = dict(zip(CAMPOS_ESTADISTICAS_DIA, valores))
+            stats['dia'] = dia
+            yield stats
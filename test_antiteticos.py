@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test de las réplicas con variables antitéticas
+Verifica el espejado de las uniformes y la reducción de varianza de la recaudación
+"""
+
+import random
+import sys
+
+from simulacion import GeneradorAntitetico, SimulacionPeluqueria
+
+
+def test_generador_espejado():
+    """El generador antitético devuelve 1 - U de la misma secuencia"""
+    print("=" * 60)
+    print("TEST: Generador antitético")
+    print("=" * 60)
+
+    normal, espejo = random.Random("x"), GeneradorAntitetico("x")
+    for _ in range(100):
+        assert abs(normal.random() + espejo.random() - 1.0) < 1e-12
+    print("  ✅ U + (1 - U) = 1")
+    return True
+
+
+def test_reduccion_de_varianza():
+    """Los pares antitéticos reducen la varianza de la recaudación promedio"""
+    print("\n" + "=" * 60)
+    print("TEST: Reducción de varianza")
+    print("=" * 60)
+
+    r = SimulacionPeluqueria().simular_multiples_dias(400, semilla=17, antiteticos=True)
+    assert len(r['resultados_diarios']) == 400
+    print(f"  Recaudación promedio: ${r['recaudacion_promedio']:,.2f}")
+    print(f"  Reducción de varianza (recaudación): {r['reduccion_varianza_recaudacion']:.2f}x")
+    print(f"  Reducción de varianza (P(5+)): {r['reduccion_varianza_prob_5_o_mas']:.2f}x")
+    assert r['reduccion_varianza_recaudacion'] > 2
+
+    # Mismo resultado con más procesos
+    assert r == SimulacionPeluqueria().simular_multiples_dias(400, semilla=17, antiteticos=True, num_procesos=2)
+
+    try:
+        SimulacionPeluqueria().simular_multiples_dias(401, semilla=17, antiteticos=True)
+        assert False, "Con un número impar de días debe fallar"
+    except ValueError:
+        pass
+    print("  ✅ Varianza reducida y resultados reproducibles")
+    return True
+
+
+def main():
+    ok = test_generador_espejado() and test_reduccion_de_varianza()
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test del barrido de parámetros
+Verifica números aleatorios comunes, paralelismo reproducible (también con un solo punto),
+reutilización de la cache y los errores de la CLI
+"""
+
+import contextlib
+import csv
+import io
+import os
+import sys
+import tempfile
+
+from barrido import barrer, main, parsear_rango
+from cache_resultados import CacheResultados, clave_simulacion
+from simulacion import SimulacionPeluqueria
+
+
+def test_barrido_con_cache():
+    """Mismo resultado con 1 y 2 procesos; la segunda corrida sale de la cache"""
+    print("=" * 60)
+    print("TEST: Barrido de parámetros")
+    print("=" * 60)
+
+    assert parsear_rango('0.1:0.3:0.1') == [0.1, 0.2, 0.3]
+    assert parsear_rango('10,12') == [10, 12]
+
+    grilla = {'prob_aprendiz': [0.1, 0.3], 'tiempo_llegada_max': [10, 12]}
+    serie = barrer(grilla, num_dias=20, semilla=5)
+    paralelo = barrer(grilla, num_dias=20, semilla=5, num_procesos=2)
+    assert serie == paralelo and len(serie) == 4
+    for fila in serie:
+        print(f"  {fila['prob_aprendiz']:.1f} / {fila['tiempo_llegada_max']}: "
+              f"${fila['recaudacion_promedio']:,.2f}")
+
+    with tempfile.TemporaryDirectory() as directorio:
+        cache = CacheResultados(directorio)
+        primera = barrer(grilla, num_dias=20, semilla=5, cache=cache)
+        segunda = barrer(grilla, num_dias=20, semilla=5, cache=cache)
+        otra_semilla = barrer(grilla, num_dias=20, semilla=6, cache=cache)
+        # La GUI usa la clave con días guardados: no recibe un resultado del barrido sin ellos
+        params_modelo = SimulacionPeluqueria(prob_aprendiz=0.1, tiempo_llegada_max=10).params_modelo
+        assert cache.obtener(clave_simulacion(params_modelo, 20, 5, None, 100000, False, None)) is None
+        assert cache.obtener(clave_simulacion(params_modelo, 20, 5, guardar_diarios=False)) is not None
+    assert not any(f['desde_cache'] for f in primera)
+    assert all(f['desde_cache'] for f in segunda)
+    assert not any(f['desde_cache'] for f in otra_semilla)
+    for a, b in zip(primera, segunda):
+        assert {k: v for k, v in a.items() if k != 'desde_cache'} == \
+               {k: v for k, v in b.items() if k != 'desde_cache'}
+    print("  ✅ Reproducible en paralelo y reutilizado desde la cache")
+    return True
+
+
+def test_un_punto_en_paralelo():
+    """Con un solo punto los días se reparten entre procesos y el resultado es el de simular_multiples_dias"""
+    print("\n" + "=" * 60)
+    print("TEST: Un punto repartido entre procesos")
+    print("=" * 60)
+
+    esperado = SimulacionPeluqueria(prob_aprendiz=0.2, tiempo_refrigerio=45).simular_multiples_dias(
+        30, semilla=8, guardar_diarios=False)
+    for num_procesos in (1, 3):
+        fila, = barrer({'prob_aprendiz': [0.2]}, num_dias=30, semilla=8, num_procesos=num_procesos,
+                       tiempo_refrigerio=45)
+        assert fila['recaudacion_promedio'] == esperado['recaudacion_promedio']
+        assert (fila['ic_recaudacion_inferior'], fila['ic_recaudacion_superior']) == \
+               esperado['ic_recaudacion_promedio']
+        assert fila['prob_5_o_mas_refrigerios'] == esperado['prob_5_o_mas_refrigerios']
+        assert fila['max_sillas_necesarias'] == esperado['max_sillas_necesarias']
+    print(f"  Recaudación promedio: ${esperado['recaudacion_promedio']:,.2f} con 1 y 3 procesos")
+
+    # Sin semilla no se escribe en la cache: nadie volvería a pedir esas entradas
+    with tempfile.TemporaryDirectory() as directorio:
+        barrer({'prob_aprendiz': [0.2]}, num_dias=5, cache=CacheResultados(directorio))
+        assert os.listdir(directorio) == []
+    print("  ✅ Mismo resultado y sin entradas de cache con semilla al azar")
+    return True
+
+
+def test_cli():
+    """La CLI acepta parámetros fijos y rechaza nombres desconocidos o --cache sin --semilla"""
+    print("\n" + "=" * 60)
+    print("TEST: CLI del barrido")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, 'barrido.csv')
+        assert main(['--param', 'tiempo_llegada_max=10,12', '--tiempo-refrigerio', '45', '--dias', '4',
+                     '--semilla', '1', '--tiempo-max', '600', '--max-iteraciones', '5000', '--csv', ruta]) == 0
+        with open(ruta, newline='', encoding='utf-8') as archivo:
+            filas = list(csv.DictReader(archivo))
+    esperado = barrer({'tiempo_llegada_max': [10, 12]}, num_dias=4, semilla=1, tiempo_max=600,
+                      max_iteraciones=5000, tiempo_refrigerio=45)
+    assert [float(f['recaudacion_promedio']) for f in filas] == [f['recaudacion_promedio'] for f in esperado]
+    assert [float(f['prob_5_o_mas_refrigerios']) for f in filas] == [f['prob_5_o_mas_refrigerios'] for f in esperado]
+
+    for argumentos in (['--param', 'prob_aprendis=0.1,0.2'],
+                       ['--param', 'prob_aprendiz=0.1,0.2', '--prob-aprendiz', '0.3'],
+                       ['--param', 'prob_aprendiz=0.1', '--cache', directorio]):
+        with contextlib.redirect_stderr(io.StringIO()) as error:
+            try:
+                main(argumentos)
+            except SystemExit as e:
+                assert e.code == 2
+            else:
+                raise AssertionError(f"{argumentos} no falló")
+        print(f"  {error.getvalue().strip().splitlines()[-1]}")
+    print("  ✅ Errores de uso en lugar de excepciones")
+    return True
+
+
+def main_tests():
+    ok = test_barrido_con_cache() and test_un_punto_en_paralelo() and test_cli()
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main_tests())
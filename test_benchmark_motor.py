@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test de la suite de benchmark del motor
+Verifica que cubra configuraciones y niveles de traza, el historial, la detección de regresiones
+y el ajuste de exponentes del estudio de escalabilidad
+"""
+
+import copy
+import os
+import subprocess
+import sys
+import tempfile
+
+import benchmark_motor
+from benchmark_motor import (CONFIGURACIONES, ajustar_exponente, buscar_referencia, cargar_historial,
+                             comparar, ejecutar_suite, exponente_n_log_n, guardar_historial, main,
+                             medir_escalabilidad, registro_historial, verificar_escalabilidad)
+from simulacion import NivelTraza
+
+
+def test_suite_y_historial():
+    """Una fila por configuración y nivel; el historial se compara con la corrida anterior"""
+    print("=" * 60)
+    print("TEST: Suite de benchmark")
+    print("=" * 60)
+
+    filas = ejecutar_suite(num_dias=10, repeticiones=1, dias_memoria=3)
+    assert len(filas) == len(CONFIGURACIONES) * len(NivelTraza)
+    for fila in filas:
+        assert fila['eventos_por_seg'] > 0 and fila['dias_por_seg'] > 0 and fila['pico_bytes_dia'] > 0
+        sin_traza = fila['nivel_traza'] == NivelTraza.NINGUNO.value
+        assert (fila['bytes_por_fila'] is None) == sin_traza
+        assert (fila['dias_por_seg_multiples'] is not None) == sin_traza
+    print(f"  ✓ {len(filas)} filas (configuraciones x niveles de traza)")
+
+    registro = registro_historial(filas, 10, 42, 1)
+    lento = copy.deepcopy(registro)
+    lento['filas'][0]['eventos_por_seg'] *= 0.5
+    lento['filas'][-1]['bytes_por_fila'] *= 2
+    assert comparar(registro, registro) == []
+    regresiones = comparar(registro, lento)
+    assert {(r[0], r[1], r[2]) for r in regresiones} == {
+        (filas[0]['configuracion'], filas[0]['nivel_traza'], 'eventos_por_seg'),
+        (filas[-1]['configuracion'], filas[-1]['nivel_traza'], 'bytes_por_fila')}
+    print(f"  ✓ Regresiones detectadas: {len(regresiones)}")
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, 'historial.jsonl')
+        assert cargar_historial(ruta) == []
+        otro = dict(registro, num_dias=20, commit='otro')
+        guardar_historial(registro, ruta)
+        guardar_historial(otro, ruta)
+        historial = cargar_historial(ruta)
+        assert historial == [registro, otro]
+        # La referencia tiene que ser comparable (mismos días), no solo la última
+        assert buscar_referencia(historial, lento) == registro
+        assert buscar_referencia(historial, dict(lento, num_dias=20), commit='otro') == otro
+        assert buscar_referencia(historial, dict(lento, num_dias=30)) is None
+
+        assert main(['--suite', '--dias', '5', '--repeticiones', '1', '--historial', ruta]) == 0
+        assert len(cargar_historial(ruta)) == 3
+    print("  ✓ Historial JSON Lines y CLI")
+    return True
+
+
+def test_escalabilidad():
+    """El ajuste recupera exponentes conocidos y rechaza crecimiento cuadrático"""
+    print("=" * 60)
+    print("TEST: Estudio de escalabilidad")
+    print("=" * 60)
+
+    x = [100, 400, 1600, 6400]
+    assert abs(ajustar_exponente(x, [3 * v ** 2 for v in x]) - 2) < 1e-9
+    assert 1 < exponente_n_log_n(x) < 1.3
+
+    puntos = medir_escalabilidad(NivelTraza.COMPLETO, repeticiones=1,
+                                 escalones=({'jornada_laboral_horas': 2}, {'jornada_laboral_horas': 8}))
+    assert [p['params']['jornada_laboral_horas'] for p in puntos] == [2, 8]
+    assert puntos[0]['eventos'] < puntos[1]['eventos']
+    for p in puntos:
+        assert p['trabajo'] == p['eventos'] + p['snapshot'] and p['snapshot'] > 0
+        assert p['segundos'] > 0 and p['pico_bytes'] > 0
+
+    lineal = [{'eventos': v, 'trabajo': v, 'segundos': v * 1e-6, 'pico_bytes': v * 100} for v in x]
+    cuadratico = [dict(p, segundos=p['eventos'] ** 2 * 1e-9) for p in lineal]
+    assert verificar_escalabilidad(lineal)['ok']
+    assert not verificar_escalabilidad(cuadratico)['ok']
+    # Un tamaño que crece con el costo (trabajo = eventos²) no disimula el crecimiento
+    cuadratico_en_trabajo = [dict(p, trabajo=p['eventos'] ** 2) for p in cuadratico]
+    assert not verificar_escalabilidad(cuadratico_en_trabajo)['ok']
+    print(f"  ✓ Exponente de n log n en {x[0]}..{x[-1]}: {exponente_n_log_n(x):.2f}")
+    return True
+
+
+def test_codigos_de_salida():
+    """Cada modo devuelve 0 al terminar bien y 1 si main.py no arranca"""
+    print("=" * 60)
+    print("TEST: Códigos de salida")
+    print("=" * 60)
+
+    assert main(['--dias', '3', '--traza', 'ninguno']) == 0
+    assert main(['--perfil', '--dias', '3']) == 0
+
+    def arranque_fallido():
+        raise subprocess.CalledProcessError(1, 'main.py', stderr="ModuleNotFoundError: No module named 'PyQt5'\n")
+
+    original = benchmark_motor.medir_arranque
+    benchmark_motor.medir_arranque = arranque_fallido
+    try:
+        assert main(['--arranque']) == 1
+    finally:
+        benchmark_motor.medir_arranque = original
+    print("  ✓ 0 al terminar, 1 si main.py no arranca")
+    return True
+
+
+def main_tests():
+    ok = all(test() for test in (test_suite_y_historial, test_escalabilidad, test_codigos_de_salida))
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main_tests())
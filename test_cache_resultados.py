@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test de la cache de resultados en disco
+Verifica el desalojo LRU, los valores no finitos, escritores concurrentes y la
+recuperación del último día
+"""
+
+import json
+import math
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from cache_resultados import CacheResultados, clave_simulacion
+from simulacion import SimulacionPeluqueria
+
+
+def _escribir_entradas(directorio, proceso):
+    """Escribe 30 entradas (10 compartidas con los otros procesos) en una cache chica"""
+    cache = CacheResultados(directorio, max_bytes=20000)
+    for i in range(30):
+        clave = f"compartida{i}" if i < 10 else f"p{proceso}_{i}"
+        cache.guardar(clave, {'valor': i, 'relleno': 'x' * 1000})
+        cache.obtener(f"compartida{i % 10}")
+    return True
+
+
+def test_desalojo_lru():
+    """Se desalojan las entradas usadas hace más tiempo"""
+    print("=" * 60)
+    print("TEST: Desalojo LRU")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        cache = CacheResultados(directorio, max_bytes=None)
+        for i in range(4):
+            cache.guardar(f"e{i}", {'ic_recaudacion_promedio': (i, i + 1), 'relleno': 'x' * 1000})
+            os.utime(cache._ruta(f"e{i}"), (1000 + i, 1000 + i))
+        assert cache.obtener('e0') == {'ic_recaudacion_promedio': (0, 1), 'relleno': 'x' * 1000}
+
+        # e0 se acaba de usar: los más viejos ahora son e1 y e2
+        cache.desalojar(cache.tamano() // 2)
+        quedan = sorted(n[:-5] for n in os.listdir(directorio))
+        print(f"  Entradas después de desalojar a la mitad: {quedan}")
+        assert quedan == ['e0', 'e3']
+        assert cache.obtener('e1') is None
+    print("  ✅ Desalojo LRU correcto")
+    return True
+
+
+def _rechazar_no_estandar(constante):
+    raise ValueError(f"JSON no estándar: {constante}")
+
+
+def test_valores_no_finitos():
+    """Los infinitos se guardan como null (JSON estándar) y vuelven como infinitos"""
+    print("\n" + "=" * 60)
+    print("TEST: Valores no finitos")
+    print("=" * 60)
+
+    resultado = SimulacionPeluqueria().simular_multiples_dias(2, semilla=2, guardar_diarios=False, antiteticos=True)
+    assert resultado['ic_recaudacion_promedio'] == (-math.inf, math.inf)
+    assert resultado['reduccion_varianza_recaudacion'] == math.inf
+    with tempfile.TemporaryDirectory() as directorio:
+        cache = CacheResultados(directorio)
+        cache.guardar('un_par', resultado)
+        with open(cache._ruta('un_par'), encoding='utf-8') as archivo:
+            json.load(archivo, parse_constant=_rechazar_no_estandar)
+        assert cache.obtener('un_par') == resultado
+    print("  ✅ Archivo en JSON estándar y resultado restaurado igual")
+    return True
+
+
+def test_escritores_concurrentes():
+    """Cuatro procesos escribiendo y desalojando a la vez no dejan archivos rotos"""
+    print("\n" + "=" * 60)
+    print("TEST: Escritores concurrentes")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            assert all(pool.map(_escribir_entradas, [directorio] * 4, range(4)))
+        archivos = os.listdir(directorio)
+        assert all(nombre.endswith('.json') for nombre in archivos)
+        for nombre in archivos:
+            with open(os.path.join(directorio, nombre), encoding='utf-8') as archivo:
+                json.load(archivo)
+        tamano = CacheResultados(directorio).tamano()
+        print(f"  {len(archivos)} entradas, {tamano} bytes")
+        assert tamano <= 20000
+    print("  ✅ Sin temporales ni archivos a medias, dentro del límite")
+    return True
+
+
+def test_recuperar_ultimo_dia():
+    """Un resultado de la cache más repetir_dia equivale a la corrida original"""
+    print("\n" + "=" * 60)
+    print("TEST: Resultado cacheado con vector de estado del último día")
+    print("=" * 60)
+
+    sim = SimulacionPeluqueria(tiempo_llegada_max=10)
+    resultado = sim.simular_multiples_dias(20, semilla=7)
+    with tempfile.TemporaryDirectory() as directorio:
+        cache = CacheResultados(directorio)
+        clave = clave_simulacion(sim.params_modelo, 20, 7)
+        assert clave == clave_simulacion(SimulacionPeluqueria(tiempo_llegada_max=10).params_modelo, 20, 7)
+        assert clave != clave_simulacion(sim.params_modelo, 20, 8)
+        cache.guardar(clave, resultado)
+        recuperado = cache.obtener(clave)
+    assert recuperado == resultado
+
+    otra = SimulacionPeluqueria(tiempo_llegada_max=10)
+    otra.repetir_dia(recuperado['num_dias'], 7)
+    assert len(otra.vector_estado) == len(sim.vector_estado)
+    assert list(otra.vector_estado) == list(sim.vector_estado)
+    print(f"  Vector de estado del día {recuperado['num_dias']}: {len(otra.vector_estado)} filas idénticas")
+    print("  ✅ Resultado y traza recuperados")
+    return True
+
+
+def main():
+    tests = [test_desalojo_lru, test_valores_no_finitos, test_escritores_concurrentes, test_recuperar_ultimo_dia]
+    ok = all(test() for test in tests)
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
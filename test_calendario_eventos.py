@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test del calendario de eventos (heap)
+Verifica el orden por tiempo, el desempate FIFO de eventos simultáneos
+y la cancelación de refrigerios obsoletos
+"""
+
+import sys
+
+from simulacion import CalendarioEventos, Evento, SimulacionPeluqueria, TipoEvento
+
+
+def test_orden_por_tiempo():
+    """Los eventos se extraen en orden creciente de tiempo"""
+    print("=" * 60)
+    print("TEST: Orden por tiempo")
+    print("=" * 60)
+
+    calendario = CalendarioEventos()
+    for t in [7.5, 1.0, 3.2, 9.9, 0.5]:
+        calendario.programar(Evento(tiempo=t, tipo=TipoEvento.LLEGADA_CLIENTE))
+
+    tiempos = []
+    while calendario:
+        tiempos.append(calendario.extraer().tiempo)
+
+    print(f"  Tiempos extraídos: {tiempos}")
+    assert tiempos == sorted(tiempos)
+    print("  ✅ Orden correcto")
+    return True
+
+
+def test_desempate_fifo():
+    """Eventos con el mismo tiempo salen en el orden en que se programaron"""
+    print("\n" + "=" * 60)
+    print("TEST: Desempate FIFO de eventos simultáneos")
+    print("=" * 60)
+
+    calendario = CalendarioEventos()
+    tipos = [TipoEvento.REFRIGERIO, TipoEvento.FIN_ATENCION, TipoEvento.LLEGADA_CLIENTE]
+    for tipo in tipos:
+        calendario.programar(Evento(tiempo=10.0, tipo=tipo))
+
+    extraidos = [calendario.extraer().tipo for _ in range(len(tipos))]
+
+    print(f"  Programados: {[t.value for t in tipos]}")
+    print(f"  Extraídos:   {[t.value for t in extraidos]}")
+    assert extraidos == tipos
+    print("  ✅ Desempate estable")
+    return True
+
+
+def test_cancelacion():
+    """Un evento cancelado no se extrae ni cuenta como pendiente"""
+    print("\n" + "=" * 60)
+    print("TEST: Cancelación de eventos")
+    print("=" * 60)
+
+    calendario = CalendarioEventos()
+    e1 = Evento(tiempo=1.0, tipo=TipoEvento.LLEGADA_CLIENTE)
+    e2 = Evento(tiempo=2.0, tipo=TipoEvento.REFRIGERIO)
+    e3 = Evento(tiempo=3.0, tipo=TipoEvento.FIN_ATENCION)
+    for e in (e1, e2, e3):
+        calendario.programar(e)
+
+    calendario.cancelar(e2)
+    calendario.cancelar(e2)  # Cancelar dos veces no descuenta de nuevo
+    assert len(calendario) == 2
+
+    extraidos = [calendario.extraer(), calendario.extraer()]
+    assert extraidos == [e1, e3] and not calendario
+    print("  ✅ El evento cancelado se descartó")
+    return True
+
+
+def test_sin_filas_de_refrigerio_obsoletas():
+    """Cada fila 'Refrigerio' del vector entrega efectivamente un refrigerio"""
+    print("\n" + "=" * 60)
+    print("TEST: Sin filas de refrigerio obsoletas en el vector")
+    print("=" * 60)
+
+    sim = SimulacionPeluqueria(tiempo_llegada_min=2, tiempo_llegada_max=4)
+    sim.simular_dia()
+
+    filas_refrigerio = [f for f in sim.vector_estado if f.evento.startswith("Refrigerio")]
+    print(f"  Filas de refrigerio: {len(filas_refrigerio)}, entregados: {sim.clientes_con_refrigerio}")
+    assert len(filas_refrigerio) == sim.clientes_con_refrigerio
+    print("  ✅ Solo se registran refrigerios entregados")
+    return True
+
+
+def main():
+    ok = (test_orden_por_tiempo() and test_desempate_fifo()
+          and test_cancelacion() and test_sin_filas_de_refrigerio_obsoletas())
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
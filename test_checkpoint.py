@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test de checkpoint y reanudación de simular_multiples_dias
+Verifica que una corrida interrumpida y reanudada dé el mismo resultado que sin interrupción
+"""
+
+import os
+import sys
+import tempfile
+
+from estadisticas import ObjetivoPrecision
+from simulacion import SimulacionPeluqueria
+
+
+class Interrupcion(Exception):
+    pass
+
+
+def _interrumpir_en(dia_corte):
+    def al_completar_dia(stats):
+        if stats['dia'] == dia_corte:
+            raise Interrupcion()
+    return al_completar_dia
+
+
+def test_reanudar_igual_que_sin_interrupcion():
+    """Interrumpir en el día 37 y reanudar da el mismo resultado, con y sin antitéticos"""
+    print("=" * 60)
+    print("TEST: Checkpoint y reanudación")
+    print("=" * 60)
+
+    for antiteticos, num_procesos in ((False, 1), (True, 2)):
+        completo = SimulacionPeluqueria().simular_multiples_dias(80, semilla=11, antiteticos=antiteticos)
+
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'corrida.ckpt')
+            try:
+                SimulacionPeluqueria().simular_multiples_dias(
+                    80, semilla=11, antiteticos=antiteticos, checkpoint=ruta, segundos_checkpoint=0,
+                    al_completar_dia=_interrumpir_en(37))
+                assert False, "La corrida debía interrumpirse"
+            except Interrupcion:
+                pass
+            assert os.path.exists(ruta)
+
+            sim = SimulacionPeluqueria()
+            nuevos = []
+            reanudado = sim.simular_multiples_dias(80, semilla=11, antiteticos=antiteticos,
+                                                   num_procesos=num_procesos, checkpoint=ruta,
+                                                   al_completar_dia=nuevos.append)
+            assert not os.path.exists(ruta)
+
+        # El día 37 se interrumpe en al_completar_dia, antes de su checkpoint (y con
+        # antitéticos solo se guarda al completar un par): el último guardado es el 36
+        desde = 36
+        print(f"  antitéticos={antiteticos}: reanudado desde el día {reanudado['reanudado_desde_dia']}, "
+              f"recaudación ${reanudado['recaudacion_promedio']:,.2f}")
+        assert reanudado.pop('reanudado_desde_dia') == desde
+        assert nuevos[0]['dia'] == desde + 1
+        assert reanudado == completo
+        assert len(sim.vector_estado) == completo['resultados_diarios'][-1]['iteraciones']
+
+    print("  ✅ Mismo resultado que la corrida sin interrupción")
+    return True
+
+
+def test_checkpoint_de_otra_configuracion():
+    """Un checkpoint de otros parámetros, otro objetivo o sin antitéticos se ignora y se empieza de cero"""
+    print("\n" + "=" * 60)
+    print("TEST: Checkpoint de otra configuración")
+    print("=" * 60)
+
+    variantes = {
+        'parámetros': ({'tiempo_llegada_max': 10}, {}),
+        'objetivo': ({}, {'objetivo': ObjetivoPrecision(semiancho_recaudacion=1.0)}),
+        'antitéticos': ({}, {'antiteticos': True}),
+    }
+    for nombre, (params, opciones) in variantes.items():
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'corrida.ckpt')
+            try:
+                SimulacionPeluqueria().simular_multiples_dias(
+                    30, semilla=3, checkpoint=ruta, segundos_checkpoint=0, al_completar_dia=_interrumpir_en(10))
+            except Interrupcion:
+                pass
+            resultado = SimulacionPeluqueria(**params).simular_multiples_dias(
+                30, semilla=3, checkpoint=ruta, **opciones)
+        assert resultado.pop('reanudado_desde_dia') == 0, nombre
+        assert resultado == SimulacionPeluqueria(**params).simular_multiples_dias(30, semilla=3, **opciones)
+        print(f"  ✓ Otros {nombre}: checkpoint ignorado")
+    print("  ✅ Checkpoint ignorado")
+    return True
+
+
+def main():
+    tests = [test_reanudar_igual_que_sin_interrupcion, test_checkpoint_de_otra_configuracion]
+    ok = all(test() for test in tests)
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
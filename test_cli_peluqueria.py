@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test de la interfaz de línea de comandos
+Verifica las salidas JSON/CSV y que no se importe PyQt5 ni openpyxl
+"""
+
+import csv
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from cli_peluqueria import main
+from simulacion import SimulacionPeluqueria
+
+
+def test_salidas_json_y_csv():
+    """El resumen y los días coinciden con simular_multiples_dias"""
+    print("=" * 60)
+    print("TEST: Salidas de la CLI")
+    print("=" * 60)
+
+    esperado = SimulacionPeluqueria(tiempo_llegada_max=10).simular_multiples_dias(12, semilla=4)
+    with tempfile.TemporaryDirectory() as directorio:
+        resumen = os.path.join(directorio, 'resumen.json')
+        diarios = os.path.join(directorio, 'diarios.csv')
+        vector = os.path.join(directorio, 'vector.csv')
+        assert main(['--dias', '12', '--semilla', '4', '--tiempo-llegada-max', '10',
+                     '--salida', resumen, '--traza', 'completo', '--vector', vector]) == 0
+        assert main(['--dias', '12', '--semilla', '4', '--tiempo-llegada-max', '10', '--formato', 'csv',
+                     '--salida', os.devnull, '--diarios', diarios]) == 0
+
+        with open(resumen, encoding='utf-8') as archivo:
+            datos = json.load(archivo)
+        with open(diarios, newline='', encoding='utf-8') as archivo:
+            dias = list(csv.DictReader(archivo))
+        with open(vector, newline='', encoding='utf-8') as archivo:
+            filas_vector = list(csv.reader(archivo))
+
+    print(f"  Recaudación promedio: ${datos['recaudacion_promedio']:,.2f}")
+    assert datos['recaudacion_promedio'] == esperado['recaudacion_promedio']
+    assert datos['ic_recaudacion_promedio'] == list(esperado['ic_recaudacion_promedio'])
+    assert [float(d['recaudacion']) for d in dias] == [d['recaudacion'] for d in esperado['resultados_diarios']]
+    assert len(filas_vector) - 1 == esperado['resultados_diarios'][-1]['iteraciones']
+    print(f"  {len(dias)} días en CSV, {len(filas_vector) - 1} filas del vector de estado")
+    print("  ✅ Salidas correctas")
+    return True
+
+
+def test_sin_interfaz_grafica():
+    """Correr la CLI no importa PyQt5, openpyxl ni multiprocessing"""
+    print("\n" + "=" * 60)
+    print("TEST: CLI sin interfaz gráfica")
+    print("=" * 60)
+
+    codigo = ("import sys, cli_peluqueria; cli_peluqueria.main(['--dias', '3', '--salida', '-']); "
+              "assert not {'PyQt5', 'openpyxl', 'multiprocessing'} & set(sys.modules), sorted(sys.modules)")
+    proceso = subprocess.run([sys.executable, '-c', codigo], cwd=os.path.dirname(os.path.abspath(__file__)),
+                             capture_output=True, text=True)
+    assert proceso.returncode == 0, proceso.stderr
+    assert json.loads(proceso.stdout)['num_dias'] == 3
+    print("  ✅ Sin PyQt5, openpyxl ni multiprocessing")
+    return True
+
+
+def _rechazar_no_estandar(constante):
+    raise ValueError(f"JSON no estándar: {constante}")
+
+
+def test_json_estandar_con_infinitos():
+    """Los intervalos de un día y las reducciones de varianza infinitas se escriben como null"""
+    print("\n" + "=" * 60)
+    print("TEST: JSON estándar con valores no finitos")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        un_dia = os.path.join(directorio, 'un_dia.json')
+        antiteticos = os.path.join(directorio, 'antiteticos.json')
+        assert main(['--dias', '1', '--semilla', '2', '--salida', un_dia]) == 0
+        assert main(['--dias', '2', '--semilla', '2', '--antiteticos', '--salida', antiteticos]) == 0
+        with open(un_dia, encoding='utf-8') as archivo:
+            datos_un_dia = json.load(archivo, parse_constant=_rechazar_no_estandar)
+        with open(antiteticos, encoding='utf-8') as archivo:
+            datos_antiteticos = json.load(archivo, parse_constant=_rechazar_no_estandar)
+
+    assert datos_un_dia['ic_recaudacion_promedio'] == [None, None]
+    assert datos_antiteticos['reduccion_varianza_recaudacion'] is None
+    print(f"  ic_recaudacion_promedio con 1 día: {datos_un_dia['ic_recaudacion_promedio']}")
+    print("  ✅ Sin Infinity ni NaN en la salida")
+    return True
+
+
+def test_errores_de_uso():
+    """Argumentos inválidos terminan con un error de uso (código 2), no con una excepción"""
+    print("\n" + "=" * 60)
+    print("TEST: Errores de uso de la CLI")
+    print("=" * 60)
+
+    for argumentos in (['--dias', '0', '--diarios', '-'], ['--dias', '-3'], ['--dias', '3', '--antiteticos']):
+        proceso = subprocess.run([sys.executable, '-m', 'cli_peluqueria', *argumentos],
+                                 cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True)
+        assert proceso.returncode == 2, proceso.stderr
+        assert 'Traceback' not in proceso.stderr
+        print(f"  {' '.join(argumentos)}: {proceso.stderr.strip().splitlines()[-1]}")
+    print("  ✅ Errores de uso sin traceback")
+    return True
+
+
+def main_tests():
+    tests = [test_salidas_json_y_csv, test_json_estandar_con_infinitos, test_errores_de_uso,
+             test_sin_interfaz_grafica]
+    ok = all(test() for test in tests)
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main_tests())
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test de las colas FIFO por peluquero
+Verifica que los contadores de cola coincidan con los clientes esperando en el snapshot
+"""
+
+import sys
+
+from simulacion import SimulacionPeluqueria
+
+ESTADO_ESPERA = {
+    'cola_aprendiz': 'Esperando Aprendiz',
+    'cola_veterano_a': 'Esperando Vet A',
+    'cola_veterano_b': 'Esperando Vet B',
+}
+
+
+def test_colas_coinciden_con_snapshot():
+    """Las columnas de cola del vector coinciden con los clientes esperando"""
+    print("=" * 60)
+    print("TEST: Colas por peluquero vs snapshot de clientes")
+    print("=" * 60)
+
+    # Configuración congestionada para que se formen colas largas
+    sim = SimulacionPeluqueria(tiempo_llegada_min=2, tiempo_llegada_max=4, semilla=7)
+    sim.simular_dia()
+
+    max_total = 0
+    for fila in sim.vector_estado:
+        total = 0
+        for columna, estado in ESTADO_ESPERA.items():
+            esperando = sum(1 for c in fila.clientes_snapshot if c['estado'] == estado)
+            assert getattr(fila, columna) == esperando, (fila.iteracion, columna)
+            total += esperando
+        max_total = max(max_total, total)
+
+    print(f"  Filas verificadas: {len(sim.vector_estado)}")
+    print(f"  Máxima cola observada: {max_total} (max_cola_total={sim.max_clientes_esperando})")
+    assert max_total == sim.max_clientes_esperando
+    assert sim.clientes_en_espera == len(sim.cola_espera)
+    print("  ✅ Contadores de cola correctos")
+    return True
+
+
+def main():
+    ok = test_colas_coinciden_con_snapshot()
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test de la API de coleccionistas (observadores del motor)
+Verifica las notificaciones, su orden, el filtro por tipo y que el vector de estado sea un coleccionista más
+"""
+
+import sys
+
+from simulacion import Coleccionista, NivelTraza, SimulacionPeluqueria, TipoNotificacion
+
+
+class Bitacora(Coleccionista):
+    """Guarda (tipo, id de cliente, tiempo) de cada notificación y cuenta los días"""
+
+    def __init__(self):
+        self.registros = []
+        self.dias_iniciados = 0
+        self.estadisticas = []
+
+    def al_iniciar_dia(self, sim):
+        self.dias_iniciados += 1
+
+    def notificar(self, registro):
+        cliente_id = registro.cliente.id if registro.cliente is not None else None
+        self.registros.append((registro.tipo, cliente_id, registro.tiempo))
+
+    def al_terminar_dia(self, sim, estadisticas):
+        self.estadisticas.append(estadisticas)
+
+    def contar(self, tipo):
+        return sum(1 for t, _, _ in self.registros if t is tipo)
+
+
+class EsperaPromedio(Coleccionista):
+    """Métrica puntual: espera promedio, mirando solo los inicios de atención"""
+
+    tipos = frozenset({TipoNotificacion.INICIO_ATENCION})
+
+    def __init__(self):
+        self.total = 0.0
+        self.atendidos = 0
+
+    def notificar(self, registro):
+        self.total += registro.tiempo - registro.cliente.tiempo_llegada
+        self.atendidos += 1
+
+
+def test_notificaciones_de_un_dia():
+    """Conteos y orden de las notificaciones coinciden con el día simulado"""
+    print("=" * 60)
+    print("TEST: Notificaciones de un día")
+    print("=" * 60)
+
+    esperado = SimulacionPeluqueria(tiempo_llegada_max=4, semilla=11).simular_dia(nivel_traza=NivelTraza.NINGUNO)
+
+    sim = SimulacionPeluqueria(tiempo_llegada_max=4, semilla=11)
+    bitacora = sim.suscribir(Bitacora())
+    espera = sim.suscribir(EsperaPromedio())
+    stats = sim.simular_dia(nivel_traza=NivelTraza.NINGUNO)
+    assert stats == esperado
+    assert len(sim.vector_estado) == 0  # Sin traza el registrador del vector no está suscripto
+
+    assert bitacora.dias_iniciados == 1 and bitacora.estadisticas == [stats]
+    assert bitacora.contar(TipoNotificacion.LLEGADA) == stats['clientes_llegados']
+    assert bitacora.contar(TipoNotificacion.FIN_ATENCION) == stats['clientes_atendidos']
+    assert bitacora.contar(TipoNotificacion.INICIO_ATENCION) == stats['clientes_atendidos']
+    assert bitacora.contar(TipoNotificacion.REFRIGERIO) == stats['clientes_con_refrigerio']
+    assert bitacora.contar(TipoNotificacion.EVENTO_PROCESADO) == stats['iteraciones']
+
+    # Por cliente: llegada, inicio y fin, en ese orden; los tiempos nunca retroceden
+    orden = {}
+    for tipo, cliente_id, _ in bitacora.registros:
+        if tipo in (TipoNotificacion.LLEGADA, TipoNotificacion.INICIO_ATENCION, TipoNotificacion.FIN_ATENCION):
+            orden.setdefault(cliente_id, []).append(tipo)
+    assert all(tipos == [TipoNotificacion.LLEGADA, TipoNotificacion.INICIO_ATENCION, TipoNotificacion.FIN_ATENCION]
+               for tipos in orden.values())
+    tiempos = [tiempo for _, _, tiempo in bitacora.registros]
+    assert tiempos == sorted(tiempos)
+
+    espera_clientes = [c.tiempo_inicio_atencion - c.tiempo_llegada for c in sim.clientes]
+    assert espera.atendidos == len(espera_clientes)
+    assert abs(espera.total - sum(espera_clientes)) < 1e-6
+    print(f"  ✓ {len(bitacora.registros)} notificaciones; espera promedio "
+          f"{espera.total / espera.atendidos:.1f} min en {espera.atendidos} clientes")
+    return True
+
+
+def test_vector_es_un_coleccionista():
+    """El vector de estado no cambia con otros coleccionistas suscriptos y se puede desuscribir"""
+    print("=" * 60)
+    print("TEST: Vector de estado como coleccionista")
+    print("=" * 60)
+
+    referencia = SimulacionPeluqueria(nivel_traza=NivelTraza.COMPLETO, semilla=5)
+    referencia.simular_dia()
+
+    sim = SimulacionPeluqueria(nivel_traza=NivelTraza.COMPLETO, semilla=5)
+    refrigerios = sim.suscribir(Bitacora(), tipos=[TipoNotificacion.REFRIGERIO])
+    sim.simular_dia()
+    assert list(sim.vector_estado) == list(referencia.vector_estado)
+    assert {tipo for tipo, _, _ in refrigerios.registros} <= {TipoNotificacion.REFRIGERIO}
+    assert len(refrigerios.registros) == sum(1 for f in sim.vector_estado if f.evento.startswith("Refrigerio"))
+
+    sim.desuscribir(refrigerios)
+    sim.desuscribir(refrigerios)  # Desuscribir dos veces no falla
+    antes = len(refrigerios.registros)
+    sim.simular_dia(nivel_traza=NivelTraza.NINGUNO)
+    sim.simular_dia()
+    assert len(refrigerios.registros) == antes and refrigerios.dias_iniciados == 1
+    print(f"  ✓ Vector idéntico ({len(sim.vector_estado)} filas) y coleccionista desuscripto")
+    return True
+
+
+def test_coleccionistas_en_multiples_dias():
+    """En un proceso los coleccionistas ven todos los días, también con semilla maestra"""
+    print("=" * 60)
+    print("TEST: Coleccionistas en simular_multiples_dias")
+    print("=" * 60)
+
+    for semilla in (None, 8):
+        sim = SimulacionPeluqueria(semilla=3)
+        bitacora = sim.suscribir(Bitacora(), tipos=[TipoNotificacion.LLEGADA])
+        resultado = sim.simular_multiples_dias(15, semilla=semilla)
+        llegadas = sum(dia['clientes_llegados'] for dia in resultado['resultados_diarios'])
+        assert bitacora.dias_iniciados == len(bitacora.estadisticas) == 15
+        assert len(bitacora.registros) == llegadas
+        print(f"  ✓ semilla={semilla}: 15 días y {llegadas} llegadas notificadas")
+    return True
+
+
+def main():
+    tests = [test_notificaciones_de_un_dia, test_vector_es_un_coleccionista, test_coleccionistas_en_multiples_dias]
+    ok = all(test() for test in tests)
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test del modo cuasi-Monte Carlo (Sobol aleatorizado)
+Verifica que el intervalo de la recaudación promedio sea más angosto que con Monte Carlo
+"""
+
+import sys
+
+from cuasi_montecarlo import SCIPY_AVAILABLE, simular_dias_qmc
+from simulacion import SimulacionPeluqueria
+
+
+def test_intervalo_mas_angosto():
+    """Con los mismos días, el IC de la recaudación con QMC es mucho más angosto"""
+    print("=" * 60)
+    print("TEST: Cuasi-Monte Carlo vs Monte Carlo")
+    print("=" * 60)
+
+    if not SCIPY_AVAILABLE:
+        print("  ⚠️  scipy no está instalado, se omite el test")
+        return True
+
+    r = simular_dias_qmc(64, 8, semilla=3)
+    mc = SimulacionPeluqueria(semilla=3).simular_multiples_dias(512)
+    assert r['num_dias'] == 512 and r['num_replicas'] == 8
+
+    inferior, superior = r['ic_recaudacion_promedio']
+    inferior_mc, superior_mc = mc['ic_recaudacion_promedio']
+    print(f"  QMC: ${r['recaudacion_promedio']:,.2f} ± {(superior - inferior) / 2:,.2f}")
+    print(f"  MC:  ${mc['recaudacion_promedio']:,.2f} ± {(superior_mc - inferior_mc) / 2:,.2f}")
+    assert superior - inferior < (superior_mc - inferior_mc) / 2
+    assert inferior <= r['recaudacion_promedio'] <= superior
+    assert r == simular_dias_qmc(64, 8, semilla=3)
+    print("  ✅ Intervalo más angosto y reproducible")
+    return True
+
+
+def main():
+    ok = test_intervalo_mas_angosto()
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
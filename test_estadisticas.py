@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test de las estadísticas en línea (Welford)
+Verifica media/varianza contra el módulo statistics, la combinación de acumuladores
+y los intervalos de confianza
+"""
+
+import random
+import statistics
+import sys
+
+from estadisticas import AcumuladorDias, EstadisticaWelford, intervalo_wilson
+from simulacion import SimulacionPeluqueria
+
+
+def test_welford_y_combinacion():
+    """Media y varianza coinciden con statistics, también combinando dos mitades"""
+    print("=" * 60)
+    print("TEST: Welford y combinación")
+    print("=" * 60)
+
+    rng = random.Random(1)
+    valores = [rng.gauss(100, 15) for _ in range(1000)]
+
+    total = EstadisticaWelford()
+    primera, segunda = EstadisticaWelford(), EstadisticaWelford()
+    for i, v in enumerate(valores):
+        total.agregar(v)
+        (primera if i < 300 else segunda).agregar(v)
+    primera.combinar(segunda)
+
+    for est in (total, primera):
+        assert est.n == len(valores)
+        assert abs(est.media - statistics.mean(valores)) < 1e-9
+        assert abs(est.varianza - statistics.variance(valores)) < 1e-6
+        assert est.minimo == min(valores) and est.maximo == max(valores)
+    print(f"  Media {total.media:.4f}, varianza {total.varianza:.4f}")
+    print("  ✅ Coinciden con statistics")
+    return True
+
+
+def test_acumulador_dias():
+    """El acumulador reproduce las estadísticas agregadas y sus intervalos de confianza"""
+    print("\n" + "=" * 60)
+    print("TEST: Acumulador de días")
+    print("=" * 60)
+
+    sim = SimulacionPeluqueria(semilla=8)
+    completo = sim.simular_multiples_dias(300)
+    sin_diarios = SimulacionPeluqueria(semilla=8).simular_multiples_dias(300, guardar_diarios=False)
+
+    diarios = completo['resultados_diarios']
+    assert len(diarios) == 300 and sin_diarios['resultados_diarios'] == []
+    recaudaciones = [r['recaudacion'] for r in diarios]
+    assert abs(completo['recaudacion_promedio'] - statistics.mean(recaudaciones)) < 1e-6
+    assert completo['dias_5_o_mas_refrigerios'] == sum(1 for r in diarios if r['clientes_con_refrigerio'] >= 5)
+
+    for clave in ('recaudacion_promedio', 'ganancia_promedio', 'prob_5_o_mas_refrigerios'):
+        inferior, superior = completo['ic_' + clave]
+        assert inferior <= completo[clave] <= superior
+        assert sin_diarios['ic_' + clave] == completo['ic_' + clave]
+        print(f"  {clave}: {completo[clave]:,.4f}  IC 95% [{inferior:,.4f}, {superior:,.4f}]")
+
+    # Dos mitades combinadas dan el mismo resultado que todo junto
+    mitad_a, mitad_b = AcumuladorDias(), AcumuladorDias()
+    for r in diarios[:150]:
+        mitad_a.agregar(r)
+    for r in diarios[150:]:
+        mitad_b.agregar(r)
+    mitad_a.combinar(mitad_b)
+    combinado = mitad_a.resultado()
+    assert combinado['dias_5_o_mas_refrigerios'] == completo['dias_5_o_mas_refrigerios']
+    assert abs(combinado['recaudacion_promedio'] - completo['recaudacion_promedio']) < 1e-6
+    assert combinado['resultados_diarios'] == diarios
+    print("  ✅ Acumulador consistente")
+    return True
+
+
+def test_intervalo_wilson_proporcion_extrema():
+    """Con 0 días sobre el umbral el IC de P(5+) no colapsa a (0, 0), también con pares"""
+    print("\n" + "=" * 60)
+    print("TEST: Intervalo de Wilson")
+    print("=" * 60)
+
+    # Valor de referencia: 3 éxitos en 50, Wilson del 95% (calculado a mano)
+    inferior, superior = intervalo_wilson(3 / 50, 50)
+    assert abs(inferior - 0.02062) < 1e-4 and abs(superior - 0.16217) < 1e-4
+
+    for pares in (False, True):
+        acumulador = AcumuladorDias(pares=pares)
+        for _ in range(32):
+            acumulador.agregar({'recaudacion': 1.0, 'ganancia_neta': 1.0, 'max_sillas_necesarias': 0,
+                                'clientes_con_refrigerio': 0, 'clientes_llegados': 10})
+        r = acumulador.resultado()
+        inferior, superior = r['ic_prob_5_o_mas_refrigerios']
+        print(f"  pares={pares}: P=0 en 32 días, IC 95% [{inferior:.4f}, {superior:.4f}]")
+        assert r['prob_5_o_mas_refrigerios'] == 0 and inferior == 0 and 0.09 < superior < 0.12
+    print("  ✅ Intervalo no degenerado")
+    return True
+
+
+def main():
+    ok = test_welford_y_combinacion() and test_acumulador_dias() and test_intervalo_wilson_proporcion_extrema()
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test de los generadores aleatorios por instancia
+Verifica la reproducibilidad con semilla y los números aleatorios comunes entre configuraciones
+"""
+
+import random
+import sys
+
+from simulacion import SimulacionPeluqueria
+
+
+def test_misma_semilla_mismo_dia():
+    """Dos simulaciones con la misma semilla producen el mismo día"""
+    print("=" * 60)
+    print("TEST: Reproducibilidad con semilla")
+    print("=" * 60)
+
+    a = SimulacionPeluqueria(semilla=99).simular_dia()
+    random.seed(0)  # El módulo random global no interviene
+    b = SimulacionPeluqueria(semilla=99).simular_dia()
+    c = SimulacionPeluqueria(semilla=100).simular_dia()
+
+    print(f"  Semilla 99: ${a['recaudacion']:,.0f} / semilla 100: ${c['recaudacion']:,.0f}")
+    assert a == b and a != c
+    print("  ✅ Mismo resultado para la misma semilla")
+    return True
+
+
+def test_llegadas_comunes_entre_configuraciones():
+    """Con la misma semilla, cambiar los servicios no cambia las llegadas ni las asignaciones"""
+    print("\n" + "=" * 60)
+    print("TEST: Números aleatorios comunes entre configuraciones")
+    print("=" * 60)
+
+    base = SimulacionPeluqueria(semilla=5)
+    lenta = SimulacionPeluqueria(semilla=5, tiempo_min_vet_b=20, tiempo_max_vet_b=30)
+    base.simular_dia()
+    lenta.simular_dia()
+
+    llegadas_base = [(c.tiempo_llegada, c.peluquero_asignado.tipo) for c in base.clientes]
+    llegadas_lenta = [(c.tiempo_llegada, c.peluquero_asignado.tipo) for c in lenta.clientes]
+    print(f"  Clientes: {len(llegadas_base)}, refrigerios base={base.clientes_con_refrigerio} "
+          f"lenta={lenta.clientes_con_refrigerio}")
+    assert llegadas_base == llegadas_lenta
+    print("  ✅ Llegadas y asignaciones compartidas")
+    return True
+
+
+def main():
+    ok = test_misma_semilla_mismo_dia() and test_llegadas_comunes_entre_configuraciones()
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
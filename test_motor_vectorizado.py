@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test del motor vectorizado con NumPy
+Verifica que coincida con el motor de eventos en una configuración determinística
+"""
+
+import sys
+
+from motor_vectorizado import NUMPY_AVAILABLE, simular_dias_vectorizado
+from simulacion import SimulacionPeluqueria
+
+# Llegadas cada 5 min, todo al aprendiz con servicio fijo de 7.3 min:
+# la cola crece y hay refrigerios, pero no interviene el azar
+PARAMS_DETERMINISTICOS = {
+    'prob_aprendiz': 1.0,
+    'prob_veterano_a': 0.0,
+    'tiempo_min_aprendiz': 7.3,
+    'tiempo_max_aprendiz': 7.3,
+    'tiempo_llegada_min': 5,
+    'tiempo_llegada_max': 5,
+}
+
+
+def test_coincide_con_motor_de_eventos():
+    """Cada estadística del día coincide con simular_dia"""
+    print("=" * 60)
+    print("TEST: Motor vectorizado vs motor de eventos")
+    print("=" * 60)
+
+    if not NUMPY_AVAILABLE:
+        print("  ⚠️  numpy no está instalado, se omite el test")
+        return True
+
+    for tiempo_max in (None, 200, 600):
+        esperado = SimulacionPeluqueria(**PARAMS_DETERMINISTICOS).simular_dia(tiempo_max=tiempo_max)
+        resultado = simular_dias_vectorizado(3, semilla=1, tiempo_max=tiempo_max, tamano_lote=2,
+                                             guardar_diarios=True, **PARAMS_DETERMINISTICOS)
+        for dia in resultado['resultados_diarios']:
+            for clave, valor in esperado.items():
+                assert abs(dia[clave] - valor) < 1e-9, (tiempo_max, clave, dia[clave], valor)
+        print(f"  tiempo_max={tiempo_max}: recaudación {esperado['recaudacion']}, "
+              f"refrigerios {esperado['clientes_con_refrigerio']}, sillas {esperado['max_sillas_necesarias']}")
+
+    print("  ✅ Resultados idénticos")
+    return True
+
+
+def test_agregados():
+    """Las estadísticas agregadas tienen la forma de simular_multiples_dias"""
+    print("\n" + "=" * 60)
+    print("TEST: Estadísticas agregadas")
+    print("=" * 60)
+
+    if not NUMPY_AVAILABLE:
+        print("  ⚠️  numpy no está instalado, se omite el test")
+        return True
+
+    sim = SimulacionPeluqueria()
+    claves = set(sim._calcular_estadisticas_agregadas([sim.simular_dia()]))
+    resultado = simular_dias_vectorizado(2000, semilla=42, tamano_lote=300)
+    assert set(resultado) == claves
+    assert resultado['recaudacion_min'] <= resultado['recaudacion_promedio'] <= resultado['recaudacion_max']
+    assert 0.0 <= resultado['prob_5_o_mas_refrigerios'] <= 1.0
+    assert resultado == simular_dias_vectorizado(2000, semilla=42, tamano_lote=300)
+    print(f"  Recaudación promedio: ${resultado['recaudacion_promedio']:,.2f}")
+    print(f"  P(5+ refrigerios): {resultado['prob_5_o_mas_refrigerios']:.4f}")
+    print("  ✅ Agregados consistentes y reproducibles")
+    return True
+
+
+def main():
+    ok = test_coincide_con_motor_de_eventos() and test_agregados()
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
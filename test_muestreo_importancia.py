@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test del muestreo de importancia para P(5+ refrigerios)
+Verifica la razón de verosimilitud del generador inclinado, la estimación insesgada
+y que un evento raro mal muestreado se marque como no confiable
+"""
+
+import math
+import random
+import sys
+
+from muestreo_importancia import (MIN_DIAS_CON_EVENTO, MIN_MUESTRA_EFECTIVA, GeneradorInclinado,
+                                  estimar_prob_refrigerios, inclinacion_para_media, media_inclinada)
+
+
+def test_generador_inclinado():
+    """La media ponderada por la razón de verosimilitud recupera la uniforme"""
+    print("=" * 60)
+    print("TEST: Generador inclinado")
+    print("=" * 60)
+
+    assert abs(media_inclinada(inclinacion_para_media(0.3)) - 0.3) < 1e-9
+    for inclinacion in (2.0, -1.5):
+        base = random.Random(1)
+        suma_v = suma_vw = suma_w = 0.0
+        for _ in range(20000):
+            generador = GeneradorInclinado(base, inclinacion)
+            v = generador.random()
+            peso = math.exp(generador.log_razon)
+            suma_v += v
+            suma_vw += v * peso
+            suma_w += peso
+        print(f"  λ={inclinacion:+.1f}: E_g[V]={suma_v / 20000:.3f} (teórica {media_inclinada(inclinacion):.3f}), "
+              f"E_g[V w]={suma_vw / 20000:.3f}, E_g[w]={suma_w / 20000:.3f}")
+        assert abs(suma_v / 20000 - media_inclinada(inclinacion)) < 0.01
+        assert abs(suma_vw / 20000 - 0.5) < 0.02 and abs(suma_w / 20000 - 1.0) < 0.03
+    print("  ✅ Razón de verosimilitud correcta")
+    return True
+
+
+def test_estimacion_insesgada():
+    """Con tiempo_refrigerio=90 (P ≈ 0.027) la estimación cubre el valor de referencia"""
+    print("\n" + "=" * 60)
+    print("TEST: Estimación con muestreo de importancia")
+    print("=" * 60)
+
+    # Referencia: 2.000.000 de días con el motor vectorizado
+    referencia = 0.02695
+    r = estimar_prob_refrigerios(1500, semilla=5, dias_piloto=300, tiempo_refrigerio=90)
+    inferior, superior = r['ic_prob_refrigerios']
+    print(f"  P(5+) = {r['prob_refrigerios']:.5f} ± {r['error_relativo']:.1%} (referencia {referencia})")
+    print(f"  Inclinaciones: {tuple(round(x, 3) for x in r['inclinaciones'])}, "
+          f"reducción de varianza {r['reduccion_varianza']:.2f}x "
+          f"(con {r['dias_piloto_usados']} días de piloto; solo se informa, no es una aceleración)")
+    assert r['confiable']
+    assert inferior <= referencia <= superior
+    # La reducción de varianza cuenta los días del piloto como costo: con las mismas
+    # varianzas, sin piloto sería mayor en la proporción de días totales
+    sin_piloto = estimar_prob_refrigerios(1500, semilla=5, inclinaciones=r['inclinaciones'], tiempo_refrigerio=90)
+    assert sin_piloto['dias_piloto_usados'] == 0
+    assert sin_piloto['prob_refrigerios'] == r['prob_refrigerios']
+    assert math.isclose(r['reduccion_varianza'] * (1500 + r['dias_piloto_usados']) / 1500,
+                        sin_piloto['reduccion_varianza'])
+    print("  ✅ Estimación consistente")
+    return True
+
+
+def test_evento_raro_no_confiable():
+    """Con P ≈ 2e-4 la inclinación no alcanza el evento y el resultado se marca no confiable"""
+    print("\n" + "=" * 60)
+    print("TEST: Evento raro (tiempo_llegada 5-25)")
+    print("=" * 60)
+
+    # Referencia: 6.000.000 de días con el motor vectorizado (1198 días con evento)
+    referencia = 1.997e-4
+    for semilla in (1, 2):
+        r = estimar_prob_refrigerios(2000, semilla=semilla, dias_piloto=500,
+                                     tiempo_llegada_min=5, tiempo_llegada_max=25)
+        inferior, superior = r['ic_prob_refrigerios']
+        print(f"  semilla {semilla}: P(5+) = {r['prob_refrigerios']:.2e} IC [{inferior:.2e}, {superior:.2e}], "
+              f"{r['dias_con_evento']} días con evento, muestra efectiva "
+              f"{r['tamano_muestra_efectivo']:.1f}, confiable={r['confiable']}")
+        assert inferior >= 0.0
+        assert r['dias_con_evento'] < MIN_DIAS_CON_EVENTO or r['tamano_muestra_efectivo'] < MIN_MUESTRA_EFECTIVA
+        assert not r['confiable']
+    print(f"  ✅ Marcado como no confiable (referencia {referencia:.3e}), sin intervalos negativos")
+    return True
+
+
+def main():
+    ok = test_generador_inclinado() and test_estimacion_insesgada() and test_evento_raro_no_confiable()
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test de los niveles de traza del vector de estado
+Verifica que la traza no altere los resultados y que cada nivel registre lo esperado
+"""
+
+import sys
+
+from simulacion import NivelTraza, SimulacionPeluqueria
+
+
+def test_niveles_mismos_resultados():
+    """Los tres niveles de traza producen las mismas estadísticas del día"""
+    print("=" * 60)
+    print("TEST: Niveles de traza")
+    print("=" * 60)
+
+    resultados = {}
+    for nivel in NivelTraza:
+        sim = SimulacionPeluqueria(nivel_traza=nivel, semilla=2024)
+        resultados[nivel] = sim.simular_dia()
+
+        filas = len(sim.vector_estado)
+        con_snapshot = sum(1 for f in sim.vector_estado if f.clientes_snapshot)
+        print(f"  {nivel.value:<9} filas={filas:<5} filas con snapshot={con_snapshot}")
+
+        if nivel is NivelTraza.NINGUNO:
+            assert filas == 0
+        elif nivel is NivelTraza.RESUMEN:
+            assert filas == resultados[nivel]['iteraciones'] and con_snapshot == 0
+        else:
+            assert filas == resultados[nivel]['iteraciones'] and con_snapshot > 0
+
+    assert resultados[NivelTraza.NINGUNO] == resultados[NivelTraza.RESUMEN] == resultados[NivelTraza.COMPLETO]
+    print("  ✅ Estadísticas idénticas en los tres niveles")
+    return True
+
+
+def test_multiples_dias_traza_ultimo_dia():
+    """simular_multiples_dias deja en vector_estado solo el último día"""
+    print("\n" + "=" * 60)
+    print("TEST: Traza solo del último día en múltiples días")
+    print("=" * 60)
+
+    sim = SimulacionPeluqueria(semilla=11)
+    agregadas = sim.simular_multiples_dias(5)
+
+    ultimo = agregadas['resultados_diarios'][-1]
+    print(f"  Filas en vector_estado: {len(sim.vector_estado)} (iteraciones último día: {ultimo['iteraciones']})")
+    assert len(sim.vector_estado) == ultimo['iteraciones']
+    print("  ✅ Vector del último día completo")
+    return True
+
+
+def main():
+    ok = test_niveles_mismos_resultados() and test_multiples_dias_traza_ultimo_dia()
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test de la parada secuencial por precisión
+Verifica que simular_multiples_dias se detenga al alcanzar los semianchos pedidos
+"""
+
+import sys
+import time
+
+from estadisticas import ObjetivoPrecision
+from simulacion import Coleccionista, SimulacionPeluqueria
+
+
+class ContadorDias(Coleccionista):
+    """Cuenta los días simulados en este proceso (los de la instancia y sus bloques)"""
+    tipos = frozenset()
+
+    def __init__(self):
+        self.dias = 0
+
+    def al_terminar_dia(self, sim, estadisticas):
+        self.dias += 1
+
+
+def test_detiene_al_alcanzar_precision():
+    """La corrida termina antes del máximo y con semianchos dentro del objetivo"""
+    print("=" * 60)
+    print("TEST: Parada por precisión")
+    print("=" * 60)
+
+    objetivo = ObjetivoPrecision(semiancho_recaudacion=25000, semiancho_prob_refrigerios=0.04)
+    resultados = {}
+    for num_procesos in (1, 2):
+        sim = SimulacionPeluqueria()
+        r = sim.simular_multiples_dias(5000, semilla=21, num_procesos=num_procesos, objetivo=objetivo)
+        resultados[num_procesos] = r
+
+        inferior, superior = r['ic_recaudacion_promedio']
+        p_inferior, p_superior = r['ic_prob_5_o_mas_refrigerios']
+        print(f"  {num_procesos} proceso(s): {r['num_dias']} días, parada por {r['criterio_parada']}")
+        assert r['criterio_parada'] == 'precision' and r['num_dias'] < 5000
+        assert (superior - inferior) / 2 <= 25000 and (p_superior - p_inferior) / 2 <= 0.04
+        # El último día simulado deja su vector de estado
+        assert len(sim.vector_estado) == r['resultados_diarios'][-1]['iteraciones']
+
+    assert resultados[1] == resultados[2]
+    print("  ✅ Se detuvo en el mismo día con 1 y 2 procesos")
+    return True
+
+
+def test_maximo_de_dias():
+    """Si la precisión no se alcanza, se simulan todos los días pedidos"""
+    print("\n" + "=" * 60)
+    print("TEST: Máximo de días")
+    print("=" * 60)
+
+    r = SimulacionPeluqueria(semilla=3).simular_multiples_dias(
+        60, objetivo=ObjetivoPrecision(semiancho_recaudacion=1))
+    print(f"  {r['num_dias']} días, parada por {r['criterio_parada']}")
+    assert r['num_dias'] == 60 and r['criterio_parada'] == 'dias'
+    print("  ✅ Se respetó el máximo de días")
+    return True
+
+
+def test_evento_raro_no_para_con_p_cero():
+    """Con un evento raro la parada usa el semiancho de Wilson y no se detiene en min_dias"""
+    print("\n" + "=" * 60)
+    print("TEST: Parada con evento raro")
+    print("=" * 60)
+
+    # P(5+ refrigerios) ≈ 2e-4 con llegadas cada 5 a 25 minutos
+    sim = SimulacionPeluqueria(tiempo_llegada_min=5, tiempo_llegada_max=25)
+    r = sim.simular_multiples_dias(2000, semilla=1, guardar_diarios=False,
+                                   objetivo=ObjetivoPrecision(semiancho_prob_refrigerios=0.01))
+    inferior, superior = r['ic_prob_5_o_mas_refrigerios']
+    print(f"  {r['num_dias']} días, parada por {r['criterio_parada']}, "
+          f"P={r['prob_5_o_mas_refrigerios']:.4f} IC 95% [{inferior:.4f}, {superior:.4f}]")
+    assert r['criterio_parada'] == 'precision' and r['num_dias'] > 150
+    assert superior > 0 and (superior - inferior) / 2 <= 0.01
+    print("  ✅ El intervalo no colapsa a P = 0 ± 0")
+    return True
+
+
+def test_tiempo_con_semilla():
+    """Con semilla (camino por bloques, el de la GUI) la parada por tiempo es puntual y no descarta días"""
+    print("\n" + "=" * 60)
+    print("TEST: Parada por tiempo con semilla maestra")
+    print("=" * 60)
+
+    for objetivo in (ObjetivoPrecision(max_segundos=0.5), ObjetivoPrecision(semiancho_recaudacion=20000)):
+        sim = SimulacionPeluqueria()
+        contador = ContadorDias()
+        sim.suscribir(contador)
+        inicio = time.perf_counter()
+        r = sim.simular_multiples_dias(20000, semilla=5, objetivo=objetivo, guardar_diarios=False)
+        segundos = time.perf_counter() - inicio
+        print(f"  {r['criterio_parada']}: {r['num_dias']} días en {segundos:.2f} s, "
+              f"{contador.dias} simulados")
+        assert contador.dias == r['num_dias']
+        if objetivo.max_segundos is not None:
+            assert r['criterio_parada'] == 'tiempo' and r['num_dias'] > 100
+            assert segundos < objetivo.max_segundos + 0.25
+    print("  ✅ Sin días simulados de más")
+    return True
+
+
+def main():
+    ok = (test_detiene_al_alcanzar_precision() and test_maximo_de_dias() and test_evento_raro_no_para_con_p_cero()
+          and test_tiempo_con_semilla())
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -94,6 +94,14 @@ def test_ui_initialization():
             print(f"  ✗ {control} NO ENCONTRADO")
             todos_ok = False
     
+    # Arranque liviano: openpyxl se importa al exportar y los tabs de resultados al mostrarse
+    print("\n✓ Verificando arranque diferido:")
+    diferido_ok = 'openpyxl' not in sys.modules and not hasattr(ventana, 'lbl_num_dias')
+    ventana.tabs.setCurrentIndex(1)
+    diferido_ok = diferido_ok and hasattr(ventana, 'lbl_num_dias') and ventana.lbl_num_dias.text() == "N/A"
+    print(f"  {'✓' if diferido_ok else '✗'} openpyxl sin importar y tab de resultados construido al mostrarse")
+    todos_ok = todos_ok and diferido_ok
+    
     if todos_ok:
         print("\n" + "=" * 60)
         print("✅ TODOS LOS CONTROLES ESTÁN PRESENTES")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test del perfil del motor (contadores por sección)
+Verifica que el perfil no altere los resultados, que cuente lo esperado y que se desinstale
+"""
+
+import contextlib
+import io
+import sys
+
+import cli_peluqueria
+from simulacion import NivelTraza, PerfilMotor, SimulacionPeluqueria, TipoEvento
+
+
+def test_perfil_mismos_resultados_y_conteos():
+    """Con perfil los resultados son idénticos y los conteos coinciden con el día simulado"""
+    print("=" * 60)
+    print("TEST: Perfil del motor")
+    print("=" * 60)
+
+    sim = SimulacionPeluqueria(nivel_traza=NivelTraza.COMPLETO, tiempo_llegada_max=4, semilla=7)
+    sin_perfil = sim.simular_dia()
+    perfil = sim.activar_perfil()
+    sim.sembrar(7)
+    con_perfil = sim.simular_dia()
+    assert sin_perfil == con_perfil
+
+    llamadas = perfil.llamadas
+    assert llamadas[TipoEvento.LLEGADA_CLIENTE.value] == con_perfil['clientes_llegados']
+    assert llamadas[TipoEvento.FIN_ATENCION.value] == con_perfil['clientes_atendidos']
+    assert sum(llamadas[tipo.value] for tipo in TipoEvento) == con_perfil['iteraciones']
+    assert llamadas['traza'] == len(sim.vector_estado) == con_perfil['iteraciones']
+    assert llamadas['rng.asignacion'] == con_perfil['clientes_llegados']
+    assert llamadas['calendario.extraer'] >= con_perfil['iteraciones']
+    resumen = perfil.resumen()
+    assert abs(sum(fila['fraccion'] for fila in resumen) - 1) < 1e-9
+    assert resumen[0]['segundos'] >= resumen[-1]['segundos']
+    print(perfil.formatear())
+
+    assert sim.desactivar_perfil() is perfil and sim.perfil is None
+    assert '_procesar_evento' not in vars(sim) and 'extraer' not in vars(sim.eventos)
+    assert 'random' not in vars(sim.rng_servicio)
+    sim.simular_dia()
+    assert llamadas['traza'] == con_perfil['iteraciones']  # Desactivado ya no cuenta
+    print("  ✓ Resultados idénticos, conteos consistentes y perfil desinstalado")
+    return True
+
+
+def test_perfil_multiples_dias():
+    """Cuenta todos los días en un proceso, también los antitéticos (que cambian los generadores)"""
+    print("=" * 60)
+    print("TEST: Perfil en simular_multiples_dias")
+    print("=" * 60)
+
+    for antiteticos in (False, True):
+        sim = SimulacionPeluqueria()
+        esperado = sim.simular_multiples_dias(20, semilla=3, antiteticos=antiteticos)
+        perfil = sim.activar_perfil()
+        resultado = sim.simular_multiples_dias(20, semilla=3, antiteticos=antiteticos)
+        assert resultado == esperado
+        llegadas = sum(dia['clientes_llegados'] for dia in resultado['resultados_diarios'])
+        assert perfil.llamadas[TipoEvento.LLEGADA_CLIENTE.value] == llegadas
+        assert perfil.llamadas['rng.asignacion'] == llegadas
+        print(f"  ✓ antitéticos={antiteticos}: {llegadas} llegadas contadas en 20 días")
+
+    errores = io.StringIO()
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(errores):
+        assert cli_peluqueria.main(['--dias', '5', '--semilla', '1', '--perfil']) == 0
+    assert errores.getvalue().startswith('sección') and 'calendario.extraer' in errores.getvalue()
+    print("  ✓ cli_peluqueria --perfil escribe la tabla en stderr")
+    return True
+
+
+def main():
+    tests = [test_perfil_mismos_resultados_y_conteos, test_perfil_multiples_dias]
+    ok = all(test() for test in tests)
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
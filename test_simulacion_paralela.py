@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test de las réplicas en paralelo de simular_multiples_dias
+Verifica que con una semilla maestra el resultado no dependa de la cantidad de procesos
+y que el pool de procesos funcione lanzado desde un hilo
+"""
+
+import sys
+import threading
+
+from simulacion import SimulacionPeluqueria, contexto_procesos
+
+
+def test_mismo_resultado_con_cualquier_cantidad_de_procesos():
+    """Los resultados diarios son idénticos con 1, 2 y 3 procesos"""
+    print("=" * 60)
+    print("TEST: Réplicas en paralelo reproducibles")
+    print("=" * 60)
+
+    resultados = {}
+    for num_procesos in (1, 2, 3):
+        sim = SimulacionPeluqueria()
+        stats = sim.simular_multiples_dias(40, semilla=123, num_procesos=num_procesos)
+        resultados[num_procesos] = stats
+        print(f"  {num_procesos} proceso(s): recaudación promedio ${stats['recaudacion_promedio']:,.2f}")
+        assert [r['dia'] for r in stats['resultados_diarios']] == list(range(1, 41))
+        # El último día se simula en la instancia y deja su vector de estado
+        assert len(sim.vector_estado) == stats['resultados_diarios'][-1]['iteraciones']
+
+    assert resultados[1] == resultados[2] == resultados[3]
+
+    # La semilla del constructor es la semilla maestra, también con un solo proceso
+    for num_procesos in (1, 2):
+        desde_constructor = SimulacionPeluqueria(semilla=123).simular_multiples_dias(40, num_procesos=num_procesos)
+        assert desde_constructor == resultados[1], num_procesos
+    print("  ✓ La semilla del constructor da el mismo resultado con 1 y 2 procesos")
+
+    otra_semilla = SimulacionPeluqueria().simular_multiples_dias(40, semilla=124)
+    assert otra_semilla['resultados_diarios'] != resultados[1]['resultados_diarios']
+    print("  ✅ Resultados idénticos para la misma semilla maestra")
+    return True
+
+
+def test_pool_desde_un_hilo():
+    """El pool se crea con 'spawn' y termina aunque se lance desde un hilo (como el QThread de la GUI)"""
+    print("\n" + "=" * 60)
+    print("TEST: Réplicas en paralelo desde un hilo")
+    print("=" * 60)
+
+    assert contexto_procesos().get_start_method() == 'spawn'
+    resultados = []
+    hilo = threading.Thread(target=lambda: resultados.append(
+        SimulacionPeluqueria().simular_multiples_dias(20, semilla=7, num_procesos=2)))
+    hilo.start()
+    hilo.join(timeout=120)
+    assert not hilo.is_alive(), "el pool quedó bloqueado"
+    assert resultados[0] == SimulacionPeluqueria().simular_multiples_dias(20, semilla=7, num_procesos=1)
+    print("  ✅ Mismo resultado que con un proceso, sin bloquearse")
+    return True
+
+
+def main():
+    ok = test_mismo_resultado_con_cualquier_cantidad_de_procesos() and test_pool_desde_un_hilo()
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
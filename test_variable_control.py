@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test del estimador con variable de control (clientes llegados)
+Verifica la esperanza de llegadas y que el intervalo ajustado sea más angosto
+"""
+
+import sys
+
+from estadisticas import CovarianzaWelford, llegadas_esperadas
+from simulacion import SimulacionPeluqueria
+
+
+def test_llegadas_esperadas():
+    """La función de renovación coincide con su aproximación asintótica y con el caso determinístico"""
+    print("=" * 60)
+    print("TEST: Esperanza de llegadas por jornada")
+    print("=" * 60)
+
+    # Para t grande: M(t) ≈ t/μ + (σ² - μ²) / (2 μ²), con U(2, 12): μ = 7, σ² = 100/12
+    esperada = llegadas_esperadas(480, 2, 12)
+    asintotica = 480 / 7 + (100 / 12 - 49) / (2 * 49)
+    print(f"  M(480) = {esperada:.5f} (asintótica {asintotica:.5f})")
+    assert abs(esperada - asintotica) < 1e-3
+    assert llegadas_esperadas(480, 5, 5) == 96
+    print("  ✅ Esperanza correcta")
+    return True
+
+
+def test_intervalo_ajustado():
+    """El IC de la recaudación con variable de control es más angosto y la combinación es exacta"""
+    print("\n" + "=" * 60)
+    print("TEST: Estimación con variable de control")
+    print("=" * 60)
+
+    r = SimulacionPeluqueria().simular_multiples_dias(500, semilla=31)
+    inferior, superior = r['ic_recaudacion_promedio']
+    inferior_vc, superior_vc = r['ic_recaudacion_promedio_vc']
+    print(f"  Recaudación: ${r['recaudacion_promedio']:,.2f} ± {(superior - inferior) / 2:,.2f}")
+    print(f"  Con control: ${r['recaudacion_promedio_vc']:,.2f} ± {(superior_vc - inferior_vc) / 2:,.2f}")
+    print(f"  Reducción de varianza: {r['reduccion_varianza_vc_recaudacion_promedio']:.2f}x")
+    assert superior_vc - inferior_vc < superior - inferior
+    assert inferior_vc <= r['recaudacion_promedio_vc'] <= superior_vc
+    assert 'prob_5_o_mas_refrigerios_vc' in r
+
+    # Combinar dos mitades equivale a acumular todo junto
+    diarios = r['resultados_diarios']
+    total, mitad_a, mitad_b = CovarianzaWelford(), CovarianzaWelford(), CovarianzaWelford()
+    for i, d in enumerate(diarios):
+        total.agregar(d['clientes_llegados'], d['recaudacion'])
+        (mitad_a if i < 200 else mitad_b).agregar(d['clientes_llegados'], d['recaudacion'])
+    mitad_a.combinar(mitad_b)
+    for a, b in zip(total.estimar_con_control(68.0), mitad_a.estimar_con_control(68.0)):
+        assert abs(a - b) <= 1e-6 * abs(a)
+    print("  ✅ Intervalo más angosto")
+    return True
+
+
+def main():
+    ok = test_llegadas_esperadas() and test_intervalo_ajustado()
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
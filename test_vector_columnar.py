@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test del vector de estado columnar
+Verifica que las filas reconstruidas sean las que lee la UI (FilaVectorEstado)
+"""
+
+import sys
+
+from simulacion import FilaVectorEstado, SimulacionPeluqueria
+
+
+def test_filas_reconstruidas():
+    """Índices, slices e iteración devuelven FilaVectorEstado consistentes"""
+    print("=" * 60)
+    print("TEST: Filas del vector columnar")
+    print("=" * 60)
+
+    sim = SimulacionPeluqueria(tiempo_llegada_min=2, tiempo_llegada_max=5, semilla=3)
+    sim.simular_dia(tiempo_max=120)
+    traza = sim.vector_estado
+
+    filas = list(traza)
+    assert all(isinstance(f, FilaVectorEstado) for f in filas)
+    assert traza[-1] == filas[-1] and traza[:3] == filas[:3] and traza[-3:] == filas[-3:]
+    assert [f.iteracion for f in filas] == list(range(1, len(filas) + 1))
+
+    for f in filas:
+        # Los RND de la fila dependen del evento procesado
+        if f.evento.startswith("Llegada"):
+            assert 'llegada' in f.rnd_evento and 'asignacion_peluquero' in f.rnd_evento
+        elif f.evento.startswith("Refrigerio"):
+            assert f.rnd_evento == {}
+        # El cliente en atención aparece en el snapshot como "En Servicio"
+        en_servicio = {f"C{c['id']}" for c in f.clientes_snapshot if c['estado'].startswith("En Servicio")}
+        ocupados = {c for c in (f.cliente_aprendiz, f.cliente_veterano_a, f.cliente_veterano_b) if c != "-"}
+        assert en_servicio == ocupados, f.iteracion
+
+    print(f"  Filas verificadas: {len(filas)} ({traza.nbytes:,} bytes en columnas)")
+    print("  ✅ Filas reconstruidas correctamente")
+    return True
+
+
+def test_filtrado_incluye_ultima_fila():
+    """El vector filtrado respeta hora j, cantidad i y siempre incluye la última fila"""
+    print("\n" + "=" * 60)
+    print("TEST: Filtrado del vector")
+    print("=" * 60)
+
+    sim = SimulacionPeluqueria(semilla=3)
+    sim.simular_dia()
+    ultima = sim.vector_estado[-1]
+
+    filas = sim.obtener_vector_estado_filtrado(hora_inicio=60, num_filas=5)
+    assert len(filas) == 6 and all(f.reloj >= 60 for f in filas) and filas[-1] == ultima
+
+    filas = sim.obtener_vector_estado_filtrado(hora_inicio=100000, num_filas=5)
+    assert filas == [ultima]
+
+    print("  ✅ Filtrado correcto")
+    return True
+
+
+def main():
+    ok = test_filas_reconstruidas() and test_filtrado_incluye_ultima_fila()
+    print("\n🎉 ¡TODOS LOS TESTS PASARON!" if ok else "\n❌ ALGUNOS TESTS FALLARON")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())